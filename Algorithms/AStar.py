@@ -1,3 +1,5 @@
+import heapq
+
 from Algorithms.Algorithm import Algorithm
 from Graphs.Graph import Graph
 from Visualizers.ConsoleVisualizer import ConsoleVisualizer
@@ -5,7 +7,8 @@ from Heuristics.BFS import BFS
 
 class AStar(Algorithm):
     """
-    A* algorithm
+    A* algorithm. The open list is a binary heap ordered by f, so each expansion only depends on the size of the
+    explored region and not on the size of the graph.
     """
 
     def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), heuristic=None):
@@ -39,14 +42,22 @@ class AStar(Algorithm):
             closed = set()
             prev = {}
 
+            # g, f and h only hold the vertices reached so far. A vertex missing from g has an infinite cost.
             h = {start_vertex: self.heuristic.calculate(start_vertex, end_vertex)}
-            g = {vertex: float("inf") if vertex != start_vertex else 0 for vertex in all_vertices}
-            f = {vertex: float("inf") if vertex != start_vertex else h[start_vertex] for vertex in all_vertices}
+            g = {start_vertex: 0}
+            f = {start_vertex: h[start_vertex]}
+
+            # Heap entries are (f, insertion order, vertex). The insertion order breaks ties without comparing
+            # vertices, and entries that are no longer open or whose f has improved since are skipped when popped.
+            open_heap = [(f[start_vertex], 0, start_vertex)]
+            pushed = 1
 
             while len(open) > 0:
+                current_f, _, current = heapq.heappop(open_heap)
+                if current not in open or current_f != f[current]:
+                    continue
+
                 self.metrics.add_explored_node()
-                open_f = {node:value for node,value in f.items() if node in open}
-                current = min(open_f, key=open_f.get)
 
                 if show_by_step:
                     self.visualizer.wait(graph=self.graph, current=current, open=open, close=closed)
@@ -61,14 +72,15 @@ class AStar(Algorithm):
                 for successor in self.graph.get_successors(current):
                     cost = self.graph.get_weight(source=current, target=successor)[0]
                     g_cost = g[current] + cost
-                    if g_cost < g[successor]:
+                    if g_cost < g.get(successor, float("inf")):
                         prev[successor] = current
                         g[successor] = g_cost
                         if successor not in h:
                             h[successor] = self.heuristic.calculate(successor, end_vertex)
                         f[successor] = g_cost + h[successor]
-                        if successor not in open:
-                            open.add(successor)
+                        open.add(successor)
+                        heapq.heappush(open_heap, (f[successor], pushed, successor))
+                        pushed += 1
 
         self.metrics.end_execution()
         if not finished and end_vertex is not None:
@@ -17,7 +17,7 @@ class Algorithm:
         :param Graph solution: output graph that will contain the result of the algorithm.
         :param Visualizer visualizer: specific Visualizer implementation to visualize the class.
         """
-        self.graph = graph.copy()
+        self.graph = graph.copy()       # Copy-on-write: the edge data is only duplicated if the graph is modified
         self.solution = Solution()
         self.visualizer = visualizer
         self.metrics = Metrics()
@@ -0,0 +1,212 @@
+import heapq
+import random
+
+import numpy as np
+
+from Algorithms.Dijkstra import Dijkstra
+from Graphs.Graph import Graph
+from Visualizers.ConsoleVisualizer import ConsoleVisualizer
+
+
+class ArcFlags:
+    """
+    Arc-flags of a graph for single-objective shortest path queries. The vertices are partitioned into regions, and
+    every edge gets one flag per region, set if the edge is on a shortest path to a vertex of that region. A search
+    towards a vertex of region r only needs to follow the edges whose flag r is set.
+
+    The flags of region r are set on the edges inside r, and on the edges of the shortest path trees, built backwards,
+    of the boundary vertices of r (the ones with an incoming edge from another region): every shortest path to a
+    vertex of r enters r for the last time through one of them. A tree keeps every edge that is on some shortest path
+    to its root, so ties between paths do not matter.
+
+    Edges are numbered as the graph returns them: the outgoing edges of every vertex, in the order of vertices, and
+    the flags are stored packed in a NumPy array with one row per edge, next to the target and weight of the edge.
+    The graph is expected not to change after the flags are computed.
+    """
+
+    def __init__(self, graph: Graph, n_regions=8, regions=None, weight_index=0, seed=0):
+        """
+        Partitions graph and computes the flags of every edge.
+        :param Graph graph: graph to preprocess.
+        :param int n_regions: number of regions the graph is partitioned into. Ignored if regions is given.
+        :param dict regions: dict mapping every vertex of the graph to its region, a number from 0 to n_regions - 1.
+        By default, the regions are grown from random vertices.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns.
+        :param int seed: seed of the random choice of the vertices the regions are grown from.
+        """
+        self.graph = graph
+        self.weight_index = weight_index
+        self.seed = seed
+
+        self.vertices = list(graph.get_all_vertices())
+        self.vertex_ids = {vertex: index for index, vertex in enumerate(self.vertices)}
+
+        # Edge table: outgoing edges of every vertex, from offsets[vertex id] to offsets[vertex id + 1]
+        out_edges = [graph.get_successor_weights(vertex) for vertex in self.vertices]
+        self.offsets = np.zeros(len(self.vertices) + 1, dtype=np.int64)
+        np.cumsum([len(edges) for edges in out_edges], out=self.offsets[1:])
+        self.sources = np.repeat(np.arange(len(self.vertices)), np.diff(self.offsets))
+        self.targets = np.array([self.vertex_ids[successor] for edges in out_edges for successor, weights in edges],
+                                dtype=np.int64)
+        self.weights = np.array([weights[weight_index] for edges in out_edges for successor, weights in edges],
+                                dtype=float)
+
+        if regions is not None:
+            self.region = np.array([regions[vertex] for vertex in self.vertices], dtype=np.int64)
+            self.n_regions = int(self.region.max()) + 1 if len(self.vertices) > 0 else 0
+        else:
+            self.n_regions = min(n_regions, len(self.vertices))
+            self.region = self._partition()
+        self.flags = self._compute_flags()
+
+    def region_of(self, vertex):
+        """
+        Returns the region of vertex, or None if it is not in the graph.
+        :param vertex:
+        :return:
+        """
+        vertex_id = self.vertex_ids.get(vertex)
+        return int(self.region[vertex_id]) if vertex_id is not None else None
+
+    def edge_flags(self, region):
+        """
+        Returns a boolean NumPy array with the flag of region of every edge.
+        :param int region:
+        :return:
+        """
+        return (self.flags[:, region // 8] >> (7 - region % 8)) & 1 == 1
+
+    def _partition(self):
+        """
+        Returns the region of every vertex. Every region is grown from a random vertex, one layer of neighbours at a
+        time, ignoring the direction of the edges, so regions are connected and of similar size. The vertices not
+        reached, in parts of the graph without any of those vertices, are added part by part to the smallest region.
+        :return:
+        """
+        neighbours = [set() for vertex in self.vertices]
+        for source_id, target_id in zip(self.sources.tolist(), self.targets.tolist()):
+            neighbours[source_id].add(target_id)
+            neighbours[target_id].add(source_id)
+
+        region = np.full(len(self.vertices), -1, dtype=np.int64)
+        frontiers = list()
+        for index, vertex_id in enumerate(random.Random(self.seed).sample(range(len(self.vertices)), self.n_regions)):
+            region[vertex_id] = index
+            frontiers.append([vertex_id])
+
+        for vertex_id in range(len(self.vertices)):
+            if region[vertex_id] < 0:
+                smallest = int(np.argmin(np.bincount(region[region >= 0], minlength=self.n_regions)))
+                region[vertex_id] = smallest
+                frontiers[smallest].append(vertex_id)
+
+            while any(len(frontier) > 0 for frontier in frontiers):
+                for index, frontier in enumerate(frontiers):
+                    next_frontier = list()
+                    for current_id in frontier:
+                        for neighbour_id in neighbours[current_id]:
+                            if region[neighbour_id] < 0:
+                                region[neighbour_id] = index
+                                next_frontier.append(neighbour_id)
+                    frontiers[index] = next_frontier
+        return region
+
+    def _compute_flags(self):
+        """
+        Returns the flags of every edge, packed in a (edges x bytes) uint8 array where bit r (from the most significant
+        bit of every byte) is the flag of region r.
+        :return:
+        """
+        flags = np.zeros((len(self.targets), self.n_regions), dtype=bool)
+        source_regions, target_regions = self.region[self.sources], self.region[self.targets]
+        inside = source_regions == target_regions
+        flags[np.flatnonzero(inside), target_regions[inside]] = True
+
+        # Incoming edges of every vertex, as lists, for the backward searches
+        in_edges = np.argsort(self.targets, kind='stable')
+        in_offsets = np.searchsorted(self.targets[in_edges], np.arange(len(self.vertices) + 1)).tolist()
+        in_sources, in_weights = self.sources[in_edges].tolist(), self.weights[in_edges].tolist()
+
+        for boundary_id in np.unique(self.targets[~inside]).tolist():
+            distances = _backward_distances(boundary_id, in_offsets, in_sources, in_weights)
+            target_distances = distances[self.targets]
+            on_tree = (distances[self.sources] == self.weights + target_distances) & (target_distances != np.inf)
+            flags[on_tree, self.region[boundary_id]] = True
+        return np.packbits(flags, axis=1)
+
+
+def _backward_distances(root_id, in_offsets, in_sources, in_weights):
+    """
+    Runs a Dijkstra search from root_id following the edges backwards, and returns the distance from every vertex to
+    root_id as a NumPy array. Unreachable vertices get infinity.
+    :param int root_id:
+    :param list in_offsets: the incoming edges of vertex v are the positions in_offsets[v] to in_offsets[v + 1].
+    :param list in_sources: source id of every incoming edge.
+    :param list in_weights: weight of every incoming edge.
+    :return:
+    """
+    dist = [float('inf')] * (len(in_offsets) - 1)
+    dist[root_id] = 0
+    heap = [(0, root_id)]
+    while len(heap) > 0:
+        current_dist, current_id = heapq.heappop(heap)
+        if current_dist > dist[current_id]:
+            continue
+        for position in range(in_offsets[current_id], in_offsets[current_id + 1]):
+            source_id = in_sources[position]
+            distance = current_dist + in_weights[position]
+            if distance < dist[source_id]:
+                dist[source_id] = distance
+                heapq.heappush(heap, (distance, source_id))
+    return np.array(dist, dtype=float)
+
+
+class ArcFlagsDijkstra(Dijkstra):
+    """
+    Dijkstra algorithm that only follows the edges whose arc-flag for the region of the end vertex is set. Computing
+    the flags takes one backward search per boundary vertex, but they can be passed to every ArcFlagsDijkstra on the
+    same graph, and then every query explores the vertices on shortest paths to the region of its end vertex, plus
+    the ones around the end vertex inside that region.
+    """
+
+    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), arc_flags=None, weight_index=0):
+        """
+        Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
+        solution is going to be added later.
+        The solution graph is created using the same parameters as the input graph, but empty.
+        :param Graph graph: input graph containing the data.
+        :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param ArcFlags arc_flags: arc-flags of graph. By default, they are computed from graph.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns. It must be the one
+        the flags were computed for.
+        """
+
+        super().__init__(graph, visualizer, weight_index)
+        self.arc_flags = arc_flags if arc_flags is not None else ArcFlags(graph, weight_index=weight_index)
+        self._flagged = None
+
+    def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
+        """
+        Runs the algorithm from start_vertex until end_vertex has been explored, or there are no more vertices to
+        explore. Without end_vertex, every edge is followed.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        region = self.arc_flags.region_of(end_vertex)
+        self._flagged = self.arc_flags.edge_flags(region).tolist() if region is not None else None
+        super().run(start_vertex, end_vertex, show_by_step, show_end)
+
+    def _get_successor_weights(self, vertex):
+        """
+        Returns the (successor, weights) pairs of the outgoing edges of vertex whose flag for the region of the end
+        vertex is set.
+        :param vertex:
+        :return:
+        """
+        successor_weights = self.graph.get_successor_weights(vertex)
+        if self._flagged is None:
+            return successor_weights
+
+        first_edge = int(self.arc_flags.offsets[self.arc_flags.vertex_ids[vertex]])
+        return [edge for position, edge in enumerate(successor_weights) if self._flagged[first_edge + position]]
@@ -1,7 +1,6 @@
-import heapq
-
 import pandas as pd
 
+from Algorithms import Dominance
 from Algorithms.Algorithm import Algorithm
 from Graphs.Graph import Graph
 from Graphs.PandasGraph import PandasGraph
@@ -9,11 +8,17 @@ from Visualizers.ConsoleVisualizer import ConsoleVisualizer
 
 
 class Heap:
+    """
+    Indexed binary heap of labels (vertex, d1, d2, ...), ordered lexicographically by (d1, d2) and by insertion order
+    on ties. It keeps at most one label per vertex and tracks the position of every vertex in the heap, so push, pop,
+    decrease_key and remove take O(log n).
+    """
+
     def __init__(self):
         self.vertex_label = dict()
-        self.cost_vertex = dict()
-        self.heap = list()
-        heapq.heapify(self.heap)
+        self.position = dict()
+        self.heap = list()      # Entries (d1, d2, counter, vertex)
+        self.counter = 0
 
     def contains_vertex(self, vertex):
         """
@@ -28,12 +33,8 @@ class Heap:
         Returns the minimun lexicographic element, by comparing cost1 and cost2.
         :return:
         """
-        key = heapq.heappop(self.heap)
-        vertex = self.cost_vertex[key][0]
-
-        self.cost_vertex[key].remove(vertex)
-        if len(self.cost_vertex[key]) == 0:
-            del self.cost_vertex[key]
+        vertex = self.heap[0][3]
+        self._delete(0)
 
         value = self.vertex_label[vertex]
         del self.vertex_label[vertex]
@@ -45,18 +46,16 @@ class Heap:
         :param elem:
         :return:
         """
-        key = (elem[1], elem[2])
         vertex = elem[0]
 
         if self.contains_vertex(vertex):
             raise ValueError(f"You cant push a vertex that is already in, you have to do a decrease-key instead. Label: {elem} is already inside.")
 
-        heapq.heappush(self.heap, key)
+        self.counter += 1
+        self.heap.append((elem[1], elem[2], self.counter, vertex))
+        self.position[vertex] = len(self.heap) - 1
         self.vertex_label[vertex] = elem
-        if key in self.cost_vertex:
-            self.cost_vertex[key].append(vertex)
-        else:
-            self.cost_vertex[key] = [vertex]
+        self._sift_up(len(self.heap) - 1)
 
     def decrease_key(self, elem):
         """
@@ -71,8 +70,12 @@ class Heap:
         if self._check_dominance(new_cost, old_cost):
             raise ValueError(f"Error, new cost:{elem} is worse than old cost:{label_to_remove}. Decrease key should only improve the label.")
 
-        self.remove(label_to_remove)
-        self.push(elem)
+        # The new cost is not dominated by the old one, but it can be lexicographically greater
+        self.counter += 1
+        index = self.position[vertex]
+        self.heap[index] = (elem[1], elem[2], self.counter, vertex)
+        self.vertex_label[vertex] = elem
+        self._sift_down(self._sift_up(index))
 
     def _check_dominance(self, costs1, costs2):
         if len(costs1) != len(costs2):
@@ -98,18 +101,10 @@ class Heap:
         :param elem:
         :return:
         """
-        key = (elem[1], elem[2])
         vertex = elem[0]
-
-        self.heap.remove(key)
-        heapq.heapify(self.heap)
-
+        self._delete(self.position[vertex])
         del self.vertex_label[vertex]
 
-        self.cost_vertex[key].remove(vertex)
-        if len(self.cost_vertex[key]) == 0:
-            del self.cost_vertex[key]
-
     def size(self):
         """
         Returns the number of elements inside the Heap
@@ -117,6 +112,60 @@ class Heap:
         """
         return len(self.heap)
 
+    def _delete(self, index):
+        """
+        Removes the entry at index, by moving the last entry into its place and restoring the heap order.
+        :param int index:
+        :return:
+        """
+        del self.position[self.heap[index][3]]
+        last = self.heap.pop()
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.position[last[3]] = index
+            self._sift_down(self._sift_up(index))
+
+    def _sift_up(self, index):
+        """
+        Moves the entry at index up until its parent is smaller. Returns its final position.
+        :param int index:
+        :return:
+        """
+        entry = self.heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if self.heap[parent] <= entry:
+                break
+            self.heap[index] = self.heap[parent]
+            self.position[self.heap[index][3]] = index
+            index = parent
+        self.heap[index] = entry
+        self.position[entry[3]] = index
+        return index
+
+    def _sift_down(self, index):
+        """
+        Moves the entry at index down until its children are greater. Returns its final position.
+        :param int index:
+        :return:
+        """
+        entry = self.heap[index]
+        size = len(self.heap)
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and self.heap[child + 1] < self.heap[child]:
+                child += 1
+            if entry <= self.heap[child]:
+                break
+            self.heap[index] = self.heap[child]
+            self.position[self.heap[index][3]] = index
+            index = child
+        self.heap[index] = entry
+        self.position[entry[3]] = index
+        return index
+
 
 class BDijkstra(Algorithm):
     """
@@ -136,7 +185,7 @@ class BDijkstra(Algorithm):
         super().__init__(graph, visualizer)
 
         # Specific Algorithm Parameters
-        self.heap, self.d1, self.d2, self.L, self.start_vertex = None, None, None, None, None
+        self.heap, self.d2, self.L, self.last_label, self.start_vertex = None, None, None, None, None
 
     def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
         """
@@ -159,18 +208,19 @@ class BDijkstra(Algorithm):
             self.start_vertex = start_vertex
             self.heap = Heap()
             self.L = {vertex: list() for vertex in all_vertices}
-            self.d1 = {vertex: float('inf') if vertex != start_vertex else 0 for vertex in all_vertices}
-            self.d2 = {vertex: float('inf') if vertex != start_vertex else 0 for vertex in all_vertices}
+            self.d2 = {vertex: float('inf') for vertex in all_vertices}
+            self.last_label = dict()
 
-            ls = (start_vertex, self.d1[start_vertex], self.d2[start_vertex], None)
+            # A label is (vertex, cost 1, cost 2, parent label, weight of the edge from the parent label's vertex)
+            ls = (start_vertex, 0, 0, None, None)
             self.heap.push(ls)
 
             while self.heap.size() > 0:
                 self.metrics.add_explored_node()
                 l_star = self.heap.pop()
                 i = l_star[0]
-                self.L[i].append(l_star)
-                self.L[i] = self._get_nd_subset(self.L[i])
+                self.L[i].append(l_star)     # Labels are extracted in lexicographic order, so L[i] stays sorted
+                self.d2[i] = l_star[2]
 
                 if show_by_step:
                     self.visualizer.wait(graph=self.graph, current=i, open=self.heap.vertex_label.keys(),
@@ -179,8 +229,6 @@ class BDijkstra(Algorithm):
                 lnew = self.new_candidate_label(i, l_star)
                 if lnew is not None:
                     self.heap.push(lnew)
-                    self.d1[i] = lnew[1]
-                    self.d2[i] = lnew[2]
                 self.relaxation_process(i, l_star)
 
             end_vertex = all_vertices if end_vertex is None else [end_vertex]
@@ -202,39 +250,51 @@ class BDijkstra(Algorithm):
             self.visualizer.show(graph=self.solution.get_all_solutions())
 
     def new_candidate_label(self, vertex, l_star):
+        """
+        Returns the lexicographically smallest label of vertex, obtained by extending a label of one of its
+        predecessors, that is not dominated by the labels of vertex, or None if there is none.
+        A label is dominated if its second cost is not lower than d2[vertex], the second cost of the last label of
+        vertex. last_label keeps, for every edge, the first label of the predecessor that has not been dominated yet,
+        so each label of the predecessor is skipped at most once.
+        :param vertex:
+        :param l_star: label of vertex that has just been extracted from the heap.
+        :return:
+        """
+        best = None
         for predecessor in self.graph.get_predecessors(vertex):
             c1, c2 = self.graph.get_weight(predecessor, vertex)
-            for l in self.L[predecessor]:
-                check_label = (vertex, l[1] + c1, l[2] + c2, predecessor)
-                if not self.is_dominated((check_label[1], check_label[2]), (l_star[1], l_star[2])) \
-                        and check_label != l_star and check_label not in self.L[vertex]: # New label is not dominated by current label
-                    return check_label
-
-        return None
+            labels = self.L[predecessor]
+            index = self.last_label.get((predecessor, vertex), 0)
+            while index < len(labels) and labels[index][2] + c2 >= self.d2[vertex]:
+                index += 1
+            self.last_label[(predecessor, vertex)] = index
+
+            if index < len(labels):
+                check_label = (vertex, labels[index][1] + c1, labels[index][2] + c2, labels[index], [c1, c2])
+                if best is None or (check_label[1], check_label[2]) < (best[1], best[2]):
+                    best = check_label
+        return best
 
     def relaxation_process(self, vertex, l_star):
+        """
+        Extends l_star to the successors of vertex. The new label of a successor is added to the heap if it is not
+        dominated by its labels, and it is lexicographically smaller than the label of the successor in the heap.
+        :param vertex:
+        :param l_star: label of vertex that has just been extracted from the heap.
+        :return:
+        """
         for successor in self.graph.get_successors(vertex):
             c1, c2 = self.graph.get_weight(vertex, successor)
-            new_cost = (l_star[1] + c1, l_star[2] + c2)
-            if not self.is_dominated(new_cost, (self.d1[successor], self.d2[successor])):
-                relaxation = len(self.L[successor]) == 0
-                if not relaxation:
-                    for label in self.L[successor]:
-                        if (l_star[1] + c1) > label[1] and (l_star[2] + c2) < label[2]:
-                            relaxation = True
-
-                if relaxation:
-                    # non dominated label
-                    self.d1[successor] = l_star[1] + c1
-                    self.d2[successor] = l_star[2] + c2
-                    lnew = (successor, self.d1[successor], self.d2[successor], vertex)
-                    if not self.heap.contains_vertex(lnew[0]):
-                        self.heap.push(lnew)
-                    else:
-                        new_cost = (lnew[1], lnew[2])
-                        label_to_replace = self.heap.vertex_label[lnew[0]]
-                        if not self.is_dominated(new_cost, (label_to_replace[1], label_to_replace[2])):
-                            self.heap.decrease_key(lnew)
+            lnew = (successor, l_star[1] + c1, l_star[2] + c2, l_star, [c1, c2])
+            if lnew[2] >= self.d2[successor]:
+                continue    # Dominated by the last label of successor
+
+            if not self.heap.contains_vertex(successor):
+                self.heap.push(lnew)
+            else:
+                label_to_replace = self.heap.vertex_label[successor]
+                if (lnew[1], lnew[2]) < (label_to_replace[1], label_to_replace[2]):
+                    self.heap.decrease_key(lnew)
 
     def is_dominated(self, costs1, costs2):
         """
@@ -243,76 +303,18 @@ class BDijkstra(Algorithm):
         :param tuple or list costs2:
         :return:
         """
-        # Edge case: one or both of them is Infinity
-        if (isinstance(costs1, tuple) or isinstance(costs1, list)) and costs2 == float('inf'):
-            return False
-        elif (isinstance(costs2, tuple) or isinstance(costs2, list)) and costs1 == float('inf'):
-            return True
-        elif costs1 == float('inf') and costs2 == float('inf'):
-            return False
-        elif len(costs2) == 0:
-            return False
-        elif len(costs1) == 0:
-            return True
-
-        if not isinstance(costs1, list):
-            costs1 = [costs1]
-        if not isinstance(costs2, list):
-            costs2 = [costs2]
-
-        for sublist2 in costs2:
-            dominance = True
-            for sublist1 in costs1:
-                check_dm = self._check_dominance(sublist1, sublist2)
-                if not check_dm:
-                    dominance = False
-            if dominance:
-                return True
-        return False
-
-    def _check_dominance(self, costs1, costs2):
-        if len(costs1) != len(costs2):
-            raise ValueError(f"Error, both costs must have the same size, but cost1:{costs1} and cost2:{costs2} have different sizes")
-
-        as_good = True
-        is_better = False
-
-        c1, t1 = costs1[0], costs1[1]
-        c2, t2 = costs2[0], costs2[1]
-        if c2 > c1 or t2 > t1:
-            as_good = False  # List2 is worse than List1
-
-        if c2 < c1 or t2 < t1:
-            is_better = True  # List2 is better than Cost1
-
-        return as_good and is_better
-
-    def _get_nd_subset(self, elements):
-        costs = [(elem[1], elem[2]) for elem in elements]
-        subset = list()
-        for elem in elements:
-            if not self.is_dominated((elem[1], elem[2]), costs):
-                subset.append(elem)
-        return subset
-
-    def _substract_costs(self, list1, list2):
-        if len(list1) != len(list2):
-            raise ValueError(f"Cant substract {list1} and {list2} as they have different sizes.")
-
-        res = list()
-        for c1, c2 in zip(list1, list2):
-            res.append(c1-c2)
-        return tuple(res)
+        return Dominance.is_dominated(costs1, costs2)
 
     def _backtrack_sol(self, label, solution_path):
-        vertex = label[0]
-        my_cost = (label[1], label[2])
-        predecessor = label[3]
-        weight = self.graph.get_weight(predecessor, vertex)
-        for elem in self.L[predecessor]:
-            predecessor_cost = (elem[1], elem[2])
-            if self._substract_costs(my_cost, weight) == predecessor_cost:
-                solution_path.add_edge(predecessor, vertex, weights=weight)
-                if predecessor != self.start_vertex:
-                    self._backtrack_sol(elem, solution_path)
-                return
+        """
+        Adds to solution_path the edges of the path of label, following the parent labels back to the start vertex.
+        :param tuple label:
+        :param Graph solution_path:
+        :return:
+        """
+        edges = list()
+        while label[3] is not None:
+            parent = label[3]
+            edges.append((parent[0], label[0], label[4]))
+            label = parent
+        solution_path.add_edges(edges)
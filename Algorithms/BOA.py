@@ -0,0 +1,148 @@
+import heapq
+
+import pandas as pd
+
+from Algorithms import Dominance
+from Algorithms.Algorithm import Algorithm
+from Graphs.Graph import Graph
+from Graphs.PandasGraph import PandasGraph
+from Visualizers.ConsoleVisualizer import ConsoleVisualizer
+
+
+class BOA(Algorithm):
+    """
+    BOA* algorithm (Bi-Objective A*). Labels are extracted from open in lexicographic order of their estimated costs,
+    so a label is dominated if and only if its second cost is not lower than the lowest second cost of the labels
+    already extracted at its vertex (g2_min), or if its estimated costs are dominated by the last solution found.
+    Every dominance check is a constant number of comparisons.
+    The heuristic must be consistent (for example IdealPoint) for the result to be the Pareto front.
+    """
+
+    def __init__(self, graph: Graph, heuristic, visualizer=ConsoleVisualizer()):
+        """
+        Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
+        solution is going to be added later.
+        The solution graph is created using the same parameters as the input graph, but empty.
+        :param Graph graph: input graph containing the data. Only its first two weight columns are used.
+        :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param heuristic: heuristic function to be used.
+        """
+
+        super().__init__(graph, visualizer)
+        self.heuristic = heuristic
+
+    def run(self, start_vertex, end_vertices=None, show_by_step=False, show_end=False):
+        """
+        Runs the algorithm from start_vertex until there are no more labels to explore. The solution contains one path
+        for every cost of the Pareto front and end vertex where it was found.
+
+        Open is a heap of (f1, f2, counter, label), where a label is (vertex, g1, g2, parent label, weight of the edge
+        from the parent label's vertex). The last solution found bounds the labels of every end vertex, so the result
+        is the Pareto front of the paths to any of them.
+        :param str start_vertex:
+        :param str or list end_vertices:
+        :return:
+        """
+        solution_template = PandasGraph(
+            data=pd.DataFrame(),
+            source_col=self.graph.source_col,
+            target_col=self.graph.target_col,
+            weight_cols=self.graph.weight_cols,
+            bidirectional=self.graph.bidirectional
+        )
+
+        if not isinstance(end_vertices, list):
+            end_vertices = [end_vertices]
+
+        all_vertices = self.graph.get_all_vertices()
+        finished = False
+        if start_vertex in all_vertices and len([elem for elem in end_vertices if elem in all_vertices]) != 0 \
+                and end_vertices != [start_vertex]:
+            goals = set(end_vertices)
+            h, g2_min = dict(), dict()
+            last_solution = (float('inf'), float('inf'))
+            solutions = list()
+            open, counter = list(), 0
+
+            h1, h2 = self._get_heuristic(start_vertex, h)
+            heapq.heappush(open, (h1, h2, counter, (start_vertex, 0, 0, None, None)))
+
+            while len(open) > 0:
+                self.metrics.add_explored_node()
+                f1, f2, _, label = heapq.heappop(open)
+                vertex, g1, g2 = label[0], label[1], label[2]
+                if g2 >= g2_min.get(vertex, float('inf')) or self._is_bounded(f1, f2, last_solution):
+                    continue    # Dominated by a label extracted before, or by a solution
+                g2_min[vertex] = g2
+
+                if show_by_step:
+                    self.visualizer.wait(graph=self.graph, current=vertex, open={elem[3][0] for elem in open},
+                                         close=g2_min.keys())
+
+                if vertex in goals and vertex != start_vertex:  # Solution Recording
+                    last_solution = (g1, g2)
+                    solutions.append(label)
+                    continue
+
+                for successor, weight in self.graph.get_successor_weights(vertex):
+                    successor_g1, successor_g2 = g1 + weight[0], g2 + weight[1]
+                    if successor_g2 >= g2_min.get(successor, float('inf')):
+                        continue
+                    h1, h2 = self._get_heuristic(successor, h)
+                    if self._is_bounded(successor_g1 + h1, successor_g2 + h2, last_solution):
+                        continue
+                    counter += 1
+                    heapq.heappush(open, (successor_g1 + h1, successor_g2 + h2, counter,
+                                          (successor, successor_g1, successor_g2, label, weight)))
+
+            for label in solutions:
+                solution_path = solution_template.copy()
+                self._backtrack_sol(label, solution_path)
+                self.solution.add_solution(label[0], solution_path)
+            finished = True
+
+        self.metrics.end_execution()
+        if not finished and end_vertices is not None:
+            print(f'Warning, could not find a path from {start_vertex} to {end_vertices}')
+
+        if show_end:
+            self.visualizer.show(graph=self.graph)
+            self.visualizer.show(graph=self.solution.get_all_solutions())
+
+    def _is_bounded(self, f1, f2, last_solution):
+        """
+        Returns True if a label with estimated costs (f1, f2) can not reach a solution that is not dominated by the last
+        solution found. An estimate equal to the last solution is kept, as it may reach another end vertex.
+        :param f1:
+        :param f2:
+        :param tuple last_solution: costs of the last solution found, or infinity if there is none.
+        :return:
+        """
+        return f2 == float('inf') or f2 > last_solution[1] or (f2 == last_solution[1] and f1 > last_solution[0])
+
+    def _get_heuristic(self, vertex, h):
+        """
+        Returns the heuristic of vertex for the two objectives, calculating it once and storing it in h. If the
+        heuristic returns several cost vectors, their minimum is used in every objective.
+        :param vertex:
+        :param dict h: heuristic of every vertex already calculated.
+        :return:
+        """
+        if vertex not in h:
+            estimates = Dominance.as_vectors(self.heuristic.calculate(vertex))
+            h[vertex] = (min(estimate[0] for estimate in estimates), min(estimate[1] for estimate in estimates))
+        return h[vertex]
+
+    def _backtrack_sol(self, label, solution_path):
+        """
+        Adds to solution_path the edges of the path of label, following the parent labels back to the start vertex.
+        :param tuple label:
+        :param Graph solution_path:
+        :return:
+        """
+        edges = list()
+        while label[3] is not None:
+            parent = label[3]
+            edges.append((parent[0], label[0], label[4]))
+            label = parent
+        solution_path.add_edges(edges)
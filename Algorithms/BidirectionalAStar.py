@@ -0,0 +1,67 @@
+from Algorithms.BidirectionalDijkstra import BidirectionalDijkstra
+from Graphs.Graph import Graph
+from Visualizers.ConsoleVisualizer import ConsoleVisualizer
+from Heuristics.BFS import BFS
+
+
+class BidirectionalAStar(BidirectionalDijkstra):
+    """
+    Bidirectional A* algorithm. The forward search is guided by a heuristic of the distance to the end vertex, and the
+    backward search by a heuristic of the inverse graph, which estimates the distance from the start vertex. Both
+    searches use the average of the two estimates as potential (p = (h_forward - h_backward) / 2 for the forward search
+    and -p for the backward one), so the searches are consistent with each other and the path found is a shortest path
+    as long as both heuristics are consistent.
+    """
+
+    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), heuristic=None, backward_heuristic=None,
+                 weight_index=0):
+        """
+        Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
+        solution is going to be added later.
+        The solution graph is created using the same parameters as the input graph, but empty.
+        :param Graph graph: input graph containing the data.
+        :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param heuristic: heuristic function to be used by the forward search, called as calculate(vertex, end_vertex).
+        By default: BFS Heuristic.
+        :param backward_heuristic: heuristic function of the inverse graph to be used by the backward search, called as
+        calculate(vertex, start_vertex). By default: BFS Heuristic on the inverse graph.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns.
+        """
+
+        super().__init__(graph, visualizer, weight_index)
+        self.heuristic = heuristic if heuristic is not None else BFS(graph)
+        if backward_heuristic is None:
+            backward_heuristic = BFS(graph.get_inverse_graph())
+        self.backward_heuristic = backward_heuristic
+        self._potentials = dict()
+
+    def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
+        """
+        Runs the algorithm until the shortest path from start_vertex to end_vertex is found, or one of the searches has
+        no more vertices to explore.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        self._potentials = dict()
+        super().run(start_vertex, end_vertex, show_by_step, show_end)
+
+    def _get_key(self, direction, distance, vertex, start_vertex, end_vertex):
+        """
+        Returns the distance plus the potential of vertex for the search in direction. The potential of every vertex
+        is calculated once per run.
+        :return: the key, or infinity if a heuristic is infinite, as vertex can not be in a path from start_vertex to
+        end_vertex.
+        """
+        if vertex not in self._potentials:
+            forward_estimate = self.heuristic.calculate(vertex, end_vertex)
+            backward_estimate = self.backward_heuristic.calculate(vertex, start_vertex)
+            if forward_estimate == float("inf") or backward_estimate == float("inf"):
+                self._potentials[vertex] = None
+            else:
+                self._potentials[vertex] = (forward_estimate - backward_estimate) / 2
+
+        potential = self._potentials[vertex]
+        if potential is None:
+            return float("inf")
+        return distance + potential if direction == 0 else distance - potential
@@ -0,0 +1,151 @@
+import heapq
+
+import pandas as pd
+
+from Algorithms.Algorithm import Algorithm
+from Graphs.Graph import Graph
+from Graphs.PandasGraph import PandasGraph
+from Visualizers.ConsoleVisualizer import ConsoleVisualizer
+
+
+class BidirectionalDijkstra(Algorithm):
+    """
+    Bidirectional Dijkstra algorithm. A forward search from the start vertex and a backward search from the end vertex,
+    which follows the edges of the graph backwards as if it searched the inverse graph, are run alternately. Every
+    time an edge reaches a vertex already labelled by the other search, the length of the path through it is kept if it
+    is the shortest found so far (mu). The search stops once the sum of the keys (distances, for Dijkstra) on top of
+    both heaps is not lower than mu, as no shorter path can be found after that.
+    """
+
+    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), weight_index=0):
+        """
+        Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
+        solution is going to be added later.
+        The solution graph is created using the same parameters as the input graph, but empty.
+        :param Graph graph: input graph containing the data.
+        :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns. The solution keeps
+        every weight of its edges.
+        """
+
+        super().__init__(graph, visualizer)
+        self.weight_index = weight_index
+
+    def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
+        """
+        Runs the algorithm until the shortest path from start_vertex to end_vertex is found, or one of the searches has
+        no more vertices to explore.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        finished = False
+
+        # A path needs an edge leaving start_vertex and one reaching end_vertex, which also checks both are in the graph
+        if start_vertex != end_vertex and len(self.graph.get_successor_weights(start_vertex)) > 0 and \
+                len(self.graph.get_predecessor_weights(end_vertex)) > 0:
+            # One entry per direction: distances, predecessors (the next vertex for the backward search), the weights of
+            # the edges to them, the explored vertices and the heap of (key, insertion order, vertex, distance) entries.
+            dist = ({start_vertex: 0}, {end_vertex: 0})
+            prev, prev_cost = (dict(), dict()), (dict(), dict())
+            explored_vertices = (set(), set())
+            heaps = (list(), list())
+            pushed = 0
+            for direction, vertex in enumerate((start_vertex, end_vertex)):
+                key = self._get_key(direction, 0, vertex, start_vertex, end_vertex)
+                if key != float("inf"):
+                    heaps[direction].append((key, pushed, vertex, 0))
+                    pushed += 1
+
+            best_distance, meeting_vertex = float("inf"), None
+            while len(heaps[0]) > 0 and len(heaps[1]) > 0 and heaps[0][0][0] + heaps[1][0][0] < best_distance:
+                # Expand the search with fewer vertices waiting, so both of them grow at a similar pace
+                direction = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+                _, _, current_vertex, current_dist = heapq.heappop(heaps[direction])
+                if current_vertex in explored_vertices[direction] or current_dist > dist[direction][current_vertex]:
+                    continue
+
+                self.metrics.add_explored_node()
+                if direction == 0:
+                    neighbour_weights = self.graph.get_successor_weights(current_vertex)
+                else:
+                    neighbour_weights = self.graph.get_predecessor_weights(current_vertex)
+                if show_by_step:
+                    neighbours = [neighbour for neighbour, weight in neighbour_weights]
+                    self.visualizer.wait(graph=self.graph, current=current_vertex, open=neighbours,
+                                         close=explored_vertices[0] | explored_vertices[1])
+                explored_vertices[direction].add(current_vertex)
+
+                for neighbour, weight in neighbour_weights:
+                    distance = current_dist + weight[self.weight_index]
+                    if distance < dist[direction].get(neighbour, float("inf")):
+                        key = self._get_key(direction, distance, neighbour, start_vertex, end_vertex)
+                        if key == float("inf"):
+                            continue    # The neighbour can not be in a path from start_vertex to end_vertex
+                        dist[direction][neighbour] = distance
+                        prev[direction][neighbour] = current_vertex
+                        prev_cost[direction][neighbour] = weight
+                        heapq.heappush(heaps[direction], (key, pushed, neighbour, distance))
+                        pushed += 1
+
+                    # Update the shortest path found, if the other search has reached the neighbour
+                    if neighbour in dist[1 - direction] and \
+                            dist[direction][neighbour] + dist[1 - direction][neighbour] < best_distance:
+                        best_distance = dist[direction][neighbour] + dist[1 - direction][neighbour]
+                        meeting_vertex = neighbour
+
+            if meeting_vertex is not None:
+                self.solution.add_solution(end_vertex, self._build_path(start_vertex, end_vertex, meeting_vertex,
+                                                                        prev, prev_cost))
+                finished = True
+
+        self.metrics.end_execution()
+        if not finished and end_vertex is not None:
+            print(f'Warning, could not find a path to {end_vertex}')
+
+        if show_end:
+            self.visualizer.show(graph=self.graph)
+            self.visualizer.show(graph=self.solution.get_all_solutions())
+
+    def _get_key(self, direction, distance, vertex, start_vertex, end_vertex):
+        """
+        Returns the key of vertex in the heap of the forward (direction 0) or the backward (direction 1) search, which
+        is its distance plus its potential. The potential of the backward search is the opposite of the forward one, so
+        the search can stop once the sum of the keys on top of both heaps is not lower than the shortest path found.
+        Dijkstra has no potential, so the key is the distance.
+        :param int direction:
+        :param distance: distance from start_vertex, or to end_vertex for the backward search.
+        :param vertex:
+        :param start_vertex:
+        :param end_vertex:
+        :return: the key, or infinity if vertex can not be in a path from start_vertex to end_vertex.
+        """
+        return distance
+
+    def _build_path(self, start_vertex, end_vertex, meeting_vertex, prev, prev_cost):
+        """
+        Returns the path from start_vertex to end_vertex through meeting_vertex, with its edges from the end vertex to
+        the start vertex, as in PandasGraph.get_path_informed.
+        :param start_vertex:
+        :param end_vertex:
+        :param meeting_vertex: vertex where the forward and the backward searches meet.
+        :param tuple prev: predecessors of the forward search and next vertices of the backward search.
+        :param tuple prev_cost: weights of the edges to the vertices in prev.
+        :return:
+        """
+        backward_edges = list()
+        vertex = meeting_vertex
+        while vertex != end_vertex:
+            backward_edges.append((vertex, prev[1][vertex], prev_cost[1][vertex]))
+            vertex = prev[1][vertex]
+
+        edges = backward_edges[::-1]
+        vertex = meeting_vertex
+        while vertex != start_vertex:
+            edges.append((prev[0][vertex], vertex, prev_cost[0][vertex]))
+            vertex = prev[0][vertex]
+
+        path = PandasGraph(pd.DataFrame(), source_col=self.graph.source_col, target_col=self.graph.target_col,
+                           weight_cols=self.graph.weight_cols, bidirectional=False)
+        path.add_edges(edges)
+        return path
@@ -0,0 +1,307 @@
+import heapq
+
+import pandas as pd
+
+from Algorithms.Algorithm import Algorithm
+from Graphs.Graph import Graph
+from Graphs.PandasGraph import PandasGraph
+from Visualizers.ConsoleVisualizer import ConsoleVisualizer
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy of a graph for single-objective shortest path queries. Vertices are contracted one by one,
+    in the order given by their edge difference (shortcuts added minus edges removed by contracting them), plus the
+    number of neighbours already contracted and their depth in the hierarchy, so the contraction spreads over the
+    graph and the hierarchy stays shallow. Contracting a vertex v removes it from the remaining graph, and adds a
+    shortcut u -> w for every pair of neighbours whose shortest path goes through v, unless a local witness search
+    finds another path that is not longer.
+
+    Every edge of the graph plus shortcuts goes from a vertex to a vertex contracted later (upward) or earlier
+    (downward). The upward edges leaving every vertex form the search graph of the forward query, and the downward
+    edges reaching every vertex, followed backwards, the one of the backward query. Both only go up the hierarchy, so
+    queries explore a few vertices. Every shortcut keeps the vertex it skips, so paths are unpacked into the edges of
+    the graph.
+
+    The graph is expected not to change after the hierarchy is built.
+    """
+
+    def __init__(self, graph: Graph, weight_index=0, witness_limit=50):
+        """
+        Builds the hierarchy of graph.
+        :param Graph graph: graph to preprocess.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns.
+        :param int witness_limit: maximum number of vertices explored by every witness search. Lower limits make the
+        preprocessing faster, but may add shortcuts that are not needed.
+        """
+        self.graph = graph
+        self.weight_index = weight_index
+        self.witness_limit = witness_limit
+
+        self.vertices = list(graph.get_all_vertices())
+        self.vertex_ids = {vertex: index for index, vertex in enumerate(self.vertices)}
+        self.rank = [0] * len(self.vertices)
+        self.upward = [list() for vertex in self.vertices]      # (target id, weight) of the upward edges of a vertex
+        self.downward = [list() for vertex in self.vertices]    # (source id, weight) of the downward edges reaching it
+        self.shortcuts = dict()     # (source id, target id) of every shortcut -> id of the vertex it skips
+        self.edge_weights = dict()  # (source id, target id) of every edge of the graph -> weights of the shortest one
+        self._contract()
+
+    def _contract(self):
+        """
+        Contracts every vertex, always choosing the one with the lowest edge difference. The priorities of the
+        vertices change as their neighbours are contracted, so the priority of the vertex on top of the queue is
+        recomputed before contracting it, and it is pushed back if it is no longer the lowest one.
+        :return:
+        """
+        successors = [dict() for vertex in self.vertices]     # Remaining graph, with the lowest weight per pair
+        predecessors = [dict() for vertex in self.vertices]
+        for vertex, vertex_id in self.vertex_ids.items():
+            for successor, weights in self.graph.get_successor_weights(vertex):
+                successor_id = self.vertex_ids[successor]
+                weight = weights[self.weight_index]
+                if successor_id != vertex_id and weight < successors[vertex_id].get(successor_id, float('inf')):
+                    successors[vertex_id][successor_id] = predecessors[successor_id][vertex_id] = weight
+                    self.edge_weights[(vertex_id, successor_id)] = tuple(weights)
+
+        contracted_neighbours, levels = [0] * len(self.vertices), [0] * len(self.vertices)
+        queue = [(self._priority(vertex_id, successors, predecessors, contracted_neighbours, levels), vertex_id)
+                 for vertex_id in range(len(self.vertices))]
+        heapq.heapify(queue)
+
+        contracted = 0
+        while len(queue) > 0:
+            _, vertex_id = heapq.heappop(queue)
+            priority = self._priority(vertex_id, successors, predecessors, contracted_neighbours, levels)
+            if len(queue) > 0 and priority > queue[0][0]:
+                heapq.heappush(queue, (priority, vertex_id))
+                continue
+
+            self.rank[vertex_id] = contracted
+            contracted += 1
+            self.upward[vertex_id] = list(successors[vertex_id].items())
+            self.downward[vertex_id] = list(predecessors[vertex_id].items())
+
+            for source_id, target_id, weight in self._find_shortcuts(vertex_id, successors, predecessors):
+                if weight < successors[source_id].get(target_id, float('inf')):
+                    successors[source_id][target_id] = predecessors[target_id][source_id] = weight
+                    self.shortcuts[(source_id, target_id)] = vertex_id
+
+            neighbours = set(successors[vertex_id]) | set(predecessors[vertex_id])
+            for successor_id in successors[vertex_id]:
+                del predecessors[successor_id][vertex_id]
+            for predecessor_id in predecessors[vertex_id]:
+                del successors[predecessor_id][vertex_id]
+            successors[vertex_id], predecessors[vertex_id] = dict(), dict()
+            for neighbour_id in neighbours:
+                contracted_neighbours[neighbour_id] += 1
+                levels[neighbour_id] = max(levels[neighbour_id], levels[vertex_id] + 1)
+
+    def _priority(self, vertex_id, successors, predecessors, contracted_neighbours, levels):
+        """
+        Returns the edge difference of contracting vertex_id in the remaining graph, plus its number of contracted
+        neighbours and its level (one more than the highest level of those neighbours).
+        :return:
+        """
+        shortcuts = self._find_shortcuts(vertex_id, successors, predecessors)
+        edges = len(successors[vertex_id]) + len(predecessors[vertex_id])
+        return len(shortcuts) - edges + contracted_neighbours[vertex_id] + levels[vertex_id]
+
+    def _find_shortcuts(self, vertex_id, successors, predecessors):
+        """
+        Returns the (source id, target id, weight) shortcuts needed to contract vertex_id: one for every predecessor u
+        and successor w such that the witness search from u, which avoids vertex_id, does not find a path to w that is
+        not longer than the one through vertex_id.
+        :return:
+        """
+        shortcuts = list()
+        for source_id, source_weight in predecessors[vertex_id].items():
+            targets = {target_id: source_weight + target_weight
+                       for target_id, target_weight in successors[vertex_id].items() if target_id != source_id}
+            if len(targets) == 0:
+                continue
+
+            dist = self._witness_search(source_id, vertex_id, max(targets.values()), successors)
+            for target_id, weight in targets.items():
+                if dist.get(target_id, float('inf')) > weight:
+                    shortcuts.append((source_id, target_id, weight))
+        return shortcuts
+
+    def _witness_search(self, source_id, vertex_id, max_distance, successors):
+        """
+        Runs a Dijkstra search from source_id in the remaining graph without vertex_id, which explores at most
+        witness_limit vertices and no vertex farther than max_distance, and returns the distances found.
+        :return:
+        """
+        dist = {source_id: 0}
+        heap = [(0, source_id)]
+        explored = 0
+        while len(heap) > 0 and explored < self.witness_limit:
+            current_dist, current_id = heapq.heappop(heap)
+            if current_dist > dist[current_id]:
+                continue
+            if current_dist > max_distance:
+                break
+            explored += 1
+
+            for successor_id, weight in successors[current_id].items():
+                distance = current_dist + weight
+                if successor_id != vertex_id and distance < dist.get(successor_id, float('inf')):
+                    dist[successor_id] = distance
+                    heapq.heappush(heap, (distance, successor_id))
+        return dist
+
+    def query(self, start_vertex, end_vertex):
+        """
+        Returns the distance and the shortest path from start_vertex to end_vertex, as a list of
+        (source, target, weights) edges of the graph from the end vertex to the start vertex, and the number of
+        vertices explored. The distance is infinity, and the path None, if there is no path.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        start_id, end_id = self.vertex_ids[start_vertex], self.vertex_ids[end_vertex]
+
+        # One entry per direction: distances, the vertex each vertex was reached from, explored vertices and heaps
+        dist = ({start_id: 0}, {end_id: 0})
+        parents = (dict(), dict())
+        explored_vertices = (set(), set())
+        heaps = ([(0, start_id)], [(0, end_id)])
+        search_graphs = (self.upward, self.downward)
+
+        best_distance, meeting_id = (0, start_id) if start_id == end_id else (float('inf'), None)
+        while any(len(heap) > 0 and heap[0][0] < best_distance for heap in heaps):
+            # Both searches only go up the hierarchy, so each of them runs until its lowest key reaches best_distance
+            direction = 0 if len(heaps[0]) > 0 and heaps[0][0][0] < best_distance else 1
+            current_dist, current_id = heapq.heappop(heaps[direction])
+            if current_id in explored_vertices[direction] or current_dist > dist[direction][current_id]:
+                continue
+            explored_vertices[direction].add(current_id)
+
+            if current_id in dist[1 - direction] and current_dist + dist[1 - direction][current_id] < best_distance:
+                best_distance = current_dist + dist[1 - direction][current_id]
+                meeting_id = current_id
+
+            # Stall on demand: if a vertex above current_id reaches it with a shorter distance, current_id is not on
+            # a shortest path, so there is no need to go further up from it
+            if any(dist[direction].get(neighbour_id, float('inf')) + weight < current_dist
+                   for neighbour_id, weight in search_graphs[1 - direction][current_id]):
+                continue
+
+            for neighbour_id, weight in search_graphs[direction][current_id]:
+                distance = current_dist + weight
+                if distance < dist[direction].get(neighbour_id, float('inf')):
+                    dist[direction][neighbour_id] = distance
+                    parents[direction][neighbour_id] = current_id
+                    heapq.heappush(heaps[direction], (distance, neighbour_id))
+
+        explored = len(explored_vertices[0]) + len(explored_vertices[1])
+        if meeting_id is None:
+            return float('inf'), None, explored
+
+        hierarchy_edges = list()
+        vertex_id = meeting_id
+        while vertex_id != end_id:
+            hierarchy_edges.append((vertex_id, parents[1][vertex_id]))
+            vertex_id = parents[1][vertex_id]
+        hierarchy_edges.reverse()
+        vertex_id = meeting_id
+        while vertex_id != start_id:
+            hierarchy_edges.append((parents[0][vertex_id], vertex_id))
+            vertex_id = parents[0][vertex_id]
+
+        return best_distance, self.unpack_path(hierarchy_edges), explored
+
+    def unpack_path(self, hierarchy_edges):
+        """
+        Returns the (source, target, weights) edges of the graph of a path of the hierarchy, from the last one to the
+        first one. The path may go through a vertex twice if the graph has cycles of weight 0, so those cycles are
+        removed.
+        :param list hierarchy_edges: (source id, target id) edges of the hierarchy, from the last one to the first one.
+        :return:
+        """
+        path, reached_at = list(), dict()    # Edges from the first one, and length of path when every vertex was reached
+        for source_id, target_id in reversed(hierarchy_edges):
+            for edge in reversed(self.unpack(source_id, target_id)):
+                reached_at.setdefault(edge[0], 0)
+                if edge[1] in reached_at:     # Cycle back to a vertex already in the path
+                    length = reached_at[edge[1]]
+                    del path[length:]
+                    reached_at = {vertex: index for vertex, index in reached_at.items() if index <= length}
+                else:
+                    path.append(edge)
+                    reached_at[edge[1]] = len(path)
+        path.reverse()
+        return path
+
+    def unpack(self, source_id, target_id):
+        """
+        Returns the (source, target, weights) edges of the graph skipped by the edge source_id -> target_id of the
+        hierarchy, from the last one to the first one.
+        :param int source_id:
+        :param int target_id:
+        :return:
+        """
+        edges = list()
+        stack = [(source_id, target_id)]
+        while len(stack) > 0:
+            source_id, target_id = stack.pop()
+            if (source_id, target_id) in self.shortcuts:
+                middle_id = self.shortcuts[(source_id, target_id)]
+                stack.append((source_id, middle_id))
+                stack.append((middle_id, target_id))
+            else:
+                edges.append((self.vertices[source_id], self.vertices[target_id],
+                              list(self.edge_weights[(source_id, target_id)])))
+        return edges
+
+
+class CHDijkstra(Algorithm):
+    """
+    Shortest path queries on a contraction hierarchy. Building the hierarchy is expensive, but it can be passed to
+    every CHDijkstra on the same graph, and then every query only explores the vertices above its start and end
+    vertices in the hierarchy.
+    """
+
+    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), hierarchy=None, weight_index=0):
+        """
+        Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
+        solution is going to be added later.
+        The solution graph is created using the same parameters as the input graph, but empty.
+        :param Graph graph: input graph containing the data.
+        :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param ContractionHierarchy hierarchy: hierarchy of graph. By default, it is built from graph.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns. Only used if the
+        hierarchy is built here.
+        """
+
+        super().__init__(graph, visualizer)
+        self.hierarchy = hierarchy if hierarchy is not None else ContractionHierarchy(graph, weight_index)
+
+    def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
+        """
+        Runs the query from start_vertex to end_vertex, and adds the shortest path to the solution.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        vertex_ids = self.hierarchy.vertex_ids
+        finished = False
+
+        if start_vertex in vertex_ids and end_vertex in vertex_ids and start_vertex != end_vertex:
+            distance, edges, explored = self.hierarchy.query(start_vertex, end_vertex)
+            self.metrics.add_explored_node(explored)
+            if edges is not None:
+                path = PandasGraph(pd.DataFrame(), source_col=self.graph.source_col, target_col=self.graph.target_col,
+                                   weight_cols=self.graph.weight_cols, bidirectional=False)
+                path.add_edges(edges)
+                self.solution.add_solution(end_vertex, path)
+                finished = True
+
+        self.metrics.end_execution()
+        if not finished and end_vertex is not None:
+            print(f'Warning, could not find a path to {end_vertex}')
+
+        if show_end:
+            self.visualizer.show(graph=self.graph)
+            self.visualizer.show(graph=self.solution.get_all_solutions())
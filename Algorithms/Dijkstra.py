@@ -1,3 +1,6 @@
+import heapq
+
+import numpy as np
 import pandas as pd
 
 from Algorithms.Algorithm import Algorithm
@@ -8,19 +11,23 @@ from Visualizers.ConsoleVisualizer import ConsoleVisualizer
 
 class Dijkstra(Algorithm):
     """
-    Dijkstra algorithm
+    Dijkstra algorithm. The next vertex to explore is taken from a binary heap, and the solution graph is built once
+    the search is over.
     """
 
-    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer()):
+    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), weight_index=0):
         """
         Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
         solution is going to be added later.
         The solution graph is created using the same parameters as the input graph, but empty.
         :param Graph graph: input graph containing the data.
         :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns. The solution keeps
+        every weight of its edges.
         """
 
         super().__init__(graph, visualizer)
+        self.weight_index = weight_index
 
     def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
         """
@@ -42,53 +49,51 @@ class Dijkstra(Algorithm):
         )
 
         if start_vertex in all_vertices and start_vertex != end_vertex:
-            # Initialize distances
-            dist = {vertex: float("inf") if vertex != start_vertex else 0 for vertex in all_vertices}
-            prev = {vertex: None for vertex in all_vertices}
-            unexplored_vertices = {start_vertex}
-            current_vertex = start_vertex
+            # Initialize distances, only for the vertices that have been reached
+            dist = {start_vertex: 0}
+            prev, prev_cost = dict(), dict()
+            explored_order = list()
+
+            # Heap entries are (distance, insertion order, vertex). The insertion order breaks ties without comparing
+            # vertices, and entries whose distance is no longer the best one are skipped when popped (lazy deletion).
+            heap = [(0, 0, start_vertex)]
+            pushed = 1
+
+            while len(heap) > 0:
+                current_dist, _, current_vertex = heapq.heappop(heap)
+                if current_vertex in explored_vertices or current_dist > dist[current_vertex]:
+                    continue
 
-            while len(unexplored_vertices) > 0:
                 self.metrics.add_explored_node()
-                successors = self.graph.get_successors(current_vertex)
+                successor_weights = self._get_successor_weights(current_vertex)
                 if show_by_step:
+                    successors = [successor for successor, weight in successor_weights]
                     self.visualizer.wait(graph=self.graph, current=current_vertex, open=successors, close=explored_vertices)
 
                 explored_vertices.add(current_vertex)
-                unexplored_vertices.remove(current_vertex)
+                explored_order.append(current_vertex)
 
                 if current_vertex == end_vertex:
                     self.solution.add_solution(end_vertex, self.graph.get_path_informed(start_vertex, end_vertex, prev))
                     finished = True
                     break
 
-                for successor in successors:
-                    if successor not in explored_vertices:
-                        unexplored_vertices.add(successor)
-
+                for successor, weight in successor_weights:
                     # Calculate distance
-                    current_dist = self.graph.get_weight(source=current_vertex, target=successor)[0]                        # Distance between current and successor
-                    start_dist = 0 if dist[current_vertex] == float("inf") else dist[current_vertex]                        # Distance between current and start vertex
-                    distance = current_dist + start_dist
-
-                    # Update min distances dictionary and solution graph
-                    if distance < dist[successor]:
-                        predecessor = solution.get_predecessors(successor)
-                        if len(predecessor) > 0:
-                            solution.remove_edge(predecessor[0], successor)                                        # Remove old edge
-                        solution.add_edge(current_vertex, successor, [current_dist])    # Add new edge
+                    edge_dist = weight[self.weight_index]    # Distance between current and successor
+                    distance = current_dist + edge_dist
+
+                    # Update min distances and predecessors
+                    if distance < dist.get(successor, float("inf")):
+                        dist[successor] = distance
                         prev[successor] = current_vertex
-                        dist[successor] = distance                                                                      # Update min distance
-
-                # Get the unexplored vertex with the min distance
-                min_dist = float("inf")
-                min_vertex = None
-                for unexplored_vertex in unexplored_vertices:
-                    unexplored_dist = dist[unexplored_vertex]
-                    if unexplored_dist < min_dist or min_vertex is None:
-                        min_dist = unexplored_dist
-                        min_vertex = unexplored_vertex
-                current_vertex = min_vertex
+                        prev_cost[successor] = weight
+                        if successor not in explored_vertices:
+                            heapq.heappush(heap, (distance, pushed, successor))
+                            pushed += 1
+
+            # Build the solution graph once, adding the vertices in the order they were explored
+            solution.add_edges([(prev[vertex], vertex, prev_cost[vertex]) for vertex in explored_order if vertex in prev])
 
         self.metrics.end_execution()
         if len(self.solution.get_all_solutions()) == 0 and len(solution.data) > 0 and end_vertex is None:
@@ -101,5 +106,61 @@ class Dijkstra(Algorithm):
             self.visualizer.show(graph=self.graph)
             self.visualizer.show(graph=self.solution.get_all_solutions())
 
+    def _get_successor_weights(self, vertex):
+        """
+        Returns the (successor, weights) pairs of the edges the search follows from vertex. By default, every outgoing
+        edge of vertex.
+        :param vertex:
+        :return:
+        """
+        return self.graph.get_successor_weights(vertex)
 
 
+def distance_table(graph: Graph, sources, vertex_ids, weight_index=0, reverse=False, other_index=None):
+    """
+    Runs a single-objective Dijkstra search from every vertex in sources at once, and returns the distance of every
+    vertex to the closest source as a NumPy array indexed by vertex_ids. Unreachable vertices get infinity.
+    :param Graph graph: graph to search.
+    :param list sources: vertices where the search starts, with distance 0.
+    :param dict vertex_ids: dict mapping every vertex of the graph to its position in the returned array.
+    :param int weight_index: position of the weight to minimize, among the graph weight columns.
+    :param boolean reverse: if True, edges are traversed backwards, so the result is the distance from every vertex
+    to the sources instead.
+    :param int other_index: position of a second weight among the graph weight columns. If given, ties between
+    shortest paths are broken by the lowest cost in that weight, and a second array with that cost along the shortest
+    path of every vertex is returned too.
+    :return:
+    """
+    dist = [float("inf")] * len(vertex_ids)
+    other_dist = [float("inf")] * len(vertex_ids)
+    heap = list()
+    for source in sources:
+        if source in vertex_ids and dist[vertex_ids[source]] != 0:
+            dist[vertex_ids[source]] = other_dist[vertex_ids[source]] = 0
+            heap.append((0, 0, len(heap), source))
+    pushed = len(heap)
+
+    # Heap entries are (distance, other cost, insertion order, vertex), so vertices are explored in lexicographic order
+    explored_vertices = set()
+    while len(heap) > 0:
+        current_dist, current_other, _, current_vertex = heapq.heappop(heap)
+        if current_vertex in explored_vertices:
+            continue
+        explored_vertices.add(current_vertex)
+
+        if reverse:
+            neighbours = graph.get_predecessor_weights(current_vertex)
+        else:
+            neighbours = graph.get_successor_weights(current_vertex)
+        for neighbour, weight in neighbours:
+            distance = current_dist + weight[weight_index]
+            other = current_other + weight[other_index] if other_index is not None else 0
+            neighbour_id = vertex_ids[neighbour]
+            if distance < dist[neighbour_id] or (distance == dist[neighbour_id] and other < other_dist[neighbour_id]):
+                dist[neighbour_id], other_dist[neighbour_id] = distance, other
+                heapq.heappush(heap, (distance, other, pushed, neighbour))
+                pushed += 1
+
+    if other_index is not None:
+        return np.array(dist, dtype=float), np.array(other_dist, dtype=float)
+    return np.array(dist, dtype=float)
@@ -0,0 +1,163 @@
+import numpy as np
+
+# Below these sizes a plain Python loop is faster than building NumPy arrays for the comparison
+SMALL_COMPARISON = 64
+SMALL_SUBSET = 16
+
+
+def _is_infinity(costs):
+    return not isinstance(costs, (list, tuple, np.ndarray)) and costs == float('inf')
+
+
+def as_vectors(costs):
+    """
+    Returns costs as a list of cost vectors. A tuple, a list of numbers or a 1D array is a single cost vector, while a
+    list of lists (or tuples) or a 2D array is a list of cost vectors.
+    :param costs:
+    :return:
+    """
+    if isinstance(costs, np.ndarray):
+        return [costs] if costs.ndim == 1 else list(costs)
+    if isinstance(costs, tuple) or len(costs) == 0 or not isinstance(costs[0], (list, tuple, np.ndarray)):
+        return [costs]
+    return list(costs)
+
+
+def _as_matrix(vectors):
+    """
+    Returns the cost vectors as a 2D float array, or None if they do not all have the same length.
+    """
+    n_objectives = len(vectors[0])
+    if any(len(vector) != n_objectives for vector in vectors):
+        return None
+    return np.asarray(vectors, dtype=float).reshape(len(vectors), n_objectives)
+
+
+def dominates(costs1, costs2):
+    """
+    Returns True if the cost vector costs1 dominates costs2: it is as good in every objective and better in one.
+    :param costs1:
+    :param costs2:
+    :return:
+    """
+    is_better = False
+    for cost1, cost2 in zip(costs1, costs2):
+        if cost1 > cost2:
+            return False
+        elif cost1 < cost2:
+            is_better = True
+    return is_better
+
+
+def is_dominated(costs1, costs2):
+    """
+    Returns True if costs1 is dominated by costs2, that is, if there is a cost vector in costs2 that dominates every
+    cost vector in costs1. Both can be a single cost vector or a list of them, and infinity is dominated by anything.
+    :param list costs1:
+    :param list costs2:
+    :return:
+    """
+    # Edge case: one or both of them is Infinity
+    if _is_infinity(costs2):
+        return False
+    elif _is_infinity(costs1):
+        return True
+    elif len(costs2) == 0:
+        return False
+    elif len(costs1) == 0:
+        return True
+
+    vectors1, vectors2 = as_vectors(costs1), as_vectors(costs2)
+    matrix1 = matrix2 = None
+    if len(vectors1) * len(vectors2) > SMALL_COMPARISON:
+        matrix1, matrix2 = _as_matrix(vectors1), _as_matrix(vectors2)
+    if matrix1 is None or matrix2 is None or matrix1.shape[1] != matrix2.shape[1]:
+        for vector2 in vectors2:
+            if all(dominates(vector2, vector1) for vector1 in vectors1):
+                return True
+        return False
+
+    matrix1, matrix2 = matrix1[np.newaxis, :, :], matrix2[:, np.newaxis, :]
+    dominance = np.all(matrix2 <= matrix1, axis=2) & np.any(matrix2 < matrix1, axis=2)     # [j, i]: j dominates i
+    return bool(np.any(np.all(dominance, axis=1)))
+
+
+def is_weakly_dominated(costs, front):
+    """
+    Returns True if there is a cost vector in front that is as good as costs in every objective. Equal cost vectors
+    weakly dominate each other.
+    :param costs: single cost vector.
+    :param list front: list of cost vectors.
+    :return:
+    """
+    if len(front) == 0:
+        return False
+
+    matrix = _as_matrix(front) if len(front) > SMALL_COMPARISON else None
+    if matrix is None:
+        return any(all(cost2 <= cost1 for cost1, cost2 in zip(costs, vector)) for vector in front)
+    return bool(np.any(np.all(matrix <= np.asarray(costs, dtype=float), axis=1)))
+
+
+def non_dominated_mask(costs):
+    """
+    Returns a boolean array that is True for the cost vectors that are not dominated by any other cost vector in costs.
+    Equal cost vectors do not dominate each other, so duplicates are kept.
+    :param list costs: list of cost vectors, or 2D array with one cost vector per row.
+    :return:
+    """
+    n_costs = len(costs)
+    matrix = _as_matrix(costs) if n_costs > SMALL_SUBSET else None
+    if matrix is None:
+        return np.array([not any(dominates(other, cost) for other in costs) for cost in costs], dtype=bool)
+
+    if matrix.shape[1] == 2:
+        return _non_dominated_mask_2d(matrix)
+
+    # The candidate with the lowest sum of costs can not be dominated by any other candidate, so it is kept and every
+    # candidate it dominates is discarded. The work is proportional to the size of the result, not to n squared.
+    mask = np.zeros(n_costs, dtype=bool)
+    candidates = np.argsort(matrix.sum(axis=1), kind='stable')
+    while len(candidates) > 0:
+        best = matrix[candidates[0]]
+        mask[candidates[0]] = True
+        rest = matrix[candidates[1:]]
+        dominated = np.all(best <= rest, axis=1) & np.any(best < rest, axis=1)
+        candidates = candidates[1:][~dominated]
+    return mask
+
+
+def _non_dominated_mask_2d(matrix):
+    """
+    Sort-then-sweep non-dominated filter for two objectives, in O(n log n). After sorting by the first objective (and
+    the second one to break ties), a cost vector is dominated if a previous group with a lower first objective reached
+    a second objective as good as its own, or if its own group has a lower second objective.
+    """
+    order = np.lexsort((matrix[:, 1], matrix[:, 0]))
+    first, second = matrix[order, 0], matrix[order, 1]
+
+    new_group = np.empty(len(order), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = first[1:] != first[:-1]
+    group = np.cumsum(new_group) - 1
+
+    group_min = second[new_group]           # Sorted by the second objective, so the first of a group is its minimum
+    best_before = np.concatenate([[np.inf], np.minimum.accumulate(group_min)[:-1]])
+    dominated = (second > group_min[group]) | (best_before[group] <= second)
+
+    mask = np.empty(len(order), dtype=bool)
+    mask[order] = ~dominated
+    return mask
+
+
+def non_dominated(elements, key=None):
+    """
+    Returns the elements whose cost vectors are not dominated by the cost vector of any other element, keeping their
+    order.
+    :param list elements:
+    :param key: function that returns the cost vector of an element. By default, the elements are the cost vectors.
+    :return:
+    """
+    costs = elements if key is None else [key(elem) for elem in elements]
+    mask = non_dominated_mask(costs)
+    return [elem for elem, keep in zip(elements, mask) if keep]
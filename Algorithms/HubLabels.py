@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+from Algorithms.ContractionHierarchies import ContractionHierarchy
+from Graphs.Graph import Graph
+from Graphs.PandasGraph import PandasGraph
+
+
+class HubLabels:
+    """
+    Hub labeling index for exact single-objective distance lookups, built on a contraction hierarchy. The forward label
+    of a vertex holds the hubs reached by the upward search from it, and its backward label the hubs reached by the
+    upward search of the inverse graph, each with its distance. Every shortest path goes through a hub of both labels,
+    so the distance from start to end is the minimum, over the hubs in the forward label of start and the backward
+    label of end, of the sum of both distances.
+
+    Labels are built from the top of the hierarchy down: the label of a vertex is the vertex itself plus the labels of
+    its upward neighbours, and entries whose distance is longer than the distance given by the labels built so far are
+    pruned. Every entry keeps the neighbour it comes from, so paths can be retrieved and unpacked into the edges of
+    the graph. Labels are stored as NumPy arrays sorted by hub.
+    """
+
+    def __init__(self, graph: Graph, hierarchy=None, weight_index=0):
+        """
+        Builds the labels of every vertex of graph.
+        :param Graph graph: graph to index.
+        :param ContractionHierarchy hierarchy: hierarchy of graph. By default, it is built from graph.
+        :param int weight_index: position of the weight to minimize, among the graph weight columns. Only used if the
+        hierarchy is built here.
+        """
+        self.graph = graph
+        self.hierarchy = hierarchy if hierarchy is not None else ContractionHierarchy(graph, weight_index)
+        n_vertices = len(self.hierarchy.vertices)
+
+        # One entry per direction (forward, backward): hubs, distances and parents of every vertex
+        self.hubs = ([None] * n_vertices, [None] * n_vertices)
+        self.distances = ([None] * n_vertices, [None] * n_vertices)
+        self.parents = ([None] * n_vertices, [None] * n_vertices)
+        self._build()
+
+    def _build(self):
+        """
+        Builds the forward and backward labels of every vertex, from the highest ranked vertex to the lowest one.
+        :return:
+        """
+        rank = self.hierarchy.rank
+        search_graphs = (self.hierarchy.upward, self.hierarchy.downward)
+        scratch = np.full(len(rank), np.inf)     # Distances of the label being pruned, indexed by hub
+
+        for vertex_id in sorted(range(len(rank)), key=lambda vertex_id: rank[vertex_id], reverse=True):
+            for direction in (0, 1):
+                hubs, distances, parents = [np.array([vertex_id])], [np.zeros(1)], [np.array([-1])]
+                for neighbour_id, weight in search_graphs[direction][vertex_id]:
+                    hubs.append(self.hubs[direction][neighbour_id])
+                    distances.append(self.distances[direction][neighbour_id] + weight)
+                    parents.append(np.full(len(self.hubs[direction][neighbour_id]), neighbour_id))
+                hubs, distances, parents = np.concatenate(hubs), np.concatenate(distances), np.concatenate(parents)
+
+                # Keep the shortest distance to every hub
+                order = np.lexsort((distances, hubs))
+                hubs, distances, parents = hubs[order], distances[order], parents[order]
+                first = np.concatenate(([True], hubs[1:] != hubs[:-1]))
+                hubs, distances, parents = hubs[first], distances[first], parents[first]
+
+                # Prune the hubs whose distance is longer than the one given by the label and the label of the hub
+                scratch[hubs] = distances
+                keep = np.ones(len(hubs), dtype=bool)
+                for index, hub_id in enumerate(hubs):
+                    if hub_id != vertex_id:
+                        other_hubs = self.hubs[1 - direction][hub_id]
+                        other_distances = self.distances[1 - direction][hub_id]
+                        keep[index] = np.min(scratch[other_hubs] + other_distances) >= distances[index]
+                scratch[hubs] = np.inf
+
+                self.hubs[direction][vertex_id] = hubs[keep]
+                self.distances[direction][vertex_id] = distances[keep]
+                self.parents[direction][vertex_id] = parents[keep]
+
+    def distance(self, start_vertex, end_vertex):
+        """
+        Returns the distance from start_vertex to end_vertex, or infinity if there is no path or one of them is not in
+        the graph.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        hub_id, distance = self._best_hub(start_vertex, end_vertex)
+        return distance
+
+    def get_path(self, start_vertex, end_vertex):
+        """
+        Returns a Graph with the shortest path from start_vertex to end_vertex, as PandasGraph.get_path_informed, or
+        None if there is no path.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        hub_id, distance = self._best_hub(start_vertex, end_vertex)
+        if hub_id is None or start_vertex == end_vertex:
+            return None
+
+        # Edges of the hierarchy from end_vertex up to the hub, and from the hub down to start_vertex
+        hierarchy_edges = list()
+        vertex_id = self.hierarchy.vertex_ids[end_vertex]
+        while vertex_id != hub_id:
+            parent_id = self._parent(1, vertex_id, hub_id)
+            hierarchy_edges.append((parent_id, vertex_id))
+            vertex_id = parent_id
+
+        forward_edges = list()
+        vertex_id = self.hierarchy.vertex_ids[start_vertex]
+        while vertex_id != hub_id:
+            parent_id = self._parent(0, vertex_id, hub_id)
+            forward_edges.append((vertex_id, parent_id))
+            vertex_id = parent_id
+        hierarchy_edges.extend(reversed(forward_edges))
+
+        path = PandasGraph(pd.DataFrame(), source_col=self.graph.source_col, target_col=self.graph.target_col,
+                           weight_cols=self.graph.weight_cols, bidirectional=False)
+        path.add_edges(self.hierarchy.unpack_path(hierarchy_edges))
+        return path
+
+    def _best_hub(self, start_vertex, end_vertex):
+        """
+        Returns the hub of the shortest path from start_vertex to end_vertex and the distance, merging the forward
+        label of start_vertex and the backward label of end_vertex. The hub is None if there is no path.
+        :param start_vertex:
+        :param end_vertex:
+        :return:
+        """
+        start_id, end_id = self.hierarchy.vertex_ids.get(start_vertex), self.hierarchy.vertex_ids.get(end_vertex)
+        if start_id is None or end_id is None:
+            return None, float('inf')
+
+        hubs, forward_index, backward_index = np.intersect1d(self.hubs[0][start_id], self.hubs[1][end_id],
+                                                             assume_unique=True, return_indices=True)
+        if len(hubs) == 0:
+            return None, float('inf')
+        distances = self.distances[0][start_id][forward_index] + self.distances[1][end_id][backward_index]
+        best = int(np.argmin(distances))
+        return int(hubs[best]), distances[best].item()
+
+    def _parent(self, direction, vertex_id, hub_id):
+        """
+        Returns the neighbour the entry of hub_id in the label of vertex_id comes from.
+        :param int direction: 0 for the forward label, 1 for the backward label.
+        :param int vertex_id:
+        :param int hub_id:
+        :return:
+        """
+        hubs = self.hubs[direction][vertex_id]
+        return int(self.parents[direction][vertex_id][np.searchsorted(hubs, hub_id)])
@@ -2,6 +2,7 @@ import copy
 
 import pandas as pd
 
+from Algorithms import Dominance
 from Algorithms.Algorithm import Algorithm
 from Graphs.Graph import Graph
 from Graphs.PandasGraph import PandasGraph
@@ -51,6 +52,7 @@ class MOA(Algorithm):
             open = [start_vertex]
             closed = list()
             solution_costs, label = dict(), dict()
+            parent = dict()     # (vertex, cost): (parent vertex, parent cost, weight of the edge) of the first path found
 
             h = {start_vertex: self._get_nd_successors(start_vertex)}
             g = {vertex: [float("inf")] if vertex != start_vertex else [] for vertex in all_vertices}
@@ -84,7 +86,7 @@ class MOA(Algorithm):
                     for solution, costs in solution_costs.items():
                         for cost in costs:
                             solution_path = solution_template.copy()
-                            self._backtrack_sol(label=label, vertex=solution, accrued_cost=cost, solution_path=solution_path, start_vertex=start_vertex)
+                            self._backtrack_sol(parent=parent, vertex=solution, accrued_cost=cost, solution_path=solution_path)
                             self.solution.add_solution(solution, solution_path)
                     finished = True
                     break
@@ -124,7 +126,11 @@ class MOA(Algorithm):
                     successors = self.graph.get_successors(n)
                     if len(successors) > 0:
                         for successor in successors:
-                            my_cost = self._add_costs(self.graph.get_weight(n, successor), g[n])
+                            weight = self.graph.get_weight(n, successor)
+                            my_cost = self._add_costs(weight, g[n])
+                            parent_costs = [tuple(cost) for cost in g[n]] if len(g[n]) > 0 else [None]
+                            for cost, parent_cost in zip(my_cost, parent_costs):
+                                parent.setdefault((successor, tuple(cost)), (n, parent_cost, weight))
 
                             if successor not in open and successor not in closed:   # Newly generated vertex
 
@@ -205,43 +211,7 @@ class MOA(Algorithm):
         :param list costs2:
         :return:
         """
-        # Edge case: one or both of them is Infinity
-        if isinstance(costs1, list) and costs2 == float('inf'):
-            return False
-        elif isinstance(costs2, list) and costs1 == float('inf'):
-            return True
-        elif costs1 == float('inf') and costs2 == float('inf'):
-            return False
-        elif len(costs2) == 0:
-            return False
-        elif len(costs1) == 0:
-            return True
-
-        if not isinstance(costs1[0], list):
-            costs1 = [costs1]
-        if not isinstance(costs2[0], list):
-            costs2 = [costs2]
-
-        for sublist2 in costs2:
-            dominance = True
-            for sublist1 in costs1:
-                check_dm = self._check_dominance(sublist1, sublist2)
-                if not check_dm:
-                    dominance = False
-            if dominance:
-                return True
-        return False
-
-    def _check_dominance(self, list1, list2):
-        as_good = True
-        is_better = False
-        for cost1, cost2 in zip(list1, list2):
-            if cost2 > cost1:
-                as_good = False     # List2 is worse than Cost1
-            elif cost2 < cost1:
-                is_better = True    # List2 is better than Cost1
-
-        return as_good and is_better
+        return Dominance.is_dominated(costs1, costs2)
 
     def _get_nd_successors(self, vertex):
         """
@@ -253,23 +223,13 @@ class MOA(Algorithm):
                     self.graph.get_successors(vertex)}
 
         nd = list()
-
-        for vertex, weight1 in vertices.items():
-            dominated = False
-            for weight2 in vertices.values():
-                if self.is_dominated(weight1, weight2):
-                    dominated = True
-            if not dominated and weight1 not in nd:
-                nd.append(weight1)
-
+        for weight in Dominance.non_dominated(list(vertices.values())):
+            if weight not in nd:
+                nd.append(weight)
         return nd
 
     def _get_non_dm_subset(self, elements):
-        subset = list()
-        for elem in elements:
-            if not self.is_dominated(elem, elements):
-                subset.append(elem)
-        return subset
+        return Dominance.non_dominated(elements)
 
     def _add_costs(self, costs1, costs2):
         # Transform both to list of lists
@@ -325,20 +285,20 @@ class MOA(Algorithm):
             res.append(c1-c2)
         return res
 
-    def _backtrack_sol(self, label, vertex, accrued_cost, solution_path, start_vertex):
-        predecessors = self.graph.get_predecessors(vertex)
-        for predecessor in predecessors:
-            key = (predecessor,vertex)
-            weight = self.graph.get_weight(predecessor, vertex)
-            if key in label and accrued_cost in label[key]:
-                substraction = self._substract_lists(accrued_cost, weight)
-                solution_path.add_edge(predecessor, vertex, weights=weight)
-
-                if predecessor != start_vertex:
-                    self._backtrack_sol(label, predecessor, substraction, solution_path, start_vertex)
-
-                return
-
-
-
-
+    def _backtrack_sol(self, parent, vertex, accrued_cost, solution_path):
+        """
+        Adds to solution_path the edges of the path that reaches vertex with accrued_cost, following the parent of every
+        cost back to the start vertex, whose cost has no parent.
+        :param dict parent: (vertex, cost): (parent vertex, parent cost, weight of the edge).
+        :param vertex:
+        :param list accrued_cost:
+        :param Graph solution_path:
+        :return:
+        """
+        edges = list()
+        cost = tuple(accrued_cost)
+        while cost is not None:
+            predecessor, cost, weight = parent[(vertex, cost)]
+            edges.append((predecessor, vertex, weight))
+            vertex = predecessor
+        solution_path.add_edges(edges)
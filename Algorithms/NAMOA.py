@@ -1,7 +1,8 @@
-import copy
+import heapq
 
 import pandas as pd
 
+from Algorithms import Dominance
 from Algorithms.Algorithm import Algorithm
 from Graphs.Graph import Graph
 from Graphs.PandasGraph import PandasGraph
@@ -13,7 +14,7 @@ class NAMOA(Algorithm):
     NAMOA* algorithm
     """
 
-    def __init__(self, graph: Graph, heuristic, visualizer=ConsoleVisualizer()):
+    def __init__(self, graph: Graph, heuristic, visualizer=ConsoleVisualizer(), dimensionality_reduction=False):
         """
         Creates the algorithm by using the input graph that contains the data, and by creating an empty Graph where the
         solution is going to be added later.
@@ -21,10 +22,13 @@ class NAMOA(Algorithm):
         :param Graph graph: input graph containing the data.
         :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
         :param heuristic: heuristic function to be used. By default: BFS Heuristic.
+        :param boolean dimensionality_reduction: if True, runs NAMOA*dr, which drops the first objective from the
+        dominance checks. It needs a consistent heuristic, such as IdealPoint.
         """
 
         super().__init__(graph, visualizer)
         self.heuristic = heuristic
+        self.dimensionality_reduction = dimensionality_reduction
 
     def run(self, start_vertex, end_vertices=None, show_by_step=False, show_end=False):
         """
@@ -48,132 +52,18 @@ class NAMOA(Algorithm):
         finished = False
         if start_vertex in all_vertices and len([elem for elem in end_vertices if elem in all_vertices]) != 0 \
                 and end_vertices != [start_vertex]:
-            h = {start_vertex: self.heuristic.calculate(start_vertex)}
-            gclose = dict()
-            gopen = {vertex: [float("inf")] if vertex != start_vertex else [] for vertex in all_vertices}
-            f = {vertex: [float("inf")] if vertex != start_vertex else h[start_vertex] for vertex in all_vertices}
-
-            open = [(start_vertex, gopen[start_vertex], f[start_vertex])]
-            goaln, costs, costs_vertex = list(), list(), dict()
-            label = dict()
-
-            while not finished:
-                self.metrics.add_explored_node()
-                # Step 2: Check Termination
-                if len(open) == 0:
-                    for vertex, costs in costs_vertex.items():
-                        for cost in costs:
-                            solution_path = solution_template.copy()
-                            self._backtrack_sol(label=label, vertex=vertex, accrued_cost=cost, solution_path=solution_path,
-                                                start_vertex=start_vertex)
-                            self.solution.add_solution(vertex, solution_path)
-                    finished = True
-                    break
-
-                # Step 3: Path Selection
-                all_fopen = [fvertex for vertex,gvertex,fvertex in open]
-                chosen_vertex, chosen_gvertex, chosen_fvertex = None, None, None
-                for elem in open:
-                    vertex, gvertex, fvertex = elem
-                    if not self._is_dominated_by_list(fvertex, all_fopen):
-                        chosen_vertex = vertex
-                        chosen_gvertex = gvertex
-                        open.remove(elem)
-                        if chosen_vertex in gclose:
-                            gclose[chosen_vertex].extend(copy.deepcopy(chosen_gvertex))
-                        else:
-                            gclose[chosen_vertex] = copy.deepcopy(chosen_gvertex)
-
-                        if chosen_vertex in gopen and len(chosen_gvertex) > 0:
-                            for g_elem in chosen_gvertex:
-                                if g_elem in gopen[chosen_vertex]:
-                                    gopen[chosen_vertex].remove(copy.deepcopy(g_elem))
-
-                        break
-
-                if show_by_step:
-                    self.visualizer.wait(graph=self.graph, current=chosen_vertex,
-                                         open=[vertex for vertex, content in gopen.items() if float("inf") not in content],
-                                         close=gclose.keys())
-
-                if chosen_vertex in end_vertices:  # Step 4: Solution Recording
-                    for elem in chosen_gvertex:
-                        if not self.is_dominated(elem, costs):
-                            goaln.append(chosen_vertex)
-                            costs.extend(copy.deepcopy(chosen_gvertex))
-                            if chosen_vertex in costs_vertex:
-                                costs_vertex[chosen_vertex].extend(copy.deepcopy(chosen_gvertex))
-                            else:
-                                costs_vertex[chosen_vertex] = copy.deepcopy(chosen_gvertex)
-
-                            new_open = list()
-                            for elem in open:
-                                vertex, gvertex, fvertex = elem
-                                new_gvertex = self._sublist_nondominated_single(gvertex, chosen_gvertex)
-                                if len(new_gvertex) > 0:
-                                    if vertex not in h:
-                                        h[vertex] = self.heuristic.calculate(vertex)
-
-                                    f[vertex] = self._add_costs(new_gvertex, h[vertex])
-                                    new_open.append((vertex, new_gvertex, f[vertex]))
-
-                            open = new_open
-                else:   # Step 5: Path Expansion
-                    for successor in self.graph.get_successors(chosen_vertex):
-                        gsucc = self._add_costs(self.graph.get_weight(chosen_vertex, successor), chosen_gvertex)   # Step A:
-
-                        all_verticesopen = [vertex for vertex,gvertex,fvertex in open]
-
-                        if successor not in all_verticesopen and successor not in gclose.keys():    # Step B:
-
-                            if successor not in h:
-                                h[successor] = self.heuristic.calculate(successor)
-
-                            # Step 5.1:
-                            fsucc = list()
-                            for elem in self._add_costs(gsucc, h[successor]):
-                                if not self.is_dominated(elem, costs):
-                                    fsucc.append(elem)
-                            f[successor] = fsucc
-
-                            # Step 5.2:
-                            if len(fsucc) > 0:
-                                open.append((successor, gsucc, fsucc))
-                                if successor in gopen and float("inf") not in gopen[successor]:
-                                    gopen[successor].extend(copy.deepcopy(gsucc))
-                                else:
-                                    gopen[successor] = copy.deepcopy(gsucc)
-                                label[(chosen_vertex,successor)] = copy.deepcopy(gsucc)
-                        elif self._in_gopen_or_gclose(gsucc, gopen, gclose, successor):
-                                label[(chosen_vertex,successor)] = copy.deepcopy(gsucc)
-                        elif not self.is_dominated(gsucc, gopen.get(successor, list())) and not self.is_dominated(gsucc, gclose.get(successor, list())):
-                            if successor in gopen:
-                                gopen[successor] = self._sublist_nondominated(gopen.get(successor, list()), gsucc, open, successor, fsucc)
-
-                            if successor in gclose:
-                                gclose[successor] = self._sublist_nondominated(gclose.get(successor, list()), gsucc, open, successor, fsucc)
-
-                            if successor not in h:
-                                h[successor] = self.heuristic.calculate(successor)
-
-                            # Step 5.1:
-                            fsucc = list()
-                            for elem in self._add_costs(gsucc, h[successor]):
-                                if not self.is_dominated(elem, costs):
-                                    fsucc.append(elem)
-                            f[successor] = fsucc
-                            if len(fsucc) > 0:
-                                open.append((successor, gsucc, fsucc))
-                                if successor in gopen and float("inf") not in gopen[successor]:
-                                    gopen[successor].extend(copy.deepcopy(gsucc))
-                                else:
-                                    gopen[successor] = copy.deepcopy(gsucc)
-
-                                if (chosen_vertex, successor) not in label:
-                                    label[(chosen_vertex, successor)] = copy.deepcopy(gsucc)
-                                else:
-                                    label[(chosen_vertex, successor)].extend(gsucc)
-                                    label[(chosen_vertex, successor)] = self._get_non_dm_subset(label[(chosen_vertex, successor)])
+            goals = set(end_vertices)
+            if self.dimensionality_reduction:
+                costs_vertex = self._search_dr(start_vertex, goals, show_by_step)
+            else:
+                costs_vertex = self._search(start_vertex, goals, show_by_step)
+
+            for vertex, vertex_labels in costs_vertex.items():
+                for solution_label in vertex_labels:
+                    solution_path = solution_template.copy()
+                    self._backtrack_sol(solution_label, solution_path)
+                    self.solution.add_solution(vertex, solution_path)
+            finished = True
 
         self.metrics.end_execution()
         if not finished and end_vertices is not None:
@@ -183,55 +73,205 @@ class NAMOA(Algorithm):
             self.visualizer.show(graph=self.graph)
             self.visualizer.show(graph=self.solution.get_all_solutions())
 
-    def _in_gopen_or_gclose(self, gsucc, gopen, gclose, successor):
-        for elem in gsucc:
-            if elem in gopen.get(successor, list()) or gsucc in gclose.get(successor, list()):
-                return True
-        return False
+    def _search(self, start_vertex, goals, show_by_step):
+        """
+        Runs NAMOA* and returns the labels of the solutions found at every goal.
+
+        Open is a heap of entries (f, counter, label, fs) ordered lexicographically by f, so the label on top is
+        never dominated by another open label. A label is (vertex, g, parent label, weight of the edge from the parent
+        label's vertex), so the path of a solution is recovered by following the parent labels. gopen and gclose keep,
+        for every vertex, the Pareto set of costs of the open and closed labels that reached it. A label whose cost is
+        removed from gopen is left in the heap and skipped when popped.
+        :param start_vertex:
+        :param set goals:
+        :param bool show_by_step:
+        :return:
+        """
+        h = dict()
+        gopen, gclose = dict(), dict()
+        costs, costs_vertex = list(), dict()
+        open, counter = list(), 0
+
+        gstart = tuple(0 for weight_col in self.graph.weight_cols)
+        fstart = self._get_fcosts(start_vertex, gstart, h, costs)
+        if len(fstart) > 0:
+            heapq.heappush(open, (min(fstart), counter, (start_vertex, gstart, None, None), fstart))
+            gopen[start_vertex] = [gstart]
+
+        while True:
+            self.metrics.add_explored_node()
+            # Step 2: Check Termination
+            chosen = self._pop_label(open, gopen, costs)
+            if chosen is None:
+                return costs_vertex
+
+            # Step 3: Path Selection
+            chosen_vertex, chosen_g = chosen[0], chosen[1]
+            gopen[chosen_vertex].remove(chosen_g)
+            gclose.setdefault(chosen_vertex, list()).append(chosen_g)
+
+            if show_by_step:
+                self.visualizer.wait(graph=self.graph, current=chosen_vertex,
+                                     open=[vertex for vertex, content in gopen.items() if len(content) > 0],
+                                     close=gclose.keys())
+
+            if chosen_vertex in goals:  # Step 4: Solution Recording
+                if chosen_vertex != start_vertex and not self.is_dominated(chosen_g, costs):
+                    costs.append(chosen_g)
+                    costs_vertex.setdefault(chosen_vertex, list()).append(chosen)
+            else:   # Step 5: Path Expansion
+                for successor in self.graph.get_successors(chosen_vertex):
+                    weight = self.graph.get_weight(chosen_vertex, successor)
+                    gsucc = tuple(cost + value for cost, value in zip(chosen_g, weight))   # Step A:
+                    succ_open, succ_closed = gopen.get(successor, list()), gclose.get(successor, list())
+
+                    if gsucc in succ_open or gsucc in succ_closed:  # Step B: same cost, its label already has a path
+                        continue
+                    elif not self.is_dominated(gsucc, succ_open) and not self.is_dominated(gsucc, succ_closed):
+                        # Step 5.1: Filter the costs of successor, and its open labels, dominated by gsucc
+                        if len(succ_open) > 0:
+                            gopen[successor] = [cost for cost in succ_open if not Dominance.dominates(gsucc, cost)]
+                        if len(succ_closed) > 0:
+                            gclose[successor] = [cost for cost in succ_closed if not Dominance.dominates(gsucc, cost)]
+
+                        # Step 5.2: Add the label to open if it is not dominated by a solution
+                        fsucc = self._get_fcosts(successor, gsucc, h, costs)
+                        if len(fsucc) > 0:
+                            counter += 1
+                            heapq.heappush(open, (min(fsucc), counter, (successor, gsucc, chosen, weight), fsucc))
+                            gopen.setdefault(successor, list()).append(gsucc)
+
+    def _search_dr(self, start_vertex, goals, show_by_step):
+        """
+        Runs NAMOA*dr and returns the labels of the solutions found at every goal.
+
+        With a consistent heuristic, labels leave open in lexicographic order of f, so every label closed before at
+        the same vertex, and every solution found before, is at least as good in the first objective. The first
+        objective is therefore dropped from the dominance checks: every vertex keeps the truncated front of the costs
+        of its closed labels without the first objective, and a label is discarded if a truncated cost there is as
+        good as its own. Open labels are not filtered, they are checked when they are popped.
+        :param start_vertex:
+        :param set goals:
+        :param bool show_by_step:
+        :return:
+        """
+        h, closed_front = dict(), dict()
+        solutions, costs_vertex = dict(), dict()
+        open, counter = list(), 0
+
+        gstart = tuple(0 for weight_col in self.graph.weight_cols)
+        heapq.heappush(open, (self._get_fcost(start_vertex, gstart, h), counter, (start_vertex, gstart, None, None)))
+
+        while True:
+            self.metrics.add_explored_node()
+            chosen = self._pop_label_dr(open, closed_front, solutions)
+            if chosen is None:
+                return costs_vertex
+
+            chosen_vertex, chosen_g = chosen[0], chosen[1]
+            truncated_g = chosen_g[1:]
+            closed_front[chosen_vertex] = [cost for cost in closed_front.get(chosen_vertex, list())
+                                           if not all(value <= other for value, other in zip(truncated_g, cost))]
+            closed_front[chosen_vertex].append(truncated_g)
+
+            if show_by_step:
+                self.visualizer.wait(graph=self.graph, current=chosen_vertex, open={entry[2][0] for entry in open},
+                                     close=closed_front.keys())
+
+            if chosen_vertex in goals:
+                if chosen_vertex != start_vertex:
+                    solutions.setdefault(truncated_g, chosen_g[0])
+                    costs_vertex.setdefault(chosen_vertex, list()).append(chosen)
+                continue
+
+            for successor, weight in self.graph.get_successor_weights(chosen_vertex):
+                gsucc = tuple(cost + value for cost, value in zip(chosen_g, weight))
+                if Dominance.is_weakly_dominated(gsucc[1:], closed_front.get(successor, list())):
+                    continue
+                fsucc = self._get_fcost(successor, gsucc, h)
+                if not self._is_dominated_by_solution(fsucc, solutions):
+                    counter += 1
+                    heapq.heappush(open, (fsucc, counter, (successor, gsucc, chosen, weight)))
+
+    def _pop_label_dr(self, open, closed_front, solutions):
+        """
+        Pops the lexicographically smallest label from open whose truncated cost is not weakly dominated by the
+        truncated front of its vertex, and whose estimated cost is not dominated by a solution. Returns the label, or
+        None if open is empty.
+        :param list open: heap of labels.
+        :param dict closed_front: truncated costs of the closed labels of every vertex.
+        :param dict solutions: first cost of the solutions found, by their truncated cost.
+        :return:
+        """
+        while len(open) > 0:
+            fcost, counter, label = heapq.heappop(open)
+            if not Dominance.is_weakly_dominated(label[1][1:], closed_front.get(label[0], list())) and \
+                    not self._is_dominated_by_solution(fcost, solutions):
+                return label
+        return None
+
+    def _is_dominated_by_solution(self, fcost, solutions):
+        """
+        Returns True if fcost is dominated by the cost of a solution found before. Those solutions are at least as good
+        in the first objective, so a solution with the same truncated cost only dominates fcost if its first cost is
+        lower, and a different truncated cost that is as good as the one of fcost always dominates it.
+        :param tuple fcost:
+        :param dict solutions: first cost of the solutions found, by their truncated cost.
+        :return:
+        """
+        truncated = fcost[1:]
+        if truncated in solutions:
+            return solutions[truncated] < fcost[0]
+        return Dominance.is_weakly_dominated(truncated, list(solutions.keys()))
 
-    def _is_dominated_by_list(self, elem, compare):
+    def _get_fcost(self, vertex, g, h):
         """
-        Returns True if any element in compare dominates elem.
+        Returns the estimated cost (g + heuristic) of a label, using the minimum of every objective among the cost
+        vectors of the heuristic. The heuristic of every vertex is calculated once and stored in h.
+        :param vertex:
+        :param tuple g: cost of the label.
+        :param dict h: heuristic of every vertex already calculated.
+        :return:
         """
-        for compare_elem in compare:
-            if self.is_dominated(elem, compare_elem):
-                return True
-        return False
+        if vertex not in h:
+            estimates = Dominance.as_vectors(self.heuristic.calculate(vertex))
+            h[vertex] = tuple(min(values) for values in zip(*estimates))
+        return tuple(cost + estimate for cost, estimate in zip(g, h[vertex]))
 
-    def _sublist_nondominated_single(self, listinput, elemcompare):
+    def _get_fcosts(self, vertex, g, h, costs):
         """
-        Removes any element from listinput that is dominated by listcompare. Returns the subset.
-        :param listinput:
-        :param listcompare:
+        Returns the estimated costs (g + heuristic) of a label that are not dominated by the solutions found so far.
+        The heuristic of every vertex is calculated once and stored in h.
+        :param vertex:
+        :param tuple g: cost of the label.
+        :param dict h: heuristic of every vertex already calculated.
+        :param list costs: costs of the solutions found so far.
         :return:
         """
-        res = list()
-        for elem in listinput:
-            if not self.is_dominated(elem, elemcompare):
-                res.append(elem)
-        return res
+        if vertex not in h:
+            h[vertex] = Dominance.as_vectors(self.heuristic.calculate(vertex))
+        fcosts = [tuple(cost + estimate for cost, estimate in zip(g, heuristic)) for heuristic in h[vertex]]
+        return [fcost for fcost in fcosts if not self.is_dominated(fcost, costs)]
 
-    def _sublist_nondominated(self, listinput, listcompare, open, succ, fsucc):
+    def _pop_label(self, open, gopen, costs):
         """
-        Removes any element from listinput that is dominated by listcompare. Returns the subset.
-        :param listinput:
-        :param listcompare:
+        Pops the lexicographically smallest label from open that is still alive: its cost is still in gopen and it is
+        not dominated by a solution found after it was added. Returns the label, or None if open is empty.
+        :param list open: heap of labels.
+        :param dict gopen: costs of the open labels of every vertex.
+        :param list costs: costs of the solutions found so far.
         :return:
         """
-        res = list()
-        for elem in listinput:
-            if not self.is_dominated(elem, listcompare):
-                res.append(elem)
-            elif (succ,elem,fsucc) in open:
-                open.remove((succ,elem,fsucc))
-        return res
-
-    def _get_non_dm_subset(self, elements):
-        subset = list()
-        for elem in elements:
-            if not self.is_dominated(elem, elements):
-                subset.append(elem)
-        return subset
+        while len(open) > 0:
+            fmin, counter, label, fcosts = heapq.heappop(open)
+            vertex, g = label[0], label[1]
+            if g not in gopen.get(vertex, list()):
+                continue    # Its cost was dominated, or the same cost was already selected
+            elif self.is_dominated(g, costs):
+                gopen[vertex].remove(g)     # Filtered by a solution found after it was added
+                continue
+            return label
+        return None
 
     def is_dominated(self, costs1, costs2):
         """
@@ -240,95 +280,18 @@ class NAMOA(Algorithm):
         :param list costs2:
         :return:
         """
-        # Edge case: one or both of them is Infinity
-        if isinstance(costs1, list) and costs2 == float('inf'):
-            return False
-        elif isinstance(costs2, list) and costs1 == float('inf'):
-            return True
-        elif costs1 == float('inf') and costs2 == float('inf'):
-            return False
-        elif len(costs2) == 0:
-            return False
-        elif len(costs1) == 0:
-            return True
-
-        if not isinstance(costs1[0], list):
-            costs1 = [costs1]
-        if not isinstance(costs2[0], list):
-            costs2 = [costs2]
-
-        for sublist2 in costs2:
-            dominance = True
-            for sublist1 in costs1:
-                check_dm = self._check_dominance(sublist1, sublist2)
-                if not check_dm:
-                    dominance = False
-            if dominance:
-                return True
-        return False
-
-    def _check_dominance(self, list1, list2):
-        as_good = True
-        is_better = False
-        for cost1, cost2 in zip(list1, list2):
-            if cost2 > cost1:
-                as_good = False     # List2 is worse than Cost1
-            elif cost2 < cost1:
-                is_better = True    # List2 is better than Cost1
-
-        return as_good and is_better
-
-    def _add_costs(self, costs1, costs2):
-        # Transform both to list of lists
-        if len(costs1) == 0 or not isinstance(costs1[0], list):
-            costs1 = [costs1]
-        if len(costs2) == 0 or not isinstance(costs2[0], list):
-            costs2 = [costs2]
-
-        if len(costs1[0]) == 0:
-            return costs2
-        elif len(costs2[0]) == 0:
-            return costs1
-
-        res = list()
-        for c1 in costs1:
-            for c2 in costs2:
-                res.append(self._add_lists(c1,c2))
-        return res
-
-    def _add_lists(self, list1, list2):
-        if len(list1) != len(list2):
-            raise ValueError(f"Cant add {list1} and {list2} as they have different sizes.")
-
-        res = list()
-        for c1, c2 in zip(list1, list2):
-            res.append(c1+c2)
-        return res
-
-    def _substract_lists(self, list1, list2):
-        if len(list1) != len(list2):
-            raise ValueError(f"Cant substract {list1} and {list2} as they have different sizes.")
-
-        res = list()
-        for c1, c2 in zip(list1, list2):
-            res.append(c1-c2)
-        return res
-
-    def _backtrack_sol(self, label, vertex, accrued_cost, solution_path, start_vertex):
-        predecessors = self.graph.get_predecessors(vertex)
-        for predecessor in predecessors:
-            key = (predecessor,vertex)
-            weight = self.graph.get_weight(predecessor, vertex)
-            if key in label and accrued_cost in label[key]:
-                substraction = self._substract_lists(accrued_cost, weight)
-                solution_path.add_edge(predecessor, vertex, weights=weight)
-
-                if predecessor != start_vertex:
-                    self._backtrack_sol(label, predecessor, substraction, solution_path, start_vertex)
-
-                return
-
-
-
-
+        return Dominance.is_dominated(costs1, costs2)
 
+    def _backtrack_sol(self, label, solution_path):
+        """
+        Adds to solution_path the edges of the path of label, following the parent labels back to the start vertex.
+        :param tuple label:
+        :param Graph solution_path:
+        :return:
+        """
+        edges = list()
+        while label[2] is not None:
+            parent = label[2]
+            edges.append((parent[0], label[0], label[3]))
+            label = parent
+        solution_path.add_edges(edges)
@@ -1,10 +1,12 @@
+import numpy as np
 import pandas as pd
 
+from Algorithms import Dominance
 from Algorithms.Algorithm import Algorithm
 from Graphs.Graph import Graph
 from Graphs.PandasGraph import PandasGraph
 from Visualizers.ConsoleVisualizer import ConsoleVisualizer
-from Algorithms.Dijkstra import Dijkstra
+from Algorithms.Dijkstra import distance_table
 
 
 class PULSE(Algorithm):
@@ -25,7 +27,8 @@ class PULSE(Algorithm):
         super().__init__(graph, visualizer)
 
         # Algorithm Parameters
-        self.check_solutions, self.labels, self.min_c_cost, self.min_t_cost = dict(), dict(), dict(), dict()
+        self.check_solutions, self.labels = dict(), dict()
+        self.vertex_ids, self.min_c_cost, self.min_t_cost, self.unreachable = None, None, None, None
         self.start_vertex, self.end_vertex, self.nadir_point = None, None, None
 
     def run(self, start_vertex, end_vertex=None, show_by_step=False, show_end=False):
@@ -46,12 +49,13 @@ class PULSE(Algorithm):
         all_vertices = self.graph.get_all_vertices()
         self.start_vertex = start_vertex
         self.end_vertex = end_vertex
-        self.check_solutions, self.labels, self.min_c_cost, self.min_t_cost = dict(), dict(), dict(), dict()
+        self.check_solutions, self.labels = dict(), dict()
         self.nadir_point = None
 
         if start_vertex in all_vertices and end_vertex in all_vertices and start_vertex != end_vertex:
             self._initialization(end_vertex)
-            self._pulse(start_vertex, 0, 0, tuple(), show_by_step)
+            if self.nadir_point is not None:
+                self._pulse(start_vertex, show_by_step)
             for path in self.check_solutions.keys():
                 solution_path = solution_template.copy()
                 self._backtrack_sol(path, solution_path)
@@ -66,40 +70,77 @@ class PULSE(Algorithm):
             self.visualizer.show(graph=self.solution.get_all_solutions())
 
     def _initialization(self, end_vertex):
-        self._create_inverse_graph(self.graph, end_vertex)
-
-    def _create_inverse_graph(self, graph, end_vertex):
-        inverse_graph = graph.get_inverse_graph()
-        inverse_graph_c = inverse_graph
-        inverse_graph_t = inverse_graph.copy()
-
-        inverse_graph_c.weight_cols = [self.graph.weight_cols[0]]
-        inverse_graph_t.weight_cols = [self.graph.weight_cols[1]]
-
-        dijkstra_c = Dijkstra(inverse_graph_c)
-        dijkstra_c.run(start_vertex=end_vertex)
-        self.inverse_c_sol = dijkstra_c.solution
-        c_graph = self.inverse_c_sol.get_solution('*')[0]
-        c_graph.weight_cols = [self.graph.weight_cols[0], self.graph.weight_cols[1]]
-        c_graph.data[self.graph.weight_cols[1]] = c_graph.data.apply(lambda data: self.graph.get_weight(data[self.graph.target_col], data[self.graph.source_col])[1], axis=1)
-
-        dijkstra_t = Dijkstra(inverse_graph_t)
-        dijkstra_t.run(start_vertex=end_vertex)
-        self.inverse_t_sol = dijkstra_t.solution
-        t_graph = self.inverse_t_sol.get_solution('*')[0]
-        t_graph.weight_cols = [self.graph.weight_cols[0], self.graph.weight_cols[1]]
-        t_graph.data[self.graph.weight_cols[0]] = t_graph.data.apply(lambda data: self.graph.get_weight(data[self.graph.target_col], data[self.graph.source_col])[0], axis=1)
-
-        C = self.inverse_t_sol.get_solution(self.start_vertex)[0].get_path_cost(start=self.end_vertex, end=self.start_vertex)[0]
-        T = self.inverse_c_sol.get_solution(self.start_vertex)[0].get_path_cost(start=self.end_vertex, end=self.start_vertex)[1]
-        self.nadir_point = (C,T)
-
-    def _pulse(self, current_vertex, cumulative_c, cumulative_t, current_path, show_by_step):
+        self._create_bounds(end_vertex)
+
+    def _create_bounds(self, end_vertex):
+        """
+        Runs a reverse single-objective Dijkstra from end_vertex for each of the two objectives, and stores the minimum c
+        and t cost from every vertex to end_vertex in arrays indexed by vertex_ids. Vertices that can not reach
+        end_vertex are flagged in the unreachable mask.
+        Ties are broken by the other objective, which each search also sums along its shortest paths, so the nadir
+        point is the t cost of the shortest c path and the c cost of the shortest t path from the start vertex.
+        :param end_vertex:
+        :return:
+        """
+        self.vertex_ids = {vertex: index for index, vertex in enumerate(self.graph.get_all_vertices())}
+        self.min_c_cost, t_of_min_c = distance_table(self.graph, [end_vertex], self.vertex_ids, weight_index=0,
+                                                     reverse=True, other_index=1)
+        self.min_t_cost, c_of_min_t = distance_table(self.graph, [end_vertex], self.vertex_ids, weight_index=1,
+                                                     reverse=True, other_index=0)
+        self.unreachable = np.isinf(self.min_c_cost)
+
+        start_id = self.vertex_ids[self.start_vertex]
+        if not self.unreachable[start_id]:
+            self.nadir_point = (c_of_min_t[start_id].item(), t_of_min_c[start_id].item())
+
+    def _pulse(self, start_vertex, show_by_step, cumulative_c=0, cumulative_t=0, path=()):
+        """
+        Sends a pulse from start_vertex, exploring every path that reaches end_vertex and is not pruned.
+        :param start_vertex:
+        :param bool show_by_step:
+        :param cumulative_c: c cost of reaching start_vertex.
+        :param cumulative_t: t cost of reaching start_vertex.
+        :param tuple path: vertices visited before start_vertex, if the search continues a partial path.
+        :return:
+        """
+        self._pulse_from(start_vertex, show_by_step, cumulative_c, cumulative_t, path)
+
+    def _pulse_from(self, start_vertex, show_by_step, cumulative_c=0, cumulative_t=0, path=()):
+        """
+        Depth-first search of the paths from start_vertex, pruning them with the cycle, nadir point, efficient set and
+        label checks. The search keeps an explicit stack of (vertex, cumulative_c, cumulative_t, successors) frames and
+        a single path buffer that grows and shrinks with it, instead of recursing once per edge.
+        :param start_vertex:
+        :param bool show_by_step:
+        :param cumulative_c: c cost of reaching start_vertex.
+        :param cumulative_t: t cost of reaching start_vertex.
+        :param tuple path: vertices visited before start_vertex, if the search continues a partial path.
+        :return:
+        """
+        path, on_path, stack = list(path), set(path), list()
+        self._pulse_vertex(start_vertex, cumulative_c, cumulative_t, path, on_path, stack, show_by_step)
+        while len(stack) > 0:
+            current_vertex, cumulative_c, cumulative_t, successors = stack[-1]
+            successor = next(successors, None)
+            if successor is None:
+                stack.pop()
+                path.pop()
+                on_path.remove(current_vertex)
+            else:
+                successor_cost_c, successor_cost_t = self.graph.get_weight(current_vertex, successor)
+                self._pulse_vertex(successor, cumulative_c+successor_cost_c, cumulative_t+successor_cost_t, path,
+                                   on_path, stack, show_by_step)
+
+    def _pulse_vertex(self, current_vertex, cumulative_c, cumulative_t, path, on_path, stack, show_by_step):
+        """
+        Visits current_vertex at the end of path. If it passes every check, it is added to path and its frame is pushed
+        to stack, so its successors are visited next.
+        """
         self.metrics.add_explored_node()
         if current_vertex == self.end_vertex:
-            self._pulse_end(current_vertex, cumulative_c, cumulative_t, current_path)
+            self._pulse_end(current_vertex, cumulative_c, cumulative_t, path)
         else:
-            if not self._isCyclic(current_vertex, current_path):
+            if not self._isCyclic(current_vertex, on_path):
                 if not self._checkNadirPoint(current_vertex, cumulative_c, cumulative_t):
                     if not self._checkEfficientSet(current_vertex, cumulative_c, cumulative_t):
                         if not self._checkLabels(current_vertex, cumulative_c, cumulative_t):
@@ -110,43 +151,26 @@ class PULSE(Algorithm):
                                                      close=self.labels.keys())
 
                             self._store(current_vertex, cumulative_c, cumulative_t)
-                            new_path = list(current_path)
-                            new_path.append(current_vertex)
-                            new_path = tuple(new_path)
-                            for successor in successors:
-                                successor_cost_c, successor_cost_t = self.graph.get_weight(current_vertex, successor)
-                                self._pulse(successor, cumulative_c+successor_cost_c, cumulative_t+successor_cost_t, new_path, show_by_step)
+                            path.append(current_vertex)
+                            on_path.add(current_vertex)
+                            stack.append((current_vertex, cumulative_c, cumulative_t, iter(successors)))
 
     def _pulse_end(self, current_vertex, cumulative_c, cumulative_t, current_path):
         if not self._checkEfficientSet(current_vertex, cumulative_c, cumulative_t):
-            new_path = list(current_path)
-            new_path.append(current_vertex)
-            new_path = tuple(new_path)
+            new_path = tuple(current_path) + (current_vertex,)
             self._updateEfficientSet(cumulative_c, cumulative_t, new_path)
 
     def _isCyclic(self, vertex, path):
         return vertex in path
 
     def _checkNadirPoint(self, vertex, cumulative_c, cumulative_t):
-        try:
-            if vertex in self.min_c_cost:
-                c_min = self.min_c_cost[vertex]
-            else:
-                c_min = self.inverse_c_sol.get_solution(vertex)[0].get_path_cost(start=self.end_vertex, end=vertex)[0]
-                self.min_c_cost[vertex] = c_min
-
-            if vertex in self.min_t_cost:
-                t_min = self.min_t_cost[vertex]
-            else:
-                t_min = self.inverse_t_sol.get_solution(vertex)[0].get_path_cost(start=self.end_vertex, end=vertex)[1]
-                self.min_t_cost[vertex] = t_min
-
-            C,T = self.nadir_point
-        except Exception as ex:
+        vertex_id = self.vertex_ids[vertex]
+        if self.unreachable[vertex_id]:
             return True
 
-        c_max = C - c_min
-        t_max = T - t_min
+        C, T = self.nadir_point
+        c_max = C - self.min_c_cost[vertex_id]
+        t_max = T - self.min_t_cost[vertex_id]
 
         if cumulative_c > c_max or cumulative_t > t_max:
             return True
@@ -154,42 +178,21 @@ class PULSE(Algorithm):
             return False
 
     def _checkEfficientSet(self, vertex, cumulative_c, cumulative_t):
-        try:
-            if vertex in self.min_c_cost:
-                c_min = self.min_c_cost[vertex]
-            else:
-                c_min = self.inverse_c_sol.get_solution(vertex)[0].get_path_cost(start=self.end_vertex, end=vertex)[0]
-                self.min_c_cost[vertex] = c_min
-
-            if vertex in self.min_t_cost:
-                t_min = self.min_t_cost[vertex]
-            else:
-                t_min = self.inverse_t_sol.get_solution(vertex)[0].get_path_cost(start=self.end_vertex, end=vertex)[1]
-                self.min_t_cost[vertex] = t_min
-
-        except Exception as ex:
+        vertex_id = self.vertex_ids[vertex]
+        if self.unreachable[vertex_id]:
             return True
 
-        my_solution = (cumulative_c + c_min, cumulative_t + t_min)
-        for solution in self.check_solutions.values():
-            if self.is_dominated(my_solution, solution):
-                return True
-        return False
+        my_solution = (cumulative_c + self.min_c_cost[vertex_id], cumulative_t + self.min_t_cost[vertex_id])
+        return self.is_dominated(my_solution, list(self.check_solutions.values()))
 
     def _updateEfficientSet(self, c, t, new_path):
-        updated_x = dict()
-        for path, costs in self.check_solutions.items():
-            if not self.is_dominated(costs, (c,t)):
-                updated_x.update({path: costs})
+        updated_x = {path: costs for path, costs in self.check_solutions.items()
+                     if not Dominance.dominates((c, t), costs)}
         updated_x.update({new_path: (c, t)})
         self.check_solutions = updated_x
 
     def _checkLabels(self, vertex, cumulative_c, cumulative_t):
-        current_labels = self.labels.get(vertex, list())
-        for cost in current_labels:
-            if self.is_dominated((cumulative_c, cumulative_t), cost):
-                return True
-        return False
+        return self.is_dominated((cumulative_c, cumulative_t), self.labels.get(vertex, list()))
 
     def _store(self, vertex, cumulative_c, cumulative_t):
         new_sol = (cumulative_c, cumulative_t)
@@ -205,56 +208,10 @@ class PULSE(Algorithm):
         :param tuple or list costs2:
         :return:
         """
-        # Edge case: one or both of them is Infinity
-        if (isinstance(costs1, tuple) or isinstance(costs1, list)) and costs2 == float('inf'):
-            return False
-        elif (isinstance(costs2, tuple) or isinstance(costs2, list)) and costs1 == float('inf'):
-            return True
-        elif costs1 == float('inf') and costs2 == float('inf'):
-            return False
-        elif len(costs2) == 0:
-            return False
-        elif len(costs1) == 0:
-            return True
-
-        if not isinstance(costs1, list):
-            costs1 = [costs1]
-        if not isinstance(costs2, list):
-            costs2 = [costs2]
-
-        for sublist2 in costs2:
-            dominance = True
-            for sublist1 in costs1:
-                check_dm = self._check_dominance(sublist1, sublist2)
-                if not check_dm:
-                    dominance = False
-            if dominance:
-                return True
-        return False
-
-    def _check_dominance(self, costs1, costs2):
-        if len(costs1) != len(costs2):
-            raise ValueError(f"Error, both costs must have the same size, but cost1:{costs1} and cost2:{costs2} have different sizes")
-
-        as_good = True
-        is_better = False
-
-        c1, t1 = costs1[0], costs1[1]
-        c2, t2 = costs2[0], costs2[1]
-        if c2 > c1 or t2 > t1:
-            as_good = False  # List2 is worse than List1
-
-        if c2 < c1 or t2 < t1:
-            is_better = True  # List2 is better than Cost1
-
-        return as_good and is_better
+        return Dominance.is_dominated(costs1, costs2)
 
     def _get_nd_subset(self, elements):
-        subset = list()
-        for elem in elements:
-            if not self.is_dominated(elem, elements):
-                subset.append(elem)
-        return subset
+        return Dominance.non_dominated(elements)
 
     def _substract_costs(self, list1, list2):
         if len(list1) != len(list2):
@@ -0,0 +1,155 @@
+import copy
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from Algorithms import Dominance
+from Algorithms.PULSE import PULSE
+from Graphs.Graph import Graph
+from Solution.Solution import Solution
+from Visualizers.ConsoleVisualizer import ConsoleVisualizer
+
+# Number of partial paths the search is split into for every worker, so that workers that finish early get more work
+TASKS_PER_WORKER = 4
+
+_worker = None      # ParallelPULSE instance of the worker process
+
+
+def _init_worker(pulse, incumbents):
+    """
+    Initializes a worker process with its own copy of the algorithm and the list of solution costs shared by all the
+    workers.
+    :param ParallelPULSE pulse:
+    :param incumbents: shared list of the solution costs found by any worker.
+    :return:
+    """
+    global _worker
+    _worker = pulse
+    _worker.shared_incumbents = incumbents
+
+
+def _pulse_subtree(task):
+    """
+    Sends a pulse along a partial path in the worker process, and returns the efficient set of the worker and the
+    number of vertices explored.
+    :param tuple task: (vertex, cumulative_c, cumulative_t, path) of the partial path.
+    :return:
+    """
+    vertex, cumulative_c, cumulative_t, path = task
+    explored = _worker.metrics.nodes_explored
+    _worker._pulse_from(vertex, False, cumulative_c, cumulative_t, path)
+    _worker._exchange_solutions()
+    return dict(_worker.check_solutions), _worker.metrics.nodes_explored - explored
+
+
+class ParallelPULSE(PULSE):
+    """
+    PULSE algorithm that sends the pulses in parallel. The paths from the start vertex are expanded breadth-first
+    until there are enough partial paths to keep every worker busy, and the depth-first search from each of them is
+    run in a pool of processes. Every worker keeps its own labels and efficient set, and periodically publishes its
+    solution costs to a list shared by all of them, so that the solutions found by a worker also prune the search of
+    the others. The efficient sets of the workers are merged once all of them are done.
+    """
+
+    def __init__(self, graph: Graph, visualizer=ConsoleVisualizer(), n_workers=None, exchange_interval=1000):
+        """
+        :param Graph graph: input graph containing the data.
+        :param Visualizer visualizer: visualizer implementation to visualize the graphs. By default: ConsoleVisualizer.
+        :param int n_workers: number of worker processes. By default, the number of CPUs. With a single worker, the
+        search runs in the current process, as in PULSE.
+        :param int exchange_interval: number of vertices a worker explores between two exchanges of solutions.
+        """
+        super().__init__(graph, visualizer)
+        self.n_workers = n_workers if n_workers is not None else os.cpu_count()
+        self.exchange_interval = exchange_interval
+        self.incumbents, self.shared_incumbents, self._published, self._visits = list(), None, set(), 0
+
+    def _pulse(self, start_vertex, show_by_step, cumulative_c=0, cumulative_t=0, path=()):
+        """
+        Splits the search from start_vertex into partial paths and sends a pulse along each of them in a pool of
+        worker processes.
+        :param start_vertex:
+        :param bool show_by_step: only used while the partial paths are expanded in the current process.
+        :return:
+        """
+        if self.n_workers <= 1:
+            self._pulse_from(start_vertex, show_by_step, cumulative_c, cumulative_t, path)
+            return
+
+        tasks = self._split(start_vertex, cumulative_c, cumulative_t, tuple(path), show_by_step)
+        if len(tasks) == 0:
+            return
+
+        with multiprocessing.Manager() as manager:
+            incumbents = manager.list(self.check_solutions.values())
+            with ProcessPoolExecutor(max_workers=min(self.n_workers, len(tasks)), initializer=_init_worker,
+                                     initargs=(self._worker_copy(), incumbents)) as executor:
+                for solutions, explored in executor.map(_pulse_subtree, tasks):
+                    self.metrics.add_explored_node(explored)
+                    for new_path, (c, t) in solutions.items():
+                        if new_path not in self.check_solutions and \
+                                not self.is_dominated((c, t), list(self.check_solutions.values())):
+                            self._updateEfficientSet(c, t, new_path)
+
+    def _split(self, start_vertex, cumulative_c, cumulative_t, path, show_by_step):
+        """
+        Expands the paths from start_vertex breadth-first, with the same checks as the depth-first search, until there
+        are TASKS_PER_WORKER partial paths per worker or no path can be expanded. Solutions found on the way are added
+        to the efficient set.
+        :return: list of (vertex, cumulative_c, cumulative_t, path) partial paths that still have to be explored.
+        """
+        tasks = [(start_vertex, cumulative_c, cumulative_t, path)]
+        while 0 < len(tasks) < self.n_workers * TASKS_PER_WORKER:
+            next_tasks = list()
+            for vertex, cumulative_c, cumulative_t, path in tasks:
+                stack = list()
+                self._pulse_vertex(vertex, cumulative_c, cumulative_t, list(path), set(path), stack, show_by_step)
+                if len(stack) > 0:      # vertex passed every check, so its successors have to be explored
+                    new_path = path + (vertex,)
+                    for successor in stack[0][3]:
+                        successor_cost_c, successor_cost_t = self.graph.get_weight(vertex, successor)
+                        next_tasks.append((successor, cumulative_c+successor_cost_c, cumulative_t+successor_cost_t,
+                                           new_path))
+            tasks = next_tasks
+        return tasks
+
+    def _worker_copy(self):
+        """
+        Returns a copy of the algorithm to send to the worker processes, without the visualizer and the solutions.
+        :return:
+        """
+        worker = copy.copy(self)
+        worker.visualizer, worker.solution = None, Solution()
+        worker.labels = {vertex: list(labels) for vertex, labels in self.labels.items()}
+        worker.check_solutions = dict(self.check_solutions)
+        return worker
+
+    def _pulse_vertex(self, current_vertex, cumulative_c, cumulative_t, path, on_path, stack, show_by_step):
+        """
+        Visits current_vertex as in PULSE, exchanging the solutions with the other workers every exchange_interval
+        vertices.
+        """
+        self._visits += 1
+        if self.shared_incumbents is not None and self._visits % self.exchange_interval == 0:
+            self._exchange_solutions()
+        super()._pulse_vertex(current_vertex, cumulative_c, cumulative_t, path, on_path, stack, show_by_step)
+
+    def _exchange_solutions(self):
+        """
+        Publishes the solution costs of this worker that have not been published yet, and keeps the non dominated
+        costs published by every worker as incumbents.
+        :return:
+        """
+        new_costs = [costs for costs in self.check_solutions.values() if costs not in self._published]
+        if len(new_costs) > 0:
+            self.shared_incumbents.extend(new_costs)
+            self._published.update(new_costs)
+        self.incumbents = Dominance.non_dominated(list(self.shared_incumbents))
+
+    def _checkEfficientSet(self, vertex, cumulative_c, cumulative_t):
+        if super()._checkEfficientSet(vertex, cumulative_c, cumulative_t):
+            return True
+
+        vertex_id = self.vertex_ids[vertex]
+        my_solution = (cumulative_c + self.min_c_cost[vertex_id], cumulative_t + self.min_t_cost[vertex_id])
+        return self.is_dominated(my_solution, self.incumbents)
@@ -0,0 +1,345 @@
+import numpy as np
+import pandas as pd
+
+
+class AdjacencyIndex:
+    """
+    Compressed Sparse Row (CSR) index over the edges of a graph. Vertices are interned to dense integer ids, and the
+    outgoing (and incoming) edges of every vertex are stored contiguously, so successors, predecessors and weights are
+    answered by slicing arrays instead of scanning the whole edge table.
+
+    Edges keep the order in which they were added (the row order of the edge table), and every lookup returns them in
+    that order. Edges added after the index was built are kept in a small append buffer, which is merged into the CSR
+    arrays once it grows large enough.
+    """
+
+    def __init__(self, sources=(), targets=(), weights=None, n_weights=0):
+        """
+        Builds the index from parallel sequences of source vertices, target vertices and edge weights.
+        :param sources: source vertex of every edge.
+        :param targets: target vertex of every edge.
+        :param weights: 2D array-like with one row per edge and one column per weight. None if there are no edges.
+        :param int n_weights: number of weights of every edge.
+        """
+        self.n_weights = n_weights
+        self._ids = dict()
+        self._labels = list()
+
+        src = self._intern_all(sources)
+        tgt = self._intern_all(targets)
+        if weights is None or len(src) == 0:
+            weights = np.empty((len(src), n_weights))
+        self._build(src, tgt, np.asarray(weights).reshape(len(src), n_weights))
+
+    @classmethod
+    def from_dataframe(cls, data, source_col, target_col, weight_cols):
+        """
+        Builds the index from a pandas DataFrame containing one edge per row.
+        :param pd.DataFrame data: edge table.
+        :param str source_col: column name for the source vertices.
+        :param str target_col: column name for the target vertices.
+        :param list weight_cols: list of column names for the edge weights.
+        :return:
+        """
+        weight_cols = list(weight_cols)
+        if data.empty or source_col not in data.columns:
+            return cls(n_weights=len(weight_cols))
+
+        return cls(sources=data[source_col], targets=data[target_col], weights=data[weight_cols].to_numpy(),
+                   n_weights=len(weight_cols))
+
+    @classmethod
+    def from_ids(cls, labels, sources, targets, weights):
+        """
+        Builds the index from edges whose vertices are already interned.
+        :param list labels: label of every vertex id.
+        :param np.ndarray sources: source vertex id of every edge.
+        :param np.ndarray targets: target vertex id of every edge.
+        :param np.ndarray weights: 2D array with one row per edge and one column per weight.
+        :return:
+        """
+        index = cls(n_weights=weights.shape[1])
+        index._labels = list(labels)
+        index._ids = {label: vertex_id for vertex_id, label in enumerate(index._labels)}
+        index._build(sources, targets, weights)
+        return index
+
+    def _intern_all(self, vertices):
+        """
+        Converts a sequence of vertex labels into an array of vertex ids, registering the unknown labels.
+        :param vertices:
+        :return:
+        """
+        if len(vertices) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        codes, uniques = pd.factorize(pd.Series(vertices, dtype=object) if not isinstance(vertices, pd.Series)
+                                      else vertices)
+        mapping = np.array([self._intern(label) for label in uniques.tolist()], dtype=np.int64)
+        return mapping[codes]
+
+    def _intern(self, vertex):
+        """
+        Returns the id of a vertex, registering it if it is not known yet.
+        :param vertex:
+        :return:
+        """
+        vertex_id = self._ids.get(vertex)
+        if vertex_id is None:
+            vertex_id = len(self._labels)
+            self._ids[vertex] = vertex_id
+            self._labels.append(vertex)
+        return vertex_id
+
+    def _build(self, src, tgt, weights):
+        """
+        Creates the CSR arrays from the edge arrays. The sort is stable so that the edges of every vertex keep the
+        order in which they were added.
+        """
+        n_vertices = len(self._labels)
+        self._src, self._tgt, self._weights = src, tgt, weights
+        self._n_base_vertices = n_vertices
+
+        self._out_edges = np.argsort(src, kind='stable')
+        self._out_offsets = np.zeros(n_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n_vertices), out=self._out_offsets[1:])
+
+        self._in_edges = np.argsort(tgt, kind='stable')
+        self._in_offsets = np.zeros(n_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tgt, minlength=n_vertices), out=self._in_offsets[1:])
+
+        self._pending_src, self._pending_tgt, self._pending_weights = list(), list(), list()
+        self._pending_out, self._pending_in = dict(), dict()
+
+    def _compact(self):
+        """
+        Merges the edges in the append buffer into the CSR arrays.
+        """
+        if len(self._pending_src) == 0:
+            return
+
+        src = np.concatenate([self._src, np.array(self._pending_src, dtype=np.int64)])
+        tgt = np.concatenate([self._tgt, np.array(self._pending_tgt, dtype=np.int64)])
+        pending_weights = np.array(self._pending_weights).reshape(len(self._pending_weights), self.n_weights)
+        if len(self._weights) == 0:
+            weights = pending_weights       # Keep the dtype of the added weights when the index was empty
+        else:
+            weights = np.concatenate([self._weights, pending_weights])
+        self._build(src, tgt, weights)
+
+    def __len__(self):
+        """
+        Returns the number of edges in the index.
+        :return:
+        """
+        return len(self._src) + len(self._pending_src)
+
+    @property
+    def labels(self):
+        """
+        List with the label of every vertex id.
+        """
+        return self._labels
+
+    def edge_arrays(self):
+        """
+        Returns the source ids, target ids and weights of every edge, in the order they were added.
+        :return:
+        """
+        self._compact()
+        return self._src, self._tgt, self._weights
+
+    def vertex_id(self, vertex):
+        """
+        Returns the integer id of a vertex, or None if the vertex is not in the index.
+        :param vertex:
+        :return:
+        """
+        return self._ids.get(vertex)
+
+    def vertex_label(self, vertex_id):
+        """
+        Returns the label of the vertex with the given id.
+        :param int vertex_id:
+        :return:
+        """
+        return self._labels[vertex_id]
+
+    def _out_positions(self, vertex_id):
+        """
+        Returns the positions of the outgoing edges of a vertex: an array for the CSR part and a list for the buffer.
+        """
+        if vertex_id < self._n_base_vertices:
+            base = self._out_edges[self._out_offsets[vertex_id]:self._out_offsets[vertex_id + 1]]
+        else:
+            base = self._out_edges[:0]
+        return base, self._pending_out.get(vertex_id, ())
+
+    def _in_positions(self, vertex_id):
+        """
+        Returns the positions of the incoming edges of a vertex: an array for the CSR part and a list for the buffer.
+        """
+        if vertex_id < self._n_base_vertices:
+            base = self._in_edges[self._in_offsets[vertex_id]:self._in_offsets[vertex_id + 1]]
+        else:
+            base = self._in_edges[:0]
+        return base, self._pending_in.get(vertex_id, ())
+
+    def successors(self, vertex):
+        """
+        Returns the list of successors of a vertex, in the order their edges were added.
+        :param vertex:
+        :return:
+        """
+        vertex_id = self._ids.get(vertex)
+        if vertex_id is None:
+            return list()
+
+        base, pending = self._out_positions(vertex_id)
+        n_base, labels = len(self._src), self._labels
+        res = [labels[target] for target in self._tgt[base].tolist()]
+        res.extend(labels[self._pending_tgt[position - n_base]] for position in pending)
+        return res
+
+    def predecessors(self, vertex):
+        """
+        Returns the list of predecessors of a vertex, in the order their edges were added.
+        :param vertex:
+        :return:
+        """
+        vertex_id = self._ids.get(vertex)
+        if vertex_id is None:
+            return list()
+
+        base, pending = self._in_positions(vertex_id)
+        n_base, labels = len(self._src), self._labels
+        res = [labels[source] for source in self._src[base].tolist()]
+        res.extend(labels[self._pending_src[position - n_base]] for position in pending)
+        return res
+
+    def successor_weights(self, vertex):
+        """
+        Returns a list of (successor, weights) pairs, one per outgoing edge of a vertex, in the order the edges were
+        added. It answers get_successors and get_weight for every successor with a single slice of the index.
+        :param vertex:
+        :return:
+        """
+        vertex_id = self._ids.get(vertex)
+        if vertex_id is None:
+            return list()
+
+        base, pending = self._out_positions(vertex_id)
+        n_base, labels = len(self._src), self._labels
+        res = [(labels[target], weights) for target, weights in zip(self._tgt[base].tolist(),
+                                                                     self._weights[base].tolist())]
+        res.extend((labels[self._pending_tgt[position - n_base]], list(self._pending_weights[position - n_base]))
+                   for position in pending)
+        return res
+
+    def predecessor_weights(self, vertex):
+        """
+        Returns a list of (predecessor, weights) pairs, one per incoming edge of a vertex, in the order the edges were
+        added.
+        :param vertex:
+        :return:
+        """
+        vertex_id = self._ids.get(vertex)
+        if vertex_id is None:
+            return list()
+
+        base, pending = self._in_positions(vertex_id)
+        n_base, labels = len(self._src), self._labels
+        res = [(labels[source], weights) for source, weights in zip(self._src[base].tolist(),
+                                                                     self._weights[base].tolist())]
+        res.extend((labels[self._pending_src[position - n_base]], list(self._pending_weights[position - n_base]))
+                   for position in pending)
+        return res
+
+    def edge_position(self, source, target):
+        """
+        Returns the position of the first edge from source to target, or None if there is no such edge.
+        :param source:
+        :param target:
+        :return:
+        """
+        source_id, target_id = self._ids.get(source), self._ids.get(target)
+        if source_id is None or target_id is None:
+            return None
+
+        base, pending = self._out_positions(source_id)
+        matches = base[self._tgt[base] == target_id]
+        if len(matches) > 0:
+            return int(matches[0])
+
+        n_base = len(self._src)
+        for position in pending:
+            if self._pending_tgt[position - n_base] == target_id:
+                return position
+        return None
+
+    def weight(self, source, target):
+        """
+        Returns the weights of the first edge from source to target. If there is no such edge, returns an empty list.
+        :param source:
+        :param target:
+        :return:
+        """
+        position = self.edge_position(source, target)
+        if position is None:
+            return list()
+        elif position < len(self._src):
+            return self._weights[position].tolist()
+        else:
+            return list(self._pending_weights[position - len(self._src)])
+
+    def add_edge(self, source, target, weights=list()):
+        """
+        Appends an edge from source to target at the end of the index.
+        :param source: source vertex.
+        :param target: target vertex.
+        :param list weights: weights of the edge.
+        :return:
+        """
+        source_id, target_id = self._intern(source), self._intern(target)
+        position = len(self)
+
+        self._pending_src.append(source_id)
+        self._pending_tgt.append(target_id)
+        self._pending_weights.append(list(weights))
+        self._pending_out.setdefault(source_id, list()).append(position)
+        self._pending_in.setdefault(target_id, list()).append(position)
+
+        if len(self._pending_src) > max(1024, len(self._src) // 8):
+            self._compact()
+
+    def remove_edge(self, source, target):
+        """
+        Removes every edge from source to target, and returns their positions (sorted) before the removal.
+        :param source: source vertex.
+        :param target: target vertex.
+        :return:
+        """
+        source_id, target_id = self._ids.get(source), self._ids.get(target)
+        if source_id is None or target_id is None:
+            return np.empty(0, dtype=np.int64)
+
+        self._compact()
+        base, _ = self._out_positions(source_id)
+        removed = np.sort(base[self._tgt[base] == target_id])
+        if len(removed) > 0:
+            keep = np.ones(len(self._src), dtype=bool)
+            keep[removed] = False
+            self._build(self._src[keep], self._tgt[keep], self._weights[keep])
+        return removed
+
+    def vertices(self):
+        """
+        Returns a set containing every vertex that has at least one edge.
+        :return:
+        """
+        active = np.zeros(len(self._labels), dtype=bool)
+        active[self._src] = True
+        active[self._tgt] = True
+        active[self._pending_src] = True
+        active[self._pending_tgt] = True
+        return {self._labels[vertex_id] for vertex_id in np.flatnonzero(active).tolist()}
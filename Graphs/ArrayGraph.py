@@ -0,0 +1,297 @@
+import numpy as np
+import pandas as pd
+
+from Graphs.Graph import Graph
+from Graphs.AdjacencyIndex import AdjacencyIndex
+
+
+class ArrayGraph(Graph):
+    """
+    Graph stored in NumPy arrays instead of a DataFrame. Vertex labels are interned to dense integer ids and the edges
+    are kept in contiguous arrays (an AdjacencyIndex), which makes it a compact representation for graphs with
+    millions of edges. It exposes the same attributes and methods as PandasGraph, so any algorithm can run on it.
+    """
+
+    def __init__(self, sources=(), targets=(), weights=None, source_col='source', target_col='target',
+                 weight_cols=list(), bidirectional=False):
+        """
+        This method loads the edges that represent the Graph.
+        :param sources: source vertex of every edge.
+        :param targets: target vertex of every edge.
+        :param weights: 2D array-like with one row per edge and one column per weight column.
+        :param str source_col: column name for the source vertices.
+        :param str target_col: column name for the target vertices.
+        :param list weight_cols: list of columns names for the vertices weights.
+        :param boolean bidirectional: if True, all edges work both ways.
+        """
+        super().__init__()
+        self.source_col = source_col
+        self.target_col = target_col
+        self.bidirectional = bidirectional
+        self._stored_cols = list(weight_cols) if isinstance(weight_cols, list) or isinstance(weight_cols, set) \
+            else [weight_cols]
+        self.weight_cols = list(self._stored_cols)
+
+        if weights is not None:
+            weights = np.asarray(weights).reshape(len(sources), len(self._stored_cols))
+        if bidirectional and len(sources) > 0:
+            sources, targets = list(sources) + list(targets), list(targets) + list(sources)
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+        self._index = AdjacencyIndex(sources, targets, weights, n_weights=len(self._stored_cols))
+        self._shared = False
+
+    @classmethod
+    def from_dataframe(cls, data, source_col='source', target_col='target', weight_cols=list(), bidirectional=False):
+        """
+        Creates an ArrayGraph from a pandas DataFrame with the same layout used by PandasGraph.
+        :param pd.DataFrame data: pandas DataFrame containing the graph details.
+        :param str source_col: column name for the source vertices.
+        :param str target_col: column name for the target vertices.
+        :param list weight_cols: list of columns names for the vertices weights.
+        :param boolean bidirectional: if True, all edges work both ways.
+        :return:
+        """
+        weight_cols = weight_cols if isinstance(weight_cols, list) or isinstance(weight_cols, set) else [weight_cols]
+        if data.empty:
+            return cls(source_col=source_col, target_col=target_col, weight_cols=weight_cols,
+                       bidirectional=bidirectional)
+        return cls(data[source_col], data[target_col], data[list(weight_cols)].to_numpy(), source_col=source_col,
+                   target_col=target_col, weight_cols=weight_cols, bidirectional=bidirectional)
+
+    @classmethod
+    def _from_index(cls, index, stored_cols, template):
+        """
+        Creates an ArrayGraph around an existing index, copying the attributes of template.
+        """
+        graph = cls(source_col=template.source_col, target_col=template.target_col, weight_cols=stored_cols,
+                    bidirectional=False)
+        graph.bidirectional = template.bidirectional
+        graph._index = index
+        graph.weight_cols = list(template.weight_cols)
+        return graph
+
+    def _detach(self):
+        """
+        If the index is shared with a copy of the graph, makes a private copy of it before it is modified.
+        :return:
+        """
+        if self._shared:
+            src, tgt, weights = self._index.edge_arrays()
+            self._index = AdjacencyIndex.from_ids(self._index.labels, src.copy(), tgt.copy(), weights.copy())
+            self._shared = False
+
+    def _empty_like(self):
+        """
+        Returns an empty, not bidirectional, graph with the same columns as this one.
+        """
+        return ArrayGraph(source_col=self.source_col, target_col=self.target_col, weight_cols=self.weight_cols,
+                          bidirectional=False)
+
+    @property
+    def weight_cols(self):
+        """
+        List of column names for the edge weights returned by get_weight. It can be any subset of the weight columns
+        the graph was created with.
+        """
+        return self._weight_cols
+
+    @weight_cols.setter
+    def weight_cols(self, weight_cols):
+        weight_cols = list(weight_cols) if isinstance(weight_cols, list) or isinstance(weight_cols, set) \
+            else [weight_cols]
+        missing = [col for col in weight_cols if col not in self._stored_cols]
+        if len(missing) > 0:
+            raise ValueError(f'The weights columns {missing} are not part of the graph columns {self._stored_cols}')
+
+        self._weight_cols = weight_cols
+        positions = [self._stored_cols.index(col) for col in weight_cols]
+        self._weight_positions = None if positions == list(range(len(self._stored_cols))) else positions
+
+    @property
+    def data(self):
+        """
+        pandas DataFrame with the edges of the graph, one per row. It is created on every access, so it should only
+        be used to visualize or export the graph.
+        """
+        src, tgt, weights = self._index.edge_arrays()
+        if len(src) == 0:
+            return pd.DataFrame()
+
+        labels = self._index.labels
+        data = {self.source_col: [labels[vertex] for vertex in src.tolist()],
+                self.target_col: [labels[vertex] for vertex in tgt.tolist()]}
+        for position, weight_col in enumerate(self._stored_cols):
+            data[weight_col] = weights[:, position].tolist()
+        return pd.DataFrame(data=data)
+
+    def add_edge(self, source, target, weights=list()):
+        """
+        Add an edge from source to target to the graph. Optionally, a dict of weights can be added to the edge.
+        :param str source: source vertex.
+        :param str target:  target vertex.
+        :param list weights: dict where keys are weight column names and values are the actual weights.
+        :return:
+        """
+        if len(self._stored_cols) != len(weights):
+            raise ValueError(f'The weights columns are {self._stored_cols}, but the weights added were {weights}, '
+                             f'which doesnt align with the number of columns')
+
+        self._detach()
+        self._index.add_edge(source, target, weights)
+        if self.bidirectional:
+            self._index.add_edge(target, source, weights)
+
+    def remove_edge(self, source, target):
+        """
+        Remove the edge between source and target vertices, if it exists.
+        :param str source: source vertex.
+        :param str target:  target vertex.
+        :return:
+        """
+        self._detach()
+        self._index.remove_edge(source, target)
+        if self.bidirectional:
+            self._index.remove_edge(target, source)
+
+    def get_weight(self, source, target):
+        """
+        Returns the weights of the edge between source vertex and target vertex. If there is no connection, returns an
+        empty dictionary.
+        :param str source: source vertex of the edge.
+        :param str target: target vertex of the edge.
+        :return:
+        """
+        if len(self.weight_cols) == 0:
+            return list()
+
+        weight = self._index.weight(source, target)
+        if len(weight) == 0 or self._weight_positions is None:
+            return weight
+        return [weight[position] for position in self._weight_positions]
+
+    def get_predecessors(self, vertex):
+        """
+        Get the predecessors of a given vertex.
+        :param str vertex:
+        :return:
+        """
+        return self._index.predecessors(vertex)
+
+    def get_successors(self, vertex):
+        """
+        Get the successors of a given vertex.
+        :param str vertex:
+        :return:
+        """
+        return self._index.successors(vertex)
+
+    def get_successor_weights(self, vertex):
+        """
+        Returns a list of (successor, weights) pairs, one per outgoing edge of vertex.
+        :param str vertex:
+        :return:
+        """
+        return self._select_weights(self._index.successor_weights(vertex))
+
+    def get_predecessor_weights(self, vertex):
+        """
+        Returns a list of (predecessor, weights) pairs, one per incoming edge of vertex.
+        :param str vertex:
+        :return:
+        """
+        return self._select_weights(self._index.predecessor_weights(vertex))
+
+    def _select_weights(self, neighbour_weights):
+        """
+        Keeps, in a list of (vertex, weights) pairs, only the weights of the columns in weight_cols.
+        """
+        if self._weight_positions is None:
+            return neighbour_weights
+        return [(vertex, [weights[position] for position in self._weight_positions])
+                for vertex, weights in neighbour_weights]
+
+    def get_all_vertices(self):
+        """
+        Returns a set containing all the vertices in the graph.
+        :return:
+        """
+        return self._index.vertices()
+
+    def get_path_cost(self, start, end):
+        """
+        Returns the cost of traversing from start to end.
+        :param start: start vertex
+        :param end: end vertex
+        :return:
+        """
+        cost = [0 for weight in self.weight_cols]
+        node = end
+        while node != start:
+            predecessor = self.get_predecessors(node)[0]
+            weight = self.get_weight(predecessor, node)
+            for index, value in enumerate(weight):
+                cost[index] += value
+            node = predecessor
+        return cost
+
+    def get_path_uninformed(self, start, end):
+        """
+        Returns the path between start and end, by traversing the graph from end to start.
+        :param start: start vertex
+        :param end: end vertex
+        :return:
+        """
+        path = self._empty_like()
+        node = end
+        while node != start:
+            predecessor = self.get_predecessors(node)[0]
+            weight = self.get_weight(predecessor, node)
+            path.add_edge(source=predecessor, target=node, weights=weight)
+            node = predecessor
+        return path
+
+    def get_path_informed(self, start, end, prev):
+        """
+        This method returns a Graph representing the path between start and end vertices. To achieve this, a dictionary
+        "prev" must be passed where keys are vertices and their values are the vertex that proceeds them. Only a single
+        vertex can precede a vertex.
+        :param start:
+        :param end:
+        :param prev:
+        :return:
+        """
+        path = self._empty_like()
+        current = end
+        while True:
+            source = prev[current]
+            path.add_edge(source=source, target=current, weights=self.get_weight(source=source, target=current))
+            if source == start:
+                return path
+            current = source
+
+    def get_inverse_graph(self):
+        """
+        Returns a copy of the graph but the edges have been inverted.
+        :return:
+        """
+        src, tgt, weights = self._index.edge_arrays()
+        index = AdjacencyIndex.from_ids(self._index.labels, tgt.copy(), src.copy(), weights.copy())
+        return ArrayGraph._from_index(index, self._stored_cols, self)
+
+    def copy(self):
+        """
+        Returns a copy of the graph. The copy shares the edge arrays with this graph until one of them adds or removes
+        an edge, so copying a graph that is only going to be read is cheap.
+        :return:
+        """
+        copy = ArrayGraph._from_index(self._index, self._stored_cols, self)
+        copy._shared = self._shared = True
+        return copy
+
+    def show(self):
+        """
+        This method prints in the console the current state of the Graph.
+        :return:
+        """
+        print(self.data)
@@ -24,6 +24,15 @@ class Graph:
         """
         pass
 
+    def add_edges(self, edges):
+        """
+        Add several edges to the graph at once.
+        :param list edges: list of (source, target, weights) tuples, where weights is a list as in add_edge.
+        :return:
+        """
+        for source, target, weights in edges:
+            self.add_edge(source, target, weights)
+
     @abstractmethod
     def remove_edge(self, source, target):
         """
@@ -63,6 +72,24 @@ class Graph:
         """
         pass
 
+    def get_successor_weights(self, vertex):
+        """
+        Returns a list of (successor, weights) pairs with the successors of a vertex and the weights of the edges that
+        reach them.
+        :param str vertex:
+        :return:
+        """
+        return [(successor, self.get_weight(vertex, successor)) for successor in self.get_successors(vertex)]
+
+    def get_predecessor_weights(self, vertex):
+        """
+        Returns a list of (predecessor, weights) pairs with the predecessors of a vertex and the weights of the edges
+        that leave them.
+        :param str vertex:
+        :return:
+        """
+        return [(predecessor, self.get_weight(predecessor, vertex)) for predecessor in self.get_predecessors(vertex)]
+
     @abstractmethod
     def get_all_vertices(self):
         """
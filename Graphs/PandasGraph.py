@@ -1,11 +1,18 @@
 import pandas as pd
 
 from Graphs.Graph import Graph
+from Graphs.AdjacencyIndex import AdjacencyIndex
 
 
 class PandasGraph(Graph):
     """
     This is the base class to represent a Graph.
+
+    Lookups (successors, predecessors and weights) are answered from an AdjacencyIndex built from the DataFrame the
+    first time it is needed, and kept in sync by add_edge and remove_edge. Added edges are buffered and appended to the
+    DataFrame in a single concat the next time data is read. Reassigning data or weight_cols rebuilds the
+    index; if the DataFrame is modified in place, call rebuild_index afterwards. Copies made with copy share the
+    DataFrame, so it should not be modified in place on a graph that has been copied.
     """
 
     def __init__(self, data, source_col='source', target_col='target', weight_cols=list(), bidirectional=False):
@@ -18,6 +25,9 @@ class PandasGraph(Graph):
         :param boolean bidirectional: if True, all edges work both ways.
         """
         super().__init__()
+        self._index = None
+        self._pending_rows = list()
+        self._shared = False
         self.data = data
         self.source_col = source_col
         self.target_col = target_col
@@ -34,6 +44,64 @@ class PandasGraph(Graph):
             self.data.reset_index(drop=True, inplace=True)
             del bidirectional_df
 
+    @property
+    def data(self):
+        """
+        pandas DataFrame containing the edges of the graph, one per row.
+        """
+        if len(self._pending_rows) > 0:
+            self._data = pd.concat([self._data, pd.DataFrame(data=self._pending_rows)])
+            self._data.reset_index(drop=True, inplace=True)
+            self._pending_rows = list()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+        self._pending_rows = list()
+        self._shared = False
+        self._index = None
+
+    @property
+    def weight_cols(self):
+        """
+        List of column names for the edge weights.
+        """
+        return self._weight_cols
+
+    @weight_cols.setter
+    def weight_cols(self, weight_cols):
+        self._weight_cols = weight_cols
+        self._index = None
+
+    def rebuild_index(self):
+        """
+        Discards the adjacency index, so that it is rebuilt from the DataFrame on the next lookup. Needed after
+        modifying the DataFrame in place.
+        :return:
+        """
+        self._index = None
+
+    def _detach(self):
+        """
+        If the DataFrame and the index are shared with a copy of the graph, makes private copies of them before they
+        are modified.
+        :return:
+        """
+        if self._shared:
+            self._data = self.data.copy(deep=True)
+            self._shared = False
+            self._index = None
+
+    def _get_index(self):
+        """
+        Returns the adjacency index of the graph, building it if needed.
+        :return:
+        """
+        if self._index is None:
+            self._index = AdjacencyIndex.from_dataframe(self.data, self.source_col, self.target_col, self.weight_cols)
+        return self._index
+
     def add_edge(self, source, target, weights=list()):
         """
         Add an edge from source to target to the graph. Optionally, a dict of weights can be added to the edge.
@@ -42,26 +110,40 @@ class PandasGraph(Graph):
         :param list weights: dict where keys are weight column names and values are the actual weights.
         :return:
         """
-        data = {self.source_col: source, self.target_col: target}
+        self.add_edges([(source, target, weights)])
 
-        # Add weights
-        if len(self.weight_cols) != len(weights):
-            raise ValueError(f'The weights columns are {self.weight_cols}, but the weights added were {weights}, '
-                             f'which doesnt align with the number of columns')
-        for weight_col, weight_value in zip(self.weight_cols, weights):
-            data.update({weight_col: weight_value})
+    def add_edges(self, edges):
+        """
+        Add several edges to the graph at once. The new rows are buffered and only appended to the DataFrame the next
+        time it is read, so building a graph edge by edge takes linear time.
+        :param list edges: list of (source, target, weights) tuples, where weights is a list as in add_edge.
+        :return:
+        """
+        rows = list()
+        for source, target, weights in edges:
+            # Add weights
+            if len(self.weight_cols) != len(weights):
+                raise ValueError(f'The weights columns are {self.weight_cols}, but the weights added were {weights}, '
+                                 f'which doesnt align with the number of columns')
+            row = {self.source_col: source, self.target_col: target}
+            for weight_col, weight_value in zip(self.weight_cols, weights):
+                row.update({weight_col: weight_value})
+            rows.append(row)
+
+            # Duplicate edges if bidirectional
+            if self.bidirectional:
+                bidirectional_row = row.copy()
+                bidirectional_row.update({self.source_col: target, self.target_col: source})
+                rows.append(bidirectional_row)
 
-        # Duplicate edges if bidirectional
-        if self.bidirectional:
-            bidirectional_data = data.copy()
-            bidirectional_data.update({self.source_col: data[self.target_col], self.target_col: data[self.source_col]})
-            data = [data, bidirectional_data]
-        else:
-            data = [data]
-        node = pd.DataFrame(data=data)
+        self._detach()
+        self._pending_rows.extend(rows)
 
-        self.data = pd.concat([self.data, node])
-        self.data.reset_index(drop=True, inplace=True)
+        # Keep the index in sync instead of rebuilding it
+        if self._index is not None:
+            for row in rows:
+                self._index.add_edge(row[self.source_col], row[self.target_col],
+                                     [row[weight_col] for weight_col in self.weight_cols])
 
     def remove_edge(self, source, target):
         """
@@ -71,9 +153,23 @@ class PandasGraph(Graph):
         :return:
         """
         if not self.data.empty:
-            self.data.drop(self.data[(self.data[self.source_col] == source) & (self.data[self.target_col] == target)].index, inplace=True)
+            self._detach()
+            self._drop_edge(source, target)
             if self.bidirectional:
-                self.data.drop(self.data[(self.data[self.source_col] == target) & (self.data[self.target_col] == source)].index, inplace=True)
+                self._drop_edge(target, source)
+
+    def _drop_edge(self, source, target):
+        """
+        Removes from the DataFrame and the index the rows of the edges from source to target.
+        :param str source: source vertex.
+        :param str target:  target vertex.
+        :return:
+        """
+        removed = self._get_index().remove_edge(source, target)
+        if len(removed) > 0:
+            self.data.drop(self.data.index[removed], inplace=True)
+            if not self.data.index.is_unique:
+                self._index = None      # Dropping by label may have removed more rows than the index did
 
     def get_weight(self, source, target):
         """
@@ -86,12 +182,7 @@ class PandasGraph(Graph):
         if len(self.weight_cols) == 0:
             return list()
 
-        source = self.data[self.data[self.source_col]==source]
-        source_target = source[source[self.target_col]==target]
-        if source_target.empty:
-            return list()
-        else:
-            return list(source_target[self.weight_cols].iloc[0])
+        return self._get_index().weight(source, target)
 
     def get_predecessors(self, vertex):
         """
@@ -99,10 +190,7 @@ class PandasGraph(Graph):
         :param str vertex:
         :return:
         """
-        try:
-            return list(self.data[self.data[self.target_col] == vertex][self.source_col])
-        except:
-            return list()
+        return self._get_index().predecessors(vertex)
 
     def get_successors(self, vertex):
         """
@@ -110,22 +198,30 @@ class PandasGraph(Graph):
         :param str vertex:
         :return:
         """
-        try:
-            return list(self.data[self.data[self.source_col] == vertex][self.target_col])
-        except:
-            return list()
+        return self._get_index().successors(vertex)
+
+    def get_successor_weights(self, vertex):
+        """
+        Returns a list of (successor, weights) pairs, one per outgoing edge of vertex.
+        :param str vertex:
+        :return:
+        """
+        return self._get_index().successor_weights(vertex)
+
+    def get_predecessor_weights(self, vertex):
+        """
+        Returns a list of (predecessor, weights) pairs, one per incoming edge of vertex.
+        :param str vertex:
+        :return:
+        """
+        return self._get_index().predecessor_weights(vertex)
 
     def get_all_vertices(self):
         """
         Returns a set containing all the vertices in the graph.
         :return:
         """
-        try:
-            vertices = set(self.data[self.source_col])          # Source vertices
-            vertices.update(self.data[self.target_col])         # Target vertices
-            return vertices
-        except:
-            return set()
+        return self._get_index().vertices()
 
     def get_path_cost(self, start, end):
         """
@@ -153,12 +249,14 @@ class PandasGraph(Graph):
         """
         path = PandasGraph(pd.DataFrame(), source_col=self.source_col, target_col=self.target_col,
                      weight_cols=self.weight_cols, bidirectional=False)
+        edges = list()
         node = end
         while node != start:
             predecessor = self.get_predecessors(node)[0]
             weight = self.get_weight(predecessor, node)
-            path.add_edge(source=predecessor, target=node, weights=weight)
+            edges.append((predecessor, node, weight))
             node = predecessor
+        path.add_edges(edges)
         return path
 
     def get_path_informed(self, start, end, prev):
@@ -173,18 +271,20 @@ class PandasGraph(Graph):
         """
         path = PandasGraph(pd.DataFrame(), source_col=self.source_col, target_col=self.target_col,
                      weight_cols=self.weight_cols, bidirectional=False)
+        edges = list()
         path_ready = False
         current = end
         while not path_ready:
             source = prev[current]
             target = current
             cost = self.get_weight(source=source, target=target)
-            path.add_edge(source=source, target=target, weights=cost)
+            edges.append((source, target, cost))
 
             if source == start:
                 path_ready = True
             else:
                 current = source
+        path.add_edges(edges)
         return path
 
     def get_inverse_graph(self):
@@ -203,12 +303,15 @@ class PandasGraph(Graph):
 
     def copy(self):
         """
-        Returns a copy of the graph.
+        Returns a copy of the graph. The copy shares the DataFrame and the adjacency index with this graph until one of
+        them adds or removes an edge, so copying a graph that is only going to be read is cheap.
         :return:
         """
-        copy = PandasGraph(self.data.copy(deep=True), source_col=self.source_col, target_col=self.target_col, weight_cols=self.weight_cols,
+        copy = PandasGraph(self.data, source_col=self.source_col, target_col=self.target_col, weight_cols=self.weight_cols,
                      bidirectional=False)
         copy.bidirectional = self.bidirectional
+        copy._index = self._get_index()
+        copy._shared = self._shared = True
         return copy
 
     def show(self):
@@ -0,0 +1,254 @@
+import heapq
+import os
+import random
+
+import numpy as np
+
+from Heuristics.Heuristic import Heuristic
+from Graphs.Graph import Graph
+from Algorithms.Dijkstra import distance_table
+
+
+class ALT(Heuristic):
+    """
+    ALT heuristic (A*, Landmarks and Triangle inequality). A few vertices are chosen as landmarks, and a forward and a
+    reverse Dijkstra from each of them store the distance from every landmark to every vertex and from every vertex to
+    every landmark. By the triangle inequality, d(L, end) - d(L, start) and d(start, L) - d(end, L) are lower bounds of
+    the distance from start to end for any landmark L, so calculate returns the largest of them. The heuristic is
+    consistent, so it can be used by AStar and BidirectionalAStar.
+
+    The tables are built on the first call, or by precompute, and can be written with save and read back with load, so
+    the preprocessing of a graph only runs once. The graph is expected not to change afterwards.
+    """
+
+    def __init__(self, graph: Graph, n_landmarks=8, strategy='avoid', weight_index=0, seed=0):
+        """
+        :param Graph graph: graph where the search is going to be run.
+        :param int n_landmarks: number of landmarks.
+        :param str strategy: 'farthest', to choose every landmark as far as possible from the ones chosen before, or
+        'avoid', to choose it in the region of the graph where the bounds of the landmarks chosen before are worst.
+        :param int weight_index: position of the weight to estimate, among the graph weight columns.
+        :param int seed: seed of the random choice of the first vertex.
+        """
+        super().__init__(graph)
+        if strategy not in ('farthest', 'avoid'):
+            raise ValueError(f"Error, unknown landmark strategy {strategy}, it must be 'farthest' or 'avoid'")
+        self.n_landmarks = n_landmarks
+        self.strategy = strategy
+        self.weight_index = weight_index
+        self.seed = seed
+        self.landmarks = None
+        self._vertex_ids = None
+        self._from_landmarks = None     # (landmarks x vertices) distances from every landmark
+        self._to_landmarks = None       # (landmarks x vertices) distances to every landmark
+
+    def calculate(self, start, end):
+        """
+        Returns a lower bound of the distance from start to end, or infinity if a landmark proves there is no path.
+        :param start:
+        :param end:
+        :return:
+        """
+        if start == end:
+            return 0
+        if self._vertex_ids is None:
+            self.precompute()
+
+        start_id, end_id = self._vertex_ids.get(start), self._vertex_ids.get(end)
+        if start_id is None or end_id is None:
+            return float('inf')
+        return float(self._bounds(start_id, np.array([end_id]))[0])
+
+    def precompute(self):
+        """
+        Chooses the landmarks and builds the distance tables.
+        :return:
+        """
+        self._vertex_ids = {vertex: index for index, vertex in enumerate(self.graph.get_all_vertices())}
+        vertices = list(self._vertex_ids.keys())
+        self.landmarks = list()
+        self._from_landmarks = np.empty((0, len(vertices)))
+        self._to_landmarks = np.empty((0, len(vertices)))
+
+        rnd = random.Random(self.seed)
+        root = vertices[rnd.randrange(len(vertices))] if len(vertices) > 0 else None
+        while len(self.landmarks) < min(self.n_landmarks, len(vertices)):
+            if self.strategy == 'farthest':
+                landmark = self._farthest_vertex(vertices, root)
+            else:
+                landmark = self._avoid_vertex(vertices, vertices[rnd.randrange(len(vertices))])
+            self._add_landmark(landmark)
+
+    def save(self, path):
+        """
+        Writes the landmarks, their distance tables and the parameters of the heuristic to path, in NumPy .npz format.
+        The file is written to path as given, without adding the .npz suffix, so load reads it back from the same path.
+        :param path: file name or open file.
+        :return:
+        """
+        if isinstance(path, (str, os.PathLike)):
+            with open(path, 'wb') as file:
+                self.save(file)
+            return
+
+        if self._vertex_ids is None:
+            self.precompute()
+        np.savez(path, vertices=_object_array(self._vertex_ids.keys()), landmarks=_object_array(self.landmarks),
+                 from_landmarks=self._from_landmarks, to_landmarks=self._to_landmarks,
+                 weight_index=self.weight_index, strategy=self.strategy, seed=self.seed)
+
+    @classmethod
+    def load(cls, graph: Graph, path):
+        """
+        Creates the heuristic of graph from the tables written by save, without running any search.
+        :param Graph graph: graph where the search is going to be run. It must be the graph the tables were built on.
+        :param path: file name or open file.
+        :return:
+        """
+        # Vertices are stored as Python objects, so that labels of different types keep their types
+        with np.load(path, allow_pickle=True) as tables:
+            alt = cls(graph, n_landmarks=len(tables['landmarks']), strategy=str(tables['strategy']),
+                      weight_index=int(tables['weight_index']), seed=int(tables['seed']))
+            alt.landmarks = tables['landmarks'].tolist()
+            alt._vertex_ids = {vertex: index for index, vertex in enumerate(tables['vertices'].tolist())}
+            alt._from_landmarks = tables['from_landmarks']
+            alt._to_landmarks = tables['to_landmarks']
+        return alt
+
+    def _bounds(self, start_id, end_ids):
+        """
+        Returns the lower bounds of the distances from the vertex start_id to every vertex in end_ids, as the maximum
+        over the landmarks of both triangle inequalities. Differences between two infinite distances give no
+        information and are ignored.
+        :param int start_id:
+        :param np.ndarray end_ids:
+        :return:
+        """
+        with np.errstate(invalid='ignore'):
+            from_bounds = self._from_landmarks[:, end_ids] - self._from_landmarks[:, [start_id]]
+            to_bounds = self._to_landmarks[:, [start_id]] - self._to_landmarks[:, end_ids]
+        bounds = np.fmax(np.fmax.reduce(from_bounds, axis=0, initial=0), np.fmax.reduce(to_bounds, axis=0, initial=0))
+        return np.nan_to_num(bounds, nan=0, posinf=np.inf)
+
+    def _add_landmark(self, landmark):
+        """
+        Adds landmark and its forward and reverse distances to the tables.
+        :param landmark:
+        :return:
+        """
+        self.landmarks.append(landmark)
+        from_landmark = distance_table(self.graph, [landmark], self._vertex_ids, weight_index=self.weight_index)
+        to_landmark = distance_table(self.graph, [landmark], self._vertex_ids, weight_index=self.weight_index,
+                                     reverse=True)
+        self._from_landmarks = np.vstack([self._from_landmarks, from_landmark])
+        self._to_landmarks = np.vstack([self._to_landmarks, to_landmark])
+
+    def _farthest_vertex(self, vertices, root):
+        """
+        Returns the vertex whose distance to the closest landmark (to root, if there are no landmarks yet) is the
+        largest. Distances are taken in both directions, and vertices not reached by any landmark are preferred, so
+        every part of a disconnected graph gets a landmark.
+        :param list vertices:
+        :param root:
+        :return:
+        """
+        if len(self.landmarks) == 0:
+            distances = distance_table(self.graph, [root], self._vertex_ids, weight_index=self.weight_index) + \
+                        distance_table(self.graph, [root], self._vertex_ids, weight_index=self.weight_index,
+                                       reverse=True)
+            distances[self._vertex_ids[root]] = -1
+        else:
+            distances = np.min(self._from_landmarks + self._to_landmarks, axis=0)
+            distances[[self._vertex_ids[landmark] for landmark in self.landmarks]] = -1
+        return vertices[int(np.argmax(distances))]
+
+    def _avoid_vertex(self, vertices, root):
+        """
+        Returns a landmark chosen with the avoid strategy. In the shortest path tree from root, every vertex weighs the
+        difference between its distance from root and the lower bound of that distance given by the current landmarks.
+        The size of a vertex is the sum of the weights of its subtree, or 0 if the subtree has a landmark. Going down
+        from root to the child of largest size until a leaf, the leaf reached is a vertex whose paths are badly
+        covered by the current landmarks.
+        :param list vertices:
+        :param root:
+        :return:
+        """
+        root_id = self._vertex_ids[root]
+        distances, parents, order = _shortest_path_tree(self.graph, root, self._vertex_ids, self.weight_index)
+        weights = distances[order] - self._bounds(root_id, order)
+        sizes = np.zeros(len(vertices))
+        sizes[order] = np.maximum(weights, 0)
+        has_landmark = np.zeros(len(vertices), dtype=bool)
+        has_landmark[[self._vertex_ids[landmark] for landmark in self.landmarks]] = True
+
+        children = dict()
+        for vertex_id in reversed(order):     # Every vertex comes after its parent in order
+            parent_id = parents[vertex_id]
+            if has_landmark[vertex_id]:
+                sizes[vertex_id] = 0
+            if parent_id >= 0:
+                sizes[parent_id] += sizes[vertex_id]
+                has_landmark[parent_id] |= has_landmark[vertex_id]
+                children.setdefault(parent_id, list()).append(vertex_id)
+
+        if sizes[root_id] <= 0:
+            return self._farthest_vertex(vertices, root)
+
+        vertex_id = root_id
+        while vertex_id in children:
+            child_id = max(children[vertex_id], key=lambda child_id: sizes[child_id])
+            if sizes[child_id] <= 0:
+                break
+            vertex_id = child_id
+        return vertices[vertex_id]
+
+
+def _object_array(values):
+    """
+    Returns a 1D NumPy array of Python objects holding values, so that NumPy does not convert them to a common type.
+    :param values: iterable of vertices.
+    :return:
+    """
+    values = list(values)
+    array = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):   # Element by element, so tuples are not unpacked into a second dimension
+        array[index] = value
+    return array
+
+
+def _shortest_path_tree(graph: Graph, root, vertex_ids, weight_index=0):
+    """
+    Runs a single-objective Dijkstra search from root and returns the distance of every vertex as a NumPy array
+    indexed by vertex_ids, the id of the parent of every vertex in the shortest path tree (-1 for root and the vertices
+    not reached), and the ids of the reached vertices in the order they were explored.
+    :param Graph graph: graph to search.
+    :param root: vertex where the search starts.
+    :param dict vertex_ids: dict mapping every vertex of the graph to its position in the returned arrays.
+    :param int weight_index: position of the weight to minimize, among the graph weight columns.
+    :return:
+    """
+    dist = np.full(len(vertex_ids), np.inf)
+    parents = np.full(len(vertex_ids), -1, dtype=np.int64)
+    order = list()
+    dist[vertex_ids[root]] = 0
+    heap, pushed = [(0, 0, root)], 1
+
+    explored_vertices = set()
+    while len(heap) > 0:
+        current_dist, _, current_vertex = heapq.heappop(heap)
+        if current_vertex in explored_vertices:
+            continue
+        explored_vertices.add(current_vertex)
+        current_id = vertex_ids[current_vertex]
+        order.append(current_id)
+
+        for successor, weight in graph.get_successor_weights(current_vertex):
+            distance = current_dist + weight[weight_index]
+            successor_id = vertex_ids[successor]
+            if distance < dist[successor_id]:
+                dist[successor_id] = distance
+                parents[successor_id] = current_id
+                heapq.heappush(heap, (distance, pushed, successor))
+                pushed += 1
+
+    return dist, parents, np.array(order, dtype=np.int64)
@@ -1,28 +1,63 @@
+from collections import deque
+
+import numpy as np
+
 from Heuristics.Heuristic import Heuristic
 from Graphs.Graph import Graph
-from Algorithms.BFS import BFS as BFSAlgorithm
 
 
 class BFS(Heuristic):
+    """
+    Heuristic that returns the number of edges (hops) of the shortest path between two vertices. The first time a goal
+    is requested, a single reverse Breath First Search from the goal computes the hops of every vertex to it, which are
+    stored in a table so that any later call for that goal is a lookup. The graph is expected not to change after the
+    first call.
+    """
 
     def __init__(self, graph: Graph):
         super().__init__(graph)
+        self._vertex_ids = None
+        self._tables = dict()
 
     def calculate(self, start, end):
         """
-        Calculate Breath First Search path between start and end, then returns the sum of costs of that path.
+        Returns the number of edges of the shortest path between start and end, or infinity if there is no path.
         :param start:
         :param end:
         :return:
         """
         if start == end:
             return 0
-        else:
-            bfs = BFSAlgorithm(self.graph)
-            bfs.run(start, end)
-            solution = bfs.solution.get_solution(end)
-            if solution is not None and len(solution) > 0 and len(solution[0].data) > 0:
-                return len(solution[0].get_path_uninformed(start, end).data)
-            else:
-                return float('inf')
 
+        table = self._get_table(end)
+        vertex_id = self._vertex_ids.get(start)
+        if vertex_id is None or table[vertex_id] < 0:
+            return float('inf')
+        return int(table[vertex_id])
+
+    def _get_table(self, end):
+        """
+        Returns the table of hops to end, indexed by vertex id. Unreachable vertices have a negative value.
+        :param end:
+        :return:
+        """
+        if self._vertex_ids is None:
+            self._vertex_ids = {vertex: index for index, vertex in enumerate(self.graph.get_all_vertices())}
+
+        if end not in self._tables:
+            hops = [-1] * len(self._vertex_ids)
+            if end in self._vertex_ids:
+                # Breath First Search over the predecessors, i.e. over the inverse graph
+                hops[self._vertex_ids[end]] = 0
+                queue = deque([end])
+                while len(queue) > 0:
+                    vertex = queue.popleft()
+                    vertex_hops = hops[self._vertex_ids[vertex]] + 1
+                    for predecessor in self.graph.get_predecessors(vertex):
+                        predecessor_id = self._vertex_ids[predecessor]
+                        if hops[predecessor_id] < 0:
+                            hops[predecessor_id] = vertex_hops
+                            queue.append(predecessor)
+            self._tables[end] = np.array(hops, dtype=np.int64)
+
+        return self._tables[end]
@@ -0,0 +1,50 @@
+import numpy as np
+
+from Heuristics.Heuristic import Heuristic
+from Graphs.Graph import Graph
+from Algorithms.Dijkstra import distance_table
+
+
+class IdealPoint(Heuristic):
+    """
+    Multi-objective heuristic for NAMOA and MOA. For every objective, a reverse single-objective Dijkstra from the goal
+    vertices computes the minimum cost from every vertex to any goal. The vector of those minimums (the ideal point) is
+    an admissible lower bound for every Pareto-optimal path, and is returned by calculate from the precomputed table.
+    The table is built on the first call, so the graph is expected not to change afterwards.
+    """
+
+    def __init__(self, graph: Graph, end_vertices):
+        """
+        :param Graph graph: graph where the search is going to be run.
+        :param str or list end_vertices: goal vertex or list of goal vertices.
+        """
+        super().__init__(graph)
+        self.end_vertices = end_vertices if isinstance(end_vertices, list) else [end_vertices]
+        self._vertex_ids = None
+        self._bounds = None
+
+    def calculate(self, vertex):
+        """
+        Returns a list with the minimum cost, for every objective, from vertex to any of the goal vertices. Vertices
+        that can not reach a goal get infinity.
+        :param vertex:
+        :return:
+        """
+        if self._bounds is None:
+            self._precompute()
+
+        vertex_id = self._vertex_ids.get(vertex)
+        if vertex_id is None:
+            return [float('inf') for weight_col in self.graph.weight_cols]
+        return self._bounds[vertex_id].tolist()
+
+    def _precompute(self):
+        """
+        Runs one reverse Dijkstra per weight column and stores the distances in a (vertices x objectives) array.
+        :return:
+        """
+        self._vertex_ids = {vertex: index for index, vertex in enumerate(self.graph.get_all_vertices())}
+        self._bounds = np.empty((len(self._vertex_ids), len(self.graph.weight_cols)))
+        for objective in range(len(self.graph.weight_cols)):
+            self._bounds[:, objective] = distance_table(self.graph, self.end_vertices, self._vertex_ids,
+                                                        weight_index=objective, reverse=True)
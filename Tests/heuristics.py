@@ -1,5 +1,8 @@
+import pandas as pd
+
 from Heuristics.Heuristic import Heuristic
 from Graphs.Graph import Graph
+from Graphs.PandasGraph import PandasGraph
 from Heuristics.BFS import BFS
 
 
@@ -54,3 +57,25 @@ class MockedHeuristicAutomatic(Heuristic):
             distance = self.bfs_heur.calculate(vertex, self.end_vertex)
             self.heurs.update({vertex: [distance for i in range(len(self.graph.weight_cols))]})
             return self.heurs[vertex]
+
+
+def random_graph(rnd, max_vertices, weight_cols=('weight_1',), min_weight=0, max_weight=9, min_vertices=2,
+                 self_loops=True):
+    """
+    Returns a random directed PandasGraph with integer vertices and about three edges per vertex, without parallel
+    edges.
+    :param random.Random rnd: random generator, so that every test gets the same graphs on every run.
+    :param int max_vertices: maximum number of vertices. The number is chosen between min_vertices and max_vertices.
+    :param weight_cols: names of the weight columns.
+    :param int min_weight: minimum weight of every edge.
+    :param int max_weight: maximum weight of every edge.
+    :param int min_vertices: minimum number of vertices.
+    :param bool self_loops: if False, edges from a vertex to itself are left out.
+    :return:
+    """
+    n_vertices = rnd.randint(min_vertices, max_vertices)
+    edges = {(rnd.randrange(n_vertices), rnd.randrange(n_vertices)) for _ in range(3 * n_vertices)}
+    data = pd.DataFrame(data=[{'source': source, 'target': target,
+                               **{weight_col: rnd.randint(min_weight, max_weight) for weight_col in weight_cols}}
+                              for source, target in edges if self_loops or source != target])
+    return PandasGraph(data, bidirectional=False, weight_cols=list(weight_cols))
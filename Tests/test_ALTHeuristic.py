@@ -0,0 +1,84 @@
+import random
+
+import pandas as pd
+import pytest
+
+from Heuristics.ALT import ALT
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.AStar import AStar
+from Algorithms.Dijkstra import distance_table
+from Tests.heuristics import random_graph
+
+
+def test_alt_heuristic():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    alt = ALT(graph, n_landmarks=6)
+    # With every vertex as a landmark, the bounds are the distances
+    assert alt.calculate('a', 'f') == 10
+    assert alt.calculate('b', 'f') == 9
+    assert alt.calculate('c', 'f') == 7
+    assert alt.calculate('e', 'f') == float('inf')
+    assert alt.calculate('f', 'a') == float('inf')
+    assert alt.calculate('f', 'f') == 0
+    assert alt.calculate('Random', 'f') == float('inf')
+
+
+def test_alt_heuristic_admissible():
+    rnd = random.Random(0)
+    for strategy in ['farthest', 'avoid']:
+        for _ in range(20):
+            graph = random_graph(rnd, 25)
+            alt = ALT(graph, n_landmarks=3, strategy=strategy)
+
+            vertex_ids = {vertex: index for index, vertex in enumerate(graph.get_all_vertices())}
+            for end in vertex_ids:
+                distances = distance_table(graph, [end], vertex_ids, reverse=True)
+                for start, start_id in vertex_ids.items():
+                    assert alt.calculate(start, end) <= distances[start_id]
+
+
+def test_alt_heuristic_save_load(tmp_path):
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    alt = ALT(graph, n_landmarks=3, strategy='farthest')
+    alt.save(tmp_path / 'landmarks.npz')
+
+    loaded = ALT.load(graph, tmp_path / 'landmarks.npz')
+    assert loaded.landmarks == alt.landmarks
+    for start in graph.get_all_vertices():
+        assert loaded.calculate(start, 'München') == alt.calculate(start, 'München')
+
+
+
+def test_alt_heuristic_save_load_mixed_labels(tmp_path):
+    data = pd.DataFrame(data=[
+        {'source': 1, 'target': 'a', 'weight_1': 2},
+        {'source': 'a', 'target': 2, 'weight_1': 3},
+        {'source': 2, 'target': 'b', 'weight_1': 4}
+    ])
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    alt = ALT(graph, n_landmarks=2, strategy='farthest', seed=3)
+    alt.save(tmp_path / 'landmarks')
+
+    loaded = ALT.load(graph, tmp_path / 'landmarks')
+    assert loaded.strategy == 'farthest'
+    assert loaded.seed == 3
+    assert loaded.landmarks == alt.landmarks
+    assert loaded.calculate(1, 'b') == alt.calculate(1, 'b') == 9
+    assert loaded.calculate('a', 2) == alt.calculate('a', 2) == 3
+
+def test_alt_heuristic_astar():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    a_star = AStar(graph, heuristic=ALT(graph, n_landmarks=2))
+    a_star.run(start_vertex='Frankfurt', end_vertex='München')
+
+    assert a_star.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+
+
+def test_alt_heuristic_error():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    with pytest.raises(ValueError):
+        ALT(graph, strategy='Random')
@@ -41,6 +41,22 @@ def test_astar_bidirectional():
     assert a_star.solution.get_solution('f')[0].get_path_cost(start='a', end='f') == [10]
 
 
+def test_astar_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    a_star = AStar(graph)
+    a_star.run(start_vertex='Frankfurt', end_vertex='München')
+
+    expected = [
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ]
+
+    assert a_star.solution.get_solution('München')[0].data.equals(pd.DataFrame(expected))
+    assert a_star.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+
+
 def test_astar_missing_source():
     data = pd.read_csv('astar-data.csv')
     graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
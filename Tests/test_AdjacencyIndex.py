@@ -0,0 +1,54 @@
+import pandas as pd
+
+from Graphs.AdjacencyIndex import AdjacencyIndex
+
+
+def test_index_lookups():
+    data = pd.read_csv('graph-data.csv')
+    index = AdjacencyIndex.from_dataframe(data, 'source', 'target', ['weight_1', 'weight_2'])
+    assert len(index) == len(data)
+    assert index.successors('n2') == ['n4', 'n5', 't']
+    assert index.predecessors('n6') == ['n1', 'n3', 'n4']
+    assert index.weight('s', 'n1') == [6, 1]
+    assert index.weight('s', 't') == list()
+    assert index.vertices() == {'s', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 't'}
+
+
+def test_index_empty():
+    index = AdjacencyIndex.from_dataframe(pd.DataFrame(), 'source', 'target', ['weight_1'])
+    assert len(index) == 0
+    assert index.successors('s') == list()
+    assert index.predecessors('s') == list()
+    assert index.weight('s', 't') == list()
+    assert index.vertices() == set()
+
+
+def test_index_add_edge():
+    index = AdjacencyIndex(n_weights=2)
+    index.add_edge('s', 't', [1, 2])
+    index.add_edge('s', 'u', [3, 4])
+    index.add_edge('u', 't', [5, 6])
+    assert index.successors('s') == ['t', 'u']
+    assert index.predecessors('t') == ['s', 'u']
+    assert index.weight('u', 't') == [5, 6]
+    assert index.edge_position('s', 'u') == 1
+
+
+def test_index_remove_edge():
+    data = pd.read_csv('graph-data.csv')
+    index = AdjacencyIndex.from_dataframe(data, 'source', 'target', ['weight_1', 'weight_2'])
+    index.add_edge('n2', 'n1', [1, 1])
+    removed = index.remove_edge('n2', 'n5')
+    assert len(removed) == 1
+    assert len(index) == len(data)
+    assert index.successors('n2') == ['n4', 't', 'n1']
+    assert index.weight('n2', 'n1') == [1, 1]
+    assert len(index.remove_edge('n2', 'n5')) == 0
+
+
+def test_index_integer_vertices():
+    data = pd.read_csv('dfs-data.csv')
+    index = AdjacencyIndex.from_dataframe(data, 'source', 'target', [])
+    assert index.successors(3) == [4, 5]
+    assert index.weight(3, 4) == list()
+    assert index.vertex_label(index.vertex_id(3)) == 3
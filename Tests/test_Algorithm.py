@@ -8,4 +8,9 @@ from Graphs.PandasGraph import PandasGraph
 def test_graph_data():
     graph = PandasGraph(pd.read_csv('graph-data.csv'))
     algorithm = Algorithm(graph, ConsoleVisualizer())
-    assert algorithm.solution.get_all_solutions() == list()
\ No newline at end of file
+    assert algorithm.solution.get_all_solutions() == list()
+
+def test_graph_not_copied():
+    graph = PandasGraph(pd.read_csv('graph-data.csv'))
+    algorithm = Algorithm(graph, ConsoleVisualizer())
+    assert algorithm.graph.data is graph.data
@@ -0,0 +1,86 @@
+import random
+
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.ArcFlags import ArcFlags, ArcFlagsDijkstra
+from Algorithms.Dijkstra import distance_table
+from Tests.heuristics import random_graph
+
+
+def test_arc_flags_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    arc_flags_dijkstra = ArcFlagsDijkstra(graph, arc_flags=ArcFlags(graph, n_regions=3))
+    arc_flags_dijkstra.run(start_vertex='Frankfurt', end_vertex='München')
+
+    expected = pd.DataFrame(data=[
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ])
+
+    assert arc_flags_dijkstra.solution.get_solution('München')[0].data.equals(expected)
+    assert arc_flags_dijkstra.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+
+
+def test_arc_flags_regions():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    regions = {'a': 0, 'b': 0, 'c': 0, 'd': 9, 'e': 9, 'f': 9}
+    arc_flags = ArcFlags(graph, regions=regions)
+
+    assert arc_flags.n_regions == 10
+    assert arc_flags.flags.shape == (len(arc_flags.targets), 2)
+    assert arc_flags.region_of('d') == 9
+    assert arc_flags.region_of('Random') is None
+
+    def flagged_edges(region):
+        edge_flags = arc_flags.edge_flags(region)
+        return {(arc_flags.vertices[source_id], arc_flags.vertices[target_id])
+                for source_id, target_id, flag in zip(arc_flags.sources, arc_flags.targets, edge_flags) if flag}
+
+    # No edge leaves region 9, and a -> b is only on the shortest path to e
+    assert flagged_edges(0) == {('a', 'b'), ('a', 'c')}
+    assert flagged_edges(9) == {('a', 'b'), ('a', 'c'), ('b', 'e'), ('b', 'f'), ('c', 'd'), ('d', 'f')}
+    assert flagged_edges(5) == set()
+
+
+def test_arc_flags_random_graphs():
+    rnd = random.Random(0)
+    for _ in range(20):
+        graph = random_graph(rnd, 25)
+        arc_flags = ArcFlags(graph, n_regions=rnd.randint(1, 10), seed=rnd.randrange(100))
+
+        vertex_ids = {vertex: index for index, vertex in enumerate(graph.get_all_vertices())}
+        for start_vertex in vertex_ids:
+            distances = distance_table(graph, [start_vertex], vertex_ids)
+            for end_vertex, end_id in vertex_ids.items():
+                if start_vertex == end_vertex:
+                    continue
+                arc_flags_dijkstra = ArcFlagsDijkstra(graph, arc_flags=arc_flags)
+                arc_flags_dijkstra.run(start_vertex=start_vertex, end_vertex=end_vertex)
+
+                if distances[end_id] == float('inf'):
+                    assert arc_flags_dijkstra.solution.is_empty()
+                else:
+                    assert arc_flags_dijkstra.solution.get_solution_cost(start_vertex, end_vertex) == \
+                           [[distances[end_id]]]
+
+
+def test_arc_flags_unreachable():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    arc_flags_dijkstra = ArcFlagsDijkstra(graph)
+    arc_flags_dijkstra.run(start_vertex='f', end_vertex='a')
+
+    assert arc_flags_dijkstra.solution.get_solution('a') is None
+
+
+def test_arc_flags_missing_target():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    arc_flags_dijkstra = ArcFlagsDijkstra(graph)
+    arc_flags_dijkstra.run(start_vertex='a', end_vertex='Random', show_end=True)
+
+    assert arc_flags_dijkstra.solution.get_solution('Random') is None
@@ -0,0 +1,200 @@
+import pandas as pd
+
+from Graphs.ArrayGraph import ArrayGraph
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.BFS import BFS
+from Algorithms.DFS import DFS
+from Algorithms.Dijkstra import Dijkstra
+from Algorithms.AStar import AStar
+from Algorithms.MOA import MOA
+from Algorithms.NAMOA import NAMOA
+from Algorithms.BDijkstra import BDijkstra
+from Algorithms.BOA import BOA
+from Algorithms.PULSE import PULSE
+from Algorithms.BidirectionalDijkstra import BidirectionalDijkstra
+from Algorithms.BidirectionalAStar import BidirectionalAStar
+from Algorithms.ContractionHierarchies import CHDijkstra
+from Algorithms.ArcFlags import ArcFlags, ArcFlagsDijkstra
+from Heuristics.IdealPoint import IdealPoint
+from Tests.heuristics import MockedHeuristicMOA, MockedHeuristicNAMOA
+
+
+def test_data():
+    data = pd.read_csv('graph-data.csv')
+    graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1', 'weight_2'])
+    assert graph.data.equals(data)
+
+
+def test_predecessors_successors():
+    data = pd.read_csv('graph-data.csv')
+    graph = ArrayGraph.from_dataframe(data)
+    assert graph.get_predecessors('n6') == ['n1', 'n3', 'n4']
+    assert graph.get_predecessors('s') == list()
+    assert graph.get_successors('n2') == ['n4', 'n5', 't']
+    assert graph.get_successors('t') == list()
+    assert graph.get_all_vertices() == {'s', 'n1', 'n2', 'n3', 'n4', 'n5', 'n6', 't'}
+
+
+def test_add_remove_edge_bidirectional():
+    graph = ArrayGraph(weight_cols=['weight_1', 'weight_2'], bidirectional=True)
+    graph.add_edge(source='s', target='t', weights=[1, 2])
+    expected = pd.DataFrame(data=[
+        {'source': 's', 'target': 't', 'weight_1': 1, 'weight_2': 2},
+        {'source': 't', 'target': 's', 'weight_1': 1, 'weight_2': 2}
+    ])
+    assert graph.data.equals(expected)
+    assert graph.get_weight('t', 's') == [1, 2]
+
+    graph.remove_edge(source='s', target='t')
+    assert graph.data.empty
+    assert graph.get_weight('s', 't') == list()
+
+
+def test_weight_cols_subset():
+    data = pd.read_csv('graph-data.csv')
+    graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1', 'weight_2'])
+    copy = graph.copy()
+    copy.weight_cols = ['weight_2']
+    assert copy.get_weight('s', 'n1') == [1]
+    assert graph.get_weight('s', 'n1') == [6, 1]
+
+
+def test_neighbour_weights_subset():
+    data = pd.read_csv('graph-data.csv')
+    graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1', 'weight_2'])
+    graph.weight_cols = ['weight_2']
+    assert graph.get_successor_weights('s') == [(successor, graph.get_weight('s', successor))
+                                                for successor in graph.get_successors('s')]
+
+
+def test_inverse_graph():
+    graph = ArrayGraph(['s', 'n1'], ['n1', 't'], [[1, 2], [3, 4]], weight_cols=['weight_1', 'weight_2'])
+    inverse = graph.get_inverse_graph()
+
+    expected = pd.DataFrame(data=[
+        {'source': 'n1', 'target': 's', 'weight_1': 1, 'weight_2': 2},
+        {'source': 't', 'target': 'n1', 'weight_1': 3, 'weight_2': 4}
+    ])
+    assert inverse.data.equals(expected)
+    assert inverse.get_path_cost(start='t', end='s') == [4, 6]
+
+
+def test_path_informed():
+    graph = ArrayGraph(['s', 'n1'], ['n1', 't'], [[1, 2], [3, 4]], weight_cols=['weight_1', 'weight_2'])
+    path = graph.get_path_informed('s', 't', {'t': 'n1', 'n1': 's'})
+    assert isinstance(path, ArrayGraph)
+    assert path.get_path_cost(start='s', end='t') == [4, 6]
+
+
+def test_dijkstra():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1'])
+    dijkstra = Dijkstra(graph)
+    dijkstra.run(start_vertex='a', end_vertex='c')
+
+    assert dijkstra.solution.get_solution('c')[0].get_path_cost(start='a', end='c') == [12]
+
+
+def test_astar():
+    data = pd.read_csv('astar-data.csv')
+    graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1'], bidirectional=True)
+    a_star = AStar(graph)
+    a_star.run(start_vertex='a', end_vertex='f')
+
+    assert a_star.solution.get_solution('f')[0].get_path_cost(start='a', end='f') == [10]
+
+
+def test_multiobjective():
+    data = pd.read_csv('namoa-data.csv')
+    array_graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1', 'weight_2'])
+    pandas_graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+
+    for graph in (array_graph, pandas_graph):
+        namoa = NAMOA(graph, heuristic=MockedHeuristicNAMOA(graph))
+        namoa.run(start_vertex='s', end_vertices='y')
+        assert namoa.solution.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+
+        pulse = PULSE(graph)
+        pulse.run(start_vertex='s', end_vertex='y')
+        assert pulse.solution.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+
+
+
+def test_bfs_dfs():
+    data = pd.read_csv('bfs-data.csv')
+    array_graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1'])
+    pandas_graph = PandasGraph(data, weight_cols=['weight_1'])
+
+    for graph in (array_graph, pandas_graph):
+        bfs = BFS(graph)
+        bfs.run('Frankfurt')
+        assert bfs.solution.get_solution('München')[0].get_path_cost('Frankfurt', 'München') == [675]
+        assert bfs.solution.get_solution('Erfurt')[0].get_path_cost('Frankfurt', 'Erfurt') == [403]
+
+    data = pd.read_csv('dfs-data.csv')
+    array_graph = ArrayGraph.from_dataframe(data)
+    pandas_graph = PandasGraph(data)
+    expected = [[1, 2], [2, 3], [3, 4], [3, 5], [2, 6], [1, 7], [1, 8], [8, 9], [9, 10], [9, 11], [8, 12]]
+
+    for graph in (array_graph, pandas_graph):
+        dfs = DFS(graph)
+        dfs.run(1, show_end=True)
+        assert dfs.solution.get_solution('*')[0].data.values.tolist() == expected
+
+
+def test_moa_bdijkstra():
+    data = pd.read_csv('moa-data.csv')
+    array_graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1', 'weight_2'])
+    pandas_graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+
+    for graph in (array_graph, pandas_graph):
+        moa = MOA(graph, heuristic=MockedHeuristicMOA(graph))
+        moa.run(start_vertex='s', end_vertices=['y1', 'y2', 'y3'])
+        assert moa.solution.get_solution_cost('s', 'y3') == [[6, 7], [9, 5]]
+        assert moa.solution.get_solution_cost('s', 'y1') == [[4, 11]]
+
+        bdijkstra = BDijkstra(graph)
+        bdijkstra.run(start_vertex='s', end_vertex='y1')
+        assert bdijkstra.solution.get_solution_cost('s', 'y1') == [[4, 11], [7, 9]]
+
+
+def test_multiobjective_variants():
+    data = pd.read_csv('namoa-data.csv')
+    array_graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1', 'weight_2'])
+    pandas_graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+
+    for graph in (array_graph, pandas_graph):
+        namoa = NAMOA(graph, heuristic=IdealPoint(graph, 'y'), dimensionality_reduction=True)
+        namoa.run(start_vertex='s', end_vertices='y')
+        assert namoa.solution.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+
+        boa = BOA(graph, heuristic=IdealPoint(graph, 'y'))
+        boa.run(start_vertex='s', end_vertices='y')
+        assert boa.solution.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+
+        bdijkstra = BDijkstra(graph)
+        bdijkstra.run(start_vertex='s', end_vertex='y')
+        assert bdijkstra.solution.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+
+
+def test_one_to_one():
+    data = pd.read_csv('bfs-data.csv')
+    array_graph = ArrayGraph.from_dataframe(data, weight_cols=['weight_1'], bidirectional=True)
+    pandas_graph = PandasGraph(data, weight_cols=['weight_1'], bidirectional=True)
+
+    for graph in (array_graph, pandas_graph):
+        for algorithm in (BidirectionalDijkstra(graph), BidirectionalAStar(graph), CHDijkstra(graph),
+                          ArcFlagsDijkstra(graph, arc_flags=ArcFlags(graph, n_regions=3))):
+            algorithm.run(start_vertex='Frankfurt', end_vertex='München')
+            assert algorithm.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+
+def test_copy_on_write():
+    graph = ArrayGraph(['s', 'n1'], ['n1', 't'], [[1, 2], [3, 4]], weight_cols=['weight_1', 'weight_2'])
+    copy = graph.copy()
+    copy.remove_edge(source='s', target='n1')
+    assert graph.get_successors('s') == ['n1']
+    assert copy.get_successors('s') == list()
+
+    graph.add_edge(source='t', target='s', weights=[5, 6])
+    assert graph.get_successors('t') == ['s']
+    assert copy.get_successors('t') == list()
@@ -60,6 +60,22 @@ def test_heap():
     assert heap.size() == 6
 
 
+def test_heap_lexicographic_order():
+    elements = [('a',3,1),('b',1,5),('c',1,2),('d',2,2),('e',1,2),('f',0,9)]
+    heap = Heap()
+    for elem in elements:
+        heap.push(elem)
+
+    heap.decrease_key(('a',0,8))
+    heap.decrease_key(('f',1,1))
+    heap.remove(('d',2,2))
+    assert heap_verification(heap)
+
+    popped = [heap.pop() for _ in range(heap.size())]
+    assert popped == [('a',0,8),('f',1,1),('c',1,2),('e',1,2),('b',1,5)]
+    assert heap.size() == 0
+
+
 def test_BDijkstra_namoa_graph():
     data = pd.read_csv('namoa-data.csv')
     graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
@@ -163,6 +179,23 @@ def test_BDijkstra_moa_graph_y1():
     assert solutions.get_min_solution_cost('s') == [4, 11]
 
 
+def test_BDijkstra_cycles():
+    data = pd.DataFrame(data=[
+        {'source': 's', 'target': 'a', 'weight_1': 1, 'weight_2': 2},
+        {'source': 's', 'target': 'b', 'weight_1': 2, 'weight_2': 1},
+        {'source': 'a', 'target': 'b', 'weight_1': 0, 'weight_2': 0},
+        {'source': 'b', 'target': 'a', 'weight_1': 0, 'weight_2': 0},
+        {'source': 'a', 'target': 'y', 'weight_1': 1, 'weight_2': 1},
+        {'source': 'b', 'target': 'y', 'weight_1': 1, 'weight_2': 1},
+        {'source': 'y', 'target': 's', 'weight_1': 1, 'weight_2': 1}
+    ])
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    bdijkstra = BDijkstra(graph)
+    bdijkstra.run(start_vertex='s', end_vertex='y')
+
+    assert bdijkstra.solution.get_solution_cost('s', 'y') == [[2, 3], [3, 2]]
+
+
 def test_namoa_missing_source():
     data = pd.read_csv('moa-data.csv')
     graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1','weight_2'])
@@ -31,3 +31,34 @@ def test_bfs_heuristic_error():
     assert bfs.calculate('a', 'Random') == float('inf')
     assert bfs.calculate('a', 'a') == 0
 
+
+
+class CountingGraph(PandasGraph):
+    """
+    PandasGraph that counts the calls to get_predecessors, to see how many searches the heuristic runs.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.predecessor_calls = 0
+
+    def get_predecessors(self, vertex):
+        self.predecessor_calls += 1
+        return super().get_predecessors(vertex)
+
+
+def test_bfs_heuristic_table_cached():
+    data = pd.read_csv('astar-data.csv')
+    graph = CountingGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    bfs = BFS(graph)
+    assert bfs.calculate('a', 'f') == 2
+    calls = graph.predecessor_calls
+    assert calls > 0
+
+    # Later calls for the same goal are lookups, without searching the graph again
+    assert bfs.calculate('c', 'f') == 2
+    assert bfs.calculate('e', 'f') == float('inf')
+    assert graph.predecessor_calls == calls
+
+    assert bfs.calculate('a', 'd') == 2
+    assert graph.predecessor_calls > calls
@@ -0,0 +1,91 @@
+import random
+
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.BOA import BOA
+from Algorithms.NAMOA import NAMOA
+from Heuristics.IdealPoint import IdealPoint
+from Tests.heuristics import random_graph
+
+
+def test_boa():
+    data = pd.read_csv('namoa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    boa = BOA(graph, heuristic=IdealPoint(graph, 'y'))
+    boa.run(start_vertex='s', end_vertices='y')
+
+    path1 = pd.DataFrame(data=[
+        {'source': 'n4', 'target': 'y', 'weight_1': 1, 'weight_2': 5},
+        {'source': 'n2', 'target': 'n4', 'weight_1': 1, 'weight_2': 4},
+        {'source': 's', 'target': 'n2', 'weight_1': 2, 'weight_2': 1}
+    ])
+
+    path2 = pd.DataFrame(data=[
+        {'source': 'n5', 'target': 'y', 'weight_1': 1, 'weight_2': 1},
+        {'source': 'n2', 'target': 'n5', 'weight_1': 6, 'weight_2': 1},
+        {'source': 's', 'target': 'n2', 'weight_1': 2, 'weight_2': 1}
+    ])
+
+    solutions = boa.solution
+    assert solutions.get_solution('y')[0].data.equals(path1)
+    assert solutions.get_solution('y')[1].data.equals(path2)
+
+    assert solutions.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+    assert solutions.get_min_solution_cost('s') == [4, 10]
+
+
+def test_boa_moa_graph():
+    data = pd.read_csv('moa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    end_vertices = ['y1', 'y2', 'y3']
+    boa = BOA(graph, heuristic=IdealPoint(graph, end_vertices))
+    boa.run(start_vertex='s', end_vertices=end_vertices)
+
+    namoa = NAMOA(graph, heuristic=IdealPoint(graph, end_vertices))
+    namoa.run(start_vertex='s', end_vertices=end_vertices)
+
+    for end_vertex in end_vertices:
+        if namoa.solution.get_solution(end_vertex) is None:
+            assert boa.solution.get_solution(end_vertex) is None
+        else:
+            assert boa.solution.get_solution_cost('s', end_vertex) == namoa.solution.get_solution_cost('s', end_vertex)
+    assert boa.solution.get_min_solution_cost('s') == namoa.solution.get_min_solution_cost('s')
+
+
+def test_boa_random_graphs():
+    rnd = random.Random(0)
+    for _ in range(30):
+        graph = random_graph(rnd, 30, ['weight_1', 'weight_2'], max_weight=5, min_vertices=5, self_loops=False)
+        start_vertex, end_vertex = graph.data['source'].iloc[0], graph.data['target'].iloc[-1]
+        if start_vertex == end_vertex:
+            continue
+
+        boa = BOA(graph, heuristic=IdealPoint(graph, end_vertex))
+        boa.run(start_vertex=start_vertex, end_vertices=end_vertex)
+        namoa = NAMOA(graph, heuristic=IdealPoint(graph, end_vertex))
+        namoa.run(start_vertex=start_vertex, end_vertices=end_vertex)
+
+        if namoa.solution.is_empty():
+            assert boa.solution.is_empty()
+        else:
+            assert sorted(boa.solution.get_solution_cost(start_vertex, end_vertex)) == \
+                   sorted(namoa.solution.get_solution_cost(start_vertex, end_vertex))
+
+
+def test_boa_missing_source():
+    data = pd.read_csv('moa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    boa = BOA(graph, heuristic=IdealPoint(graph, 'y1'))
+    boa.run(start_vertex='fg', end_vertices='y1')
+
+    assert boa.solution.get_solution('y1') is None
+
+
+def test_boa_missing_equal():
+    data = pd.read_csv('moa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    boa = BOA(graph, heuristic=IdealPoint(graph, 's'))
+    boa.run(start_vertex='s', end_vertices='s')
+
+    assert boa.solution.get_solution('s') is None
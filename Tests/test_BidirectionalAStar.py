@@ -0,0 +1,95 @@
+import random
+
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.Dijkstra import Dijkstra
+from Algorithms.BidirectionalAStar import BidirectionalAStar
+from Tests.heuristics import random_graph
+
+
+def test_astar():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    a_star = BidirectionalAStar(graph)
+    a_star.run(start_vertex='a', end_vertex='f', show_end=True)
+
+    expected = [
+        {'source': 'd', 'target': 'f', 'weight_1': 1},
+        {'source': 'c', 'target': 'd', 'weight_1': 6},
+        {'source': 'a', 'target': 'c', 'weight_1': 3}
+    ]
+
+    assert a_star.solution.get_solution('f')[0].data.equals(pd.DataFrame(expected))
+    assert a_star.solution.get_solution('f')[0].get_path_cost(start='a', end='f') == [10]
+
+
+def test_astar_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    a_star = BidirectionalAStar(graph)
+    a_star.run(start_vertex='Frankfurt', end_vertex='München')
+
+    expected = [
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ]
+
+    assert a_star.solution.get_solution('München')[0].data.equals(pd.DataFrame(expected))
+    assert a_star.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+
+
+def test_astar_random_graphs():
+    rnd = random.Random(0)
+    for _ in range(50):
+        graph = random_graph(rnd, 30, min_weight=1)
+        start_vertex, end_vertex = graph.data['source'].iloc[0], graph.data['target'].iloc[-1]
+
+        dijkstra = Dijkstra(graph)
+        dijkstra.run(start_vertex=start_vertex, end_vertex=end_vertex)
+        a_star = BidirectionalAStar(graph)
+        a_star.run(start_vertex=start_vertex, end_vertex=end_vertex)
+
+        if dijkstra.solution.is_empty():
+            assert a_star.solution.is_empty()
+        else:
+            assert a_star.solution.get_solution_cost(start_vertex, end_vertex) == \
+                   dijkstra.solution.get_solution_cost(start_vertex, end_vertex)
+
+
+def test_astar_unreachable():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    a_star = BidirectionalAStar(graph)
+    a_star.run(start_vertex='f', end_vertex='a')
+
+    assert a_star.solution.get_solution('a') is None
+    assert a_star.metrics.nodes_explored == 0
+
+
+def test_astar_missing_source():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    a_star = BidirectionalAStar(graph)
+    a_star.run(start_vertex='Random', end_vertex='f', show_end=True)
+
+    assert a_star.solution.get_solution('f') is None
+
+
+def test_astar_missing_target():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    a_star = BidirectionalAStar(graph)
+    a_star.run(start_vertex='a', end_vertex='Random', show_end=True)
+
+    assert a_star.solution.get_solution('Random') is None
+
+
+def test_astar_equal():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    a_star = BidirectionalAStar(graph)
+    a_star.run(start_vertex='a', end_vertex='a', show_end=True)
+
+    assert a_star.solution.get_solution('a') is None
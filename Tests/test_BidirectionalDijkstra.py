@@ -0,0 +1,104 @@
+import random
+
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.Dijkstra import Dijkstra
+from Algorithms.BidirectionalDijkstra import BidirectionalDijkstra
+from Tests.heuristics import random_graph
+
+
+def test_data_bidirectional_finish():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    dijkstra = BidirectionalDijkstra(graph)
+    dijkstra.run(start_vertex='a', end_vertex='c', show_end=True)
+
+    expected = pd.DataFrame(data=[
+        {'source': 'f', 'target': 'c', 'weight_1': 3},
+        {'source': 'd', 'target': 'f', 'weight_1': 2},
+        {'source': 'b', 'target': 'd', 'weight_1': 5},
+        {'source': 'a', 'target': 'b', 'weight_1': 2}
+    ])
+
+    assert dijkstra.solution.get_solution('c')[0].data.equals(expected)
+    assert dijkstra.solution.get_solution('c')[0].get_path_cost(start='a', end='c') == [12]
+
+
+def test_data_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    dijkstra = BidirectionalDijkstra(graph)
+    dijkstra.run(start_vertex='Frankfurt', end_vertex='München')
+
+    expected = pd.DataFrame(data=[
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ])
+
+    assert dijkstra.solution.get_solution('München')[0].data.equals(expected)
+    assert dijkstra.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+    assert dijkstra.metrics.nodes_explored < 9
+
+
+def test_weight_index():
+    graph = PandasGraph(data=pd.read_csv('namoa-data.csv'), weight_cols=['weight_1', 'weight_2'])
+    dijkstra = BidirectionalDijkstra(graph, weight_index=1)
+    dijkstra.run(start_vertex='s', end_vertex='y')
+
+    assert dijkstra.solution.get_solution_cost('s', 'y') == [[9, 3]]
+
+
+def test_random_graphs():
+    rnd = random.Random(0)
+    for _ in range(50):
+        graph = random_graph(rnd, 30)
+        start_vertex, end_vertex = graph.data['source'].iloc[0], graph.data['target'].iloc[-1]
+
+        dijkstra = Dijkstra(graph)
+        dijkstra.run(start_vertex=start_vertex, end_vertex=end_vertex)
+        bidirectional_dijkstra = BidirectionalDijkstra(graph)
+        bidirectional_dijkstra.run(start_vertex=start_vertex, end_vertex=end_vertex)
+
+        if dijkstra.solution.is_empty():
+            assert bidirectional_dijkstra.solution.is_empty()
+        else:
+            assert bidirectional_dijkstra.solution.get_solution_cost(start_vertex, end_vertex) == \
+                   dijkstra.solution.get_solution_cost(start_vertex, end_vertex)
+
+
+def test_unreachable():
+    data = pd.read_csv('namoa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    dijkstra = BidirectionalDijkstra(graph)
+    dijkstra.run(start_vertex='y', end_vertex='s')
+
+    assert dijkstra.solution.get_solution('s') is None
+
+
+def test_data_missing_source():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    dijkstra = BidirectionalDijkstra(graph)
+    dijkstra.run(start_vertex='Random', end_vertex='c')
+
+    assert dijkstra.solution.get_solution('c') is None
+
+
+def test_data_missing_target():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    dijkstra = BidirectionalDijkstra(graph)
+    dijkstra.run(start_vertex='a', end_vertex='Random', show_end=True)
+
+    assert dijkstra.solution.get_solution('Random') is None
+
+
+def test_data_equal():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    dijkstra = BidirectionalDijkstra(graph)
+    dijkstra.run(start_vertex='a', end_vertex='a', show_end=True)
+
+    assert dijkstra.solution.get_solution('a') is None
@@ -0,0 +1,102 @@
+import random
+
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.Dijkstra import Dijkstra
+from Algorithms.ContractionHierarchies import ContractionHierarchy, CHDijkstra
+from Tests.heuristics import random_graph
+
+
+def test_ch_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    ch_dijkstra = CHDijkstra(graph)
+    ch_dijkstra.run(start_vertex='Frankfurt', end_vertex='München')
+
+    expected = pd.DataFrame(data=[
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ])
+
+    assert ch_dijkstra.solution.get_solution('München')[0].data.equals(expected)
+    assert ch_dijkstra.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+
+
+def test_ch_weight_index():
+    graph = PandasGraph(data=pd.read_csv('namoa-data.csv'), weight_cols=['weight_1', 'weight_2'])
+    ch_dijkstra = CHDijkstra(graph, weight_index=1)
+    ch_dijkstra.run(start_vertex='s', end_vertex='y')
+
+    assert ch_dijkstra.solution.get_solution_cost('s', 'y') == [[9, 3]]
+
+
+def test_ch_random_graphs():
+    rnd = random.Random(0)
+    for _ in range(30):
+        graph = random_graph(rnd, 30)
+        hierarchy = ContractionHierarchy(graph, witness_limit=rnd.choice([1, 50]))
+
+        for start_vertex, end_vertex in zip(graph.data['source'], graph.data['target'].iloc[::-1]):
+            dijkstra = Dijkstra(graph)
+            dijkstra.run(start_vertex=start_vertex, end_vertex=end_vertex)
+            ch_dijkstra = CHDijkstra(graph, hierarchy=hierarchy)
+            ch_dijkstra.run(start_vertex=start_vertex, end_vertex=end_vertex)
+
+            if dijkstra.solution.is_empty():
+                assert ch_dijkstra.solution.is_empty()
+            else:
+                assert ch_dijkstra.solution.get_solution_cost(start_vertex, end_vertex) == \
+                       dijkstra.solution.get_solution_cost(start_vertex, end_vertex)
+
+
+def test_ch_unreachable():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    ch_dijkstra = CHDijkstra(graph)
+    ch_dijkstra.run(start_vertex='f', end_vertex='a')
+
+    assert ch_dijkstra.solution.get_solution('a') is None
+
+
+def test_ch_missing_source():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    ch_dijkstra = CHDijkstra(graph)
+    ch_dijkstra.run(start_vertex='Random', end_vertex='c')
+
+    assert ch_dijkstra.solution.get_solution('c') is None
+
+
+def test_ch_missing_target():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    ch_dijkstra = CHDijkstra(graph)
+    ch_dijkstra.run(start_vertex='a', end_vertex='Random', show_end=True)
+
+    assert ch_dijkstra.solution.get_solution('Random') is None
+
+
+def test_ch_equal():
+    data = pd.read_csv('dijkstra-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    ch_dijkstra = CHDijkstra(graph)
+    ch_dijkstra.run(start_vertex='a', end_vertex='a', show_end=True)
+
+    assert ch_dijkstra.solution.get_solution('a') is None
+
+
+def test_ch_zero_weight_cycle():
+    data = pd.DataFrame(data=[
+        {'source': 2, 'target': 0, 'weight_1': 0},
+        {'source': 0, 'target': 1, 'weight_1': 0},
+        {'source': 1, 'target': 0, 'weight_1': 0}
+    ])
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    ch_dijkstra = CHDijkstra(graph)
+    ch_dijkstra.run(start_vertex=2, end_vertex=0)
+
+    path = ch_dijkstra.solution.get_solution(0)[0].data
+    assert len(set(path['target'])) == len(path)
+    assert path.equals(pd.DataFrame(data=[{'source': 2, 'target': 0, 'weight_1': 0}]))
@@ -2,7 +2,7 @@ import pandas as pd
 
 from Graphs.PandasGraph import PandasGraph
 from Visualizers.DashVisualizer import DashVisualizer
-from Algorithms.Dijkstra import Dijkstra
+from Algorithms.Dijkstra import Dijkstra, distance_table
 
 
 def test_data_bidirectional():
@@ -49,6 +49,34 @@ def test_data_bidirectional_finish():
     assert dijkstra.solution.get_solution('c')[0].get_path_cost(start='a', end='c') == [12]
 
 
+def test_data_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    dijkstra = Dijkstra(graph)
+    dijkstra.run(start_vertex='Frankfurt', end_vertex='München')
+
+    expected = pd.DataFrame(data=[
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ])
+
+    assert dijkstra.solution.get_solution('München')[0].data.equals(expected)
+    assert dijkstra.solution.get_solution_cost('Frankfurt', 'München') == [[487]]
+    assert dijkstra.metrics.nodes_explored == 9
+
+
+def test_weight_index():
+    graph = PandasGraph(data=pd.read_csv('namoa-data.csv'), weight_cols=['weight_1', 'weight_2'])
+    dijkstra = Dijkstra(graph, weight_index=1)
+    dijkstra.run(start_vertex='s')
+
+    tree = dijkstra.solution.get_solution('*')[0]
+    assert tree.weight_cols == ['weight_1', 'weight_2']
+    assert tree.get_path_cost(start='s', end='y') == [9, 3]
+    assert graph.weight_cols == ['weight_1', 'weight_2']
+
+
 def test_namoa_inverse():
     graph = PandasGraph(data=pd.read_csv('namoa-data.csv'), weight_cols=['weight_1', 'weight_2'])
     visualizer = DashVisualizer()
@@ -79,6 +107,28 @@ def test_namoa_inverse():
     visualizer.show(graph=t_graph)
 
 
+def test_distance_table_other_index():
+    graph = PandasGraph(data=pd.read_csv('namoa-data.csv'), weight_cols=['weight_1', 'weight_2'])
+    vertex_ids = {vertex: index for index, vertex in enumerate(graph.get_all_vertices())}
+
+    c_cost, t_cost = distance_table(graph, ['y'], vertex_ids, weight_index=0, reverse=True, other_index=1)
+    assert (c_cost[vertex_ids['s']], t_cost[vertex_ids['s']]) == (4, 10)
+    t_cost, c_cost = distance_table(graph, ['y'], vertex_ids, weight_index=1, reverse=True, other_index=0)
+    assert (t_cost[vertex_ids['s']], c_cost[vertex_ids['s']]) == (3, 9)
+
+    # Both paths from a to d have distance 2, and the tie is broken by the second weight
+    data = pd.DataFrame(data=[
+        {'source': 'a', 'target': 'b', 'weight_1': 1, 'weight_2': 5},
+        {'source': 'a', 'target': 'c', 'weight_1': 1, 'weight_2': 1},
+        {'source': 'b', 'target': 'd', 'weight_1': 1, 'weight_2': 0},
+        {'source': 'c', 'target': 'd', 'weight_1': 1, 'weight_2': 0}
+    ])
+    graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+    vertex_ids = {vertex: index for index, vertex in enumerate(graph.get_all_vertices())}
+    distances, other_costs = distance_table(graph, ['a'], vertex_ids, other_index=1)
+    assert (distances[vertex_ids['d']], other_costs[vertex_ids['d']]) == (2, 1)
+
+
 def test_data_missing_source():
     data = pd.read_csv('dijkstra-data.csv')
     graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
@@ -0,0 +1,61 @@
+import random
+
+from Algorithms import Dominance
+
+
+def _brute_force_non_dominated(costs):
+    return [cost for cost in costs if not any(Dominance.dominates(other, cost) for other in costs)]
+
+
+def test_is_dominated():
+    assert Dominance.is_dominated([3, 3], [2, 3]) is True
+    assert Dominance.is_dominated([3, 3], [3, 3]) is False
+    assert Dominance.is_dominated([3, 3], [[4, 1], [1, 4]]) is False
+    assert Dominance.is_dominated([[3, 3], [4, 2]], [[4, 1], [2, 2]]) is True
+    assert Dominance.is_dominated((3, 3), [(4, 1), (2, 2)]) is True
+    assert Dominance.is_dominated([3, 3], float('inf')) is False
+    assert Dominance.is_dominated(float('inf'), [3, 3]) is True
+    assert Dominance.is_dominated(float('inf'), float('inf')) is False
+    assert Dominance.is_dominated([3, 3], []) is False
+    assert Dominance.is_dominated([], [3, 3]) is True
+
+
+def test_is_dominated_large():
+    rnd = random.Random(0)
+    for n_objectives in [2, 3]:
+        for _ in range(50):
+            costs1 = [[rnd.randint(0, 9) for _ in range(n_objectives)] for _ in range(rnd.randint(1, 20))]
+            costs2 = [[rnd.randint(0, 9) for _ in range(n_objectives)] for _ in range(rnd.randint(1, 20))]
+            expected = any(all(Dominance.dominates(cost2, cost1) for cost1 in costs1) for cost2 in costs2)
+            assert Dominance.is_dominated(costs1, costs2) is expected
+
+
+def test_is_weakly_dominated():
+    assert Dominance.is_weakly_dominated((3, 3), [(3, 3)]) is True
+    assert Dominance.is_weakly_dominated((3, 3), [(4, 1), (2, 3)]) is True
+    assert Dominance.is_weakly_dominated((3, 3), [(4, 1), (1, 4)]) is False
+    assert Dominance.is_weakly_dominated((3, 3), []) is False
+
+    rnd = random.Random(0)
+    for _ in range(20):
+        costs = tuple(rnd.randint(0, 9) for _ in range(3))
+        front = [tuple(rnd.randint(0, 9) for _ in range(3)) for _ in range(rnd.randint(1, 100))]
+        expected = any(cost == costs or Dominance.dominates(cost, costs) for cost in front)
+        assert Dominance.is_weakly_dominated(costs, front) is expected
+
+
+def test_non_dominated():
+    costs = [[3, 3], [1, 5], [2, 4], [3, 3], [4, 4], [5, 1], [1, 6]]
+    assert Dominance.non_dominated(costs) == [[3, 3], [1, 5], [2, 4], [3, 3], [5, 1]]
+    assert Dominance.non_dominated([]) == []
+
+    labels = [('a', 3, 3, None), ('a', 2, 4, None), ('a', 4, 4, None)]
+    assert Dominance.non_dominated(labels, key=lambda label: (label[1], label[2])) == labels[:2]
+
+
+def test_non_dominated_large():
+    rnd = random.Random(0)
+    for n_objectives in [2, 3, 4]:
+        for _ in range(20):
+            costs = [[rnd.randint(0, 20) for _ in range(n_objectives)] for _ in range(rnd.randint(17, 200))]
+            assert Dominance.non_dominated(costs) == _brute_force_non_dominated(costs)
@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 from Graphs.PandasGraph import PandasGraph
 
 
@@ -32,6 +33,19 @@ def test_successors():
     assert graph.get_successors('n2') == ['n4','n5','t']
 
 
+def test_neighbour_weights():
+    data = pd.read_csv('graph-data.csv')
+    graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+    graph.add_edge(source='t', target='n6', weights=[3, 4])
+    for vertex in graph.get_all_vertices():
+        assert graph.get_successor_weights(vertex) == [(successor, graph.get_weight(vertex, successor))
+                                                       for successor in graph.get_successors(vertex)]
+        assert graph.get_predecessor_weights(vertex) == [(predecessor, graph.get_weight(predecessor, vertex))
+                                                         for predecessor in graph.get_predecessors(vertex)]
+    assert graph.get_predecessor_weights('n6')[-1] == ('t', [3, 4])
+    assert graph.get_successor_weights('Random') == list()
+
+
 def test_add_vertex():
     graph = PandasGraph(pd.DataFrame(), weight_cols=['weight_1','weight_2'])
     graph.add_edge(source='s', target='t', weights=[1,2])
@@ -112,4 +126,75 @@ def test_inverse_graph2():
     graph = PandasGraph(data=data, weight_cols=['weight_1','weight_2'])
     inverse = graph.get_inverse_graph()
 
-    assert inverse.data.empty
\ No newline at end of file
+    assert inverse.data.empty
+
+def test_add_remove_edge_index_sync():
+    data = pd.read_csv('graph-data.csv')
+    graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+    assert graph.get_successors('n2') == ['n4', 'n5', 't']
+
+    graph.add_edge(source='n2', target='n1', weights=[1, 1])
+    graph.remove_edge(source='n2', target='n5')
+    assert graph.get_successors('n2') == ['n4', 't', 'n1']
+    assert graph.get_predecessors('n1') == ['s', 'n2']
+    assert graph.get_weight('n2', 'n1') == [1, 1]
+    assert graph.get_weight('n2', 'n5') == list()
+    assert len(graph.data) == len(data)
+
+
+def test_weight_cols_reassigned():
+    data = pd.read_csv('graph-data.csv')
+    graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+    assert graph.get_weight('s', 'n1') == [6, 1]
+    graph.weight_cols = ['weight_2']
+    assert graph.get_weight('s', 'n1') == [1]
+
+
+def test_add_edges():
+    graph = PandasGraph(pd.DataFrame(), weight_cols=['weight_1', 'weight_2'], bidirectional=True)
+    graph.add_edges([('s', 't', [1, 2]), ('t', 'u', [3, 4])])
+    expected = pd.DataFrame(data=[
+        {'source': 's', 'target': 't', 'weight_1': 1, 'weight_2': 2},
+        {'source': 't', 'target': 's', 'weight_1': 1, 'weight_2': 2},
+        {'source': 't', 'target': 'u', 'weight_1': 3, 'weight_2': 4},
+        {'source': 'u', 'target': 't', 'weight_1': 3, 'weight_2': 4}
+    ])
+    assert graph.data.equals(expected)
+
+
+def test_add_edges_wrong_weights():
+    graph = PandasGraph(pd.DataFrame(), weight_cols=['weight_1', 'weight_2'])
+    with pytest.raises(ValueError):
+        graph.add_edges([('s', 't', [1, 2]), ('t', 'u', [3])])
+    assert graph.data.empty
+
+
+def test_add_edge_buffered():
+    data = pd.read_csv('graph-data.csv')
+    graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+    for index in range(100):
+        graph.add_edge(source=f'v{index}', target=f'v{index + 1}', weights=[1, 2])
+        assert graph.get_predecessors(f'v{index + 1}') == [f'v{index}']
+
+    assert len(graph.data) == len(data) + 100
+    assert graph.get_path_cost(start='v0', end='v100') == [100, 200]
+    assert list(graph.data.index) == list(range(len(data) + 100))
+
+
+def test_copy_on_write():
+    data = pd.read_csv('graph-data.csv')
+    graph = PandasGraph(data, weight_cols=['weight_1', 'weight_2'])
+    copy = graph.copy()
+    assert copy.data is graph.data
+
+    copy.remove_edge(source='s', target='n1')
+    copy.add_edge(source='t', target='s', weights=[1, 1])
+    assert copy.data is not graph.data
+    assert graph.data.equals(data)
+    assert graph.get_successors('s') == ['n1', 'n2', 'n4']
+    assert graph.get_successors('t') == list()
+    assert copy.get_successors('s') == ['n2', 'n4']
+    assert copy.get_successors('t') == ['s']
+
+    graph.remove_edge(source='s', target='n2')
+    assert copy.get_successors('s') == ['n2', 'n4']
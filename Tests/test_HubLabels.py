@@ -0,0 +1,55 @@
+import random
+
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.ContractionHierarchies import ContractionHierarchy
+from Algorithms.Dijkstra import distance_table
+from Algorithms.HubLabels import HubLabels
+from Tests.heuristics import random_graph
+
+
+def test_hub_labels_weighted_cities():
+    data = pd.read_csv('bfs-data.csv')
+    graph = PandasGraph(data, bidirectional=True, weight_cols=['weight_1'])
+    hub_labels = HubLabels(graph)
+
+    assert hub_labels.distance('Frankfurt', 'München') == 487
+    assert hub_labels.distance('München', 'Frankfurt') == 487
+    assert hub_labels.distance('Frankfurt', 'Frankfurt') == 0
+
+    expected = pd.DataFrame(data=[
+        {'source': 'Nürnberg', 'target': 'München', 'weight_1': 167},
+        {'source': 'Würzburg', 'target': 'Nürnberg', 'weight_1': 103},
+        {'source': 'Frankfurt', 'target': 'Würzburg', 'weight_1': 217}
+    ])
+    assert hub_labels.get_path('Frankfurt', 'München').data.equals(expected)
+
+
+def test_hub_labels_random_graphs():
+    rnd = random.Random(0)
+    for _ in range(15):
+        graph = random_graph(rnd, 20)
+        hub_labels = HubLabels(graph, hierarchy=ContractionHierarchy(graph, witness_limit=rnd.choice([1, 50])))
+
+        vertex_ids = {vertex: index for index, vertex in enumerate(graph.get_all_vertices())}
+        for start_vertex in vertex_ids:
+            distances = distance_table(graph, [start_vertex], vertex_ids)
+            for end_vertex, end_id in vertex_ids.items():
+                assert hub_labels.distance(start_vertex, end_vertex) == distances[end_id]
+
+                path = hub_labels.get_path(start_vertex, end_vertex)
+                if path is not None:
+                    assert path.get_path_cost(start_vertex, end_vertex) == [distances[end_id]]
+
+
+def test_hub_labels_unreachable():
+    data = pd.read_csv('astar-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1'])
+    hub_labels = HubLabels(graph)
+
+    assert hub_labels.distance('a', 'f') == 10
+    assert hub_labels.distance('f', 'a') == float('inf')
+    assert hub_labels.get_path('f', 'a') is None
+    assert hub_labels.distance('a', 'Random') == float('inf')
+    assert hub_labels.get_path('Random', 'a') is None
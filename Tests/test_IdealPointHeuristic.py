@@ -0,0 +1,37 @@
+import pandas as pd
+
+from Heuristics.IdealPoint import IdealPoint
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.NAMOA import NAMOA
+
+
+def test_ideal_point_heuristic():
+    data = pd.read_csv('namoa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    ideal_point = IdealPoint(graph, 'y')
+    assert ideal_point.calculate('s') == [4, 3]
+    assert ideal_point.calculate('n1') == [4, 7]
+    assert ideal_point.calculate('n2') == [2, 2]
+    assert ideal_point.calculate('n4') == [1, 5]
+    assert ideal_point.calculate('y') == [0, 0]
+    assert ideal_point.calculate('n6') == [float('inf'), float('inf')]
+    assert ideal_point.calculate('Random') == [float('inf'), float('inf')]
+
+
+def test_ideal_point_heuristic_multiple_goals():
+    data = pd.read_csv('moa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    ideal_point = IdealPoint(graph, ['y1', 'y2', 'y3'])
+    assert ideal_point.calculate('5') == [2, 3]
+    assert ideal_point.calculate('8') == [3, 2]
+    assert ideal_point.calculate('s') == [4, 5]
+
+
+def test_ideal_point_heuristic_namoa():
+    data = pd.read_csv('namoa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    namoa = NAMOA(graph, heuristic=IdealPoint(graph, 'y'))
+    namoa.run(start_vertex='s', end_vertices='y')
+
+    assert namoa.solution.get_solution_cost('s', 'y') == [[4, 10], [9, 3]]
+    assert namoa.solution.get_min_solution_cost('s') == [4, 10]
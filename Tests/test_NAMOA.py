@@ -1,10 +1,13 @@
+import random
+
 import pandas as pd
 
 from Graphs.PandasGraph import PandasGraph
 from Algorithms.NAMOA import NAMOA
 
 from Visualizers.DashVisualizer import DashVisualizer
-from Tests.heuristics import MockedHeuristicMOA, MockedHeuristicNAMOA
+from Tests.heuristics import MockedHeuristicMOA, MockedHeuristicNAMOA, random_graph
+from Heuristics.IdealPoint import IdealPoint
 
 
 def test_namoa():
@@ -120,3 +123,51 @@ def test_namoa_dash_by_step():
     graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1','weight_2'])
     namoa = NAMOA(graph, heuristic=MockedHeuristicNAMOA(graph), visualizer=DashVisualizer())
     namoa.run(start_vertex='s', end_vertices='y', show_by_step=True, show_end=True)
+
+
+def test_namoa_equal_costs_and_cycles():
+    data = pd.DataFrame(data=[
+        {'source': 's', 'target': 'a', 'weight_1': 1, 'weight_2': 2},
+        {'source': 's', 'target': 'b', 'weight_1': 2, 'weight_2': 1},
+        {'source': 'a', 'target': 'b', 'weight_1': 0, 'weight_2': 0},
+        {'source': 'b', 'target': 'a', 'weight_1': 0, 'weight_2': 0},
+        {'source': 'a', 'target': 'y', 'weight_1': 1, 'weight_2': 1},
+        {'source': 'b', 'target': 'y', 'weight_1': 1, 'weight_2': 1},
+        {'source': 'y', 'target': 's', 'weight_1': 1, 'weight_2': 1}
+    ])
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    namoa = NAMOA(graph, heuristic=IdealPoint(graph, 'y'))
+    namoa.run(start_vertex='s', end_vertices='y')
+
+    assert namoa.solution.get_solution_cost('s', 'y') == [[2, 3], [3, 2]]
+
+
+def test_namoa_dimensionality_reduction():
+    data = pd.read_csv('namoa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1','weight_2'])
+    namoa = NAMOA(graph, heuristic=IdealPoint(graph, 'y'), dimensionality_reduction=True)
+    namoa.run(start_vertex='s', end_vertices='y')
+
+    assert namoa.solution.get_solution_cost('s', 'y') == [[4,10], [9,3]]
+    assert namoa.solution.get_min_solution_cost('s') == [4,10]
+
+
+def test_namoa_dimensionality_reduction_four_objectives():
+    rnd = random.Random(0)
+    weight_cols = ['weight_1', 'weight_2', 'weight_3', 'weight_4']
+    for _ in range(30):
+        graph = random_graph(rnd, 20, weight_cols, max_weight=5, min_vertices=5, self_loops=False)
+        start_vertex, end_vertex = graph.data['source'].iloc[0], graph.data['target'].iloc[-1]
+        if start_vertex == end_vertex:
+            continue
+
+        namoa = NAMOA(graph, heuristic=IdealPoint(graph, end_vertex))
+        namoa.run(start_vertex=start_vertex, end_vertices=end_vertex)
+        namoa_dr = NAMOA(graph, heuristic=IdealPoint(graph, end_vertex), dimensionality_reduction=True)
+        namoa_dr.run(start_vertex=start_vertex, end_vertices=end_vertex)
+
+        if namoa.solution.is_empty():
+            assert namoa_dr.solution.is_empty()
+        else:
+            assert sorted(namoa_dr.solution.get_solution_cost(start_vertex, end_vertex)) == \
+                   sorted(namoa.solution.get_solution_cost(start_vertex, end_vertex))
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from Graphs.PandasGraph import PandasGraph
+from Algorithms.PULSE import PULSE
+from Algorithms.ParallelPULSE import ParallelPULSE
+
+
+def sorted_paths(solutions, vertex):
+    return sorted(solution.data.to_csv(index=False) for solution in solutions.get_solution(vertex))
+
+
+def test_parallel_pulse():
+    data = pd.read_csv('namoa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    pulse = ParallelPULSE(graph, n_workers=2)
+    pulse.run(start_vertex='s', end_vertex='y')
+
+    assert sorted(pulse.solution.get_solution_cost('s', 'y')) == [[4, 10], [9, 3]]
+
+
+def test_parallel_pulse_moa_graph():
+    data = pd.read_csv('moa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    for end_vertex in ['y1', 'y2', 'y3']:
+        pulse = PULSE(graph)
+        pulse.run(start_vertex='s', end_vertex=end_vertex)
+        for n_workers in [1, 3]:
+            parallel_pulse = ParallelPULSE(graph, n_workers=n_workers, exchange_interval=2)
+            parallel_pulse.run(start_vertex='s', end_vertex=end_vertex)
+
+            assert sorted_paths(parallel_pulse.solution, end_vertex) == sorted_paths(pulse.solution, end_vertex)
+            assert sorted(parallel_pulse.solution.get_solution_cost('s', end_vertex)) == \
+                   sorted(pulse.solution.get_solution_cost('s', end_vertex))
+
+
+def test_parallel_pulse_unreachable():
+    data = pd.read_csv('moa-data.csv')
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    pulse = ParallelPULSE(graph, n_workers=2)
+    pulse.run(start_vertex='y1', end_vertex='s')
+
+    assert pulse.solution.get_solution('s') is None
@@ -1,3 +1,5 @@
+import sys
+
 import pandas as pd
 
 from Graphs.PandasGraph import PandasGraph
@@ -32,6 +34,7 @@ def test_pulse():
 
     assert solutions.get_solution_cost('s', 'y') == [[4,10], [9,3]]
     assert solutions.get_min_solution_cost('s') == [4, 10]
+    assert pulse.nadir_point == (9, 10)
 
 
 def test_pulse_moa_graph_y1():
@@ -95,6 +98,27 @@ def test_pulse_moa_graph_y3():
     assert solutions.get_min_solution_cost('s') == [5,11]
 
 
+def test_pulse_long_path():
+    # A path deeper than the recursion limit
+    n_vertices = 300
+    data = pd.DataFrame(data=[{'source': f'v{i}', 'target': f'v{i+1}', 'weight_1': 1, 'weight_2': 2}
+                              for i in range(n_vertices)] +
+                             [{'source': 'v0', 'target': f'v{n_vertices}', 'weight_1': 10*n_vertices, 'weight_2': 1}])
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    pulse = PULSE(graph)
+
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        pulse.run(start_vertex='v0', end_vertex=f'v{n_vertices}')
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+    solutions = pulse.solution
+    assert solutions.get_solution_cost('v0', f'v{n_vertices}') == [[n_vertices, 2*n_vertices], [10*n_vertices, 1]]
+    assert len(solutions.get_solution(f'v{n_vertices}')[0].data) == n_vertices
+
+
 def test_namoa_missing_source():
     data = pd.read_csv('moa-data.csv')
     graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1','weight_2'])
@@ -122,6 +146,20 @@ def test_namoa_missing_equal():
     assert pulse.solution.get_solution('s') is None
 
 
+def test_pulse_unreachable():
+    data = pd.DataFrame(data=[
+        {'source': 's', 'target': 'a', 'weight_1': 1, 'weight_2': 2},
+        {'source': 'a', 'target': 'b', 'weight_1': 2, 'weight_2': 1},
+        {'source': 'y', 'target': 'b', 'weight_1': 1, 'weight_2': 1}
+    ])
+    graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])
+    pulse = PULSE(graph)
+    pulse.run(start_vertex='s', end_vertex='y')
+
+    assert pulse.solution.get_solution('y') is None
+    assert [bool(pulse.unreachable[pulse.vertex_ids[vertex]]) for vertex in ['s', 'a', 'b', 'y']] == [True, True, True, False]
+
+
 def test_pulse_dash():
     data = pd.read_csv('namoa-data.csv')
     graph = PandasGraph(data, bidirectional=False, weight_cols=['weight_1', 'weight_2'])